@@ -1,6 +1,11 @@
 """ lib Module """
 from .orm_collection import OrmCollection, Query, Filter
+from .bloom_filter import BloomFilter
 from .exception import BaseError, BaseNotFound, BaseMultipleFound
 from .improved_list import ImprovedList
+from .numeric_list import NumericList
 from .obj_dict import ObjDict
+from .frozen_obj_dict import FrozenObjDict
+from .record import Record, record_class
+from .sharded_collection import ShardedOrmCollection
 from .ioc import ObjectFactory
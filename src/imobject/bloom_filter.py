@@ -0,0 +1,147 @@
+"""
+This module contains the `BloomFilter` class, a compact probabilistic set used for
+membership tests on very large collections of values.
+
+A `BloomFilter` never reports a false negative: if a value was added, `value in bloom`
+is always True. It may however report a false positive with a probability close to the
+`error_rate` given at construction. It only stores a bit array, so its memory usage does not
+depend on the size of the values it contains.
+
+Example usage:
+
+    >>> blocklist = BloomFilter(["spam@example.com", "scam@example.com"])
+    >>> "spam@example.com" in blocklist
+    True
+    >>> collection.where(email__nin=blocklist)  # doctest: +SKIP
+
+"""
+import hashlib
+import math
+import numbers
+import pickle
+from typing import Any, Iterable, Optional
+
+
+def _stable_bytes(value: Any) -> bytes:
+    """
+    Return an encoding of a hashable value which is the same in every process.
+
+    The built-in `hash` of strings and bytes depends on the seed of each process, unlike the
+    hash of numbers, which also keeps 1, 1.0 and True equal. Other values are pickled.
+
+    Raises:
+        TypeError: If the value is not hashable.
+    """
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8", "surrogatepass")
+    if isinstance(value, bytes):
+        return b"b" + value
+    if isinstance(value, numbers.Number):
+        return b"n" + str(hash(value)).encode()
+    if isinstance(value, tuple):
+        return b"t" + b"".join(
+            len(item).to_bytes(8, "little") + item for item in map(_stable_bytes, value)
+        )
+    if isinstance(value, frozenset):
+        return b"f" + b"".join(
+            len(item).to_bytes(8, "little") + item
+            for item in sorted(map(_stable_bytes, value))
+        )
+    hash(value)
+    return b"p" + pickle.dumps(value, protocol=4)
+
+
+class BloomFilter:
+    """
+    A probabilistic set supporting `add` and `in`.
+
+    The number of bits and hash functions is computed from the expected number of values
+    (`capacity`) and the wanted false positive probability (`error_rate`). The hash positions
+    are derived from a blake2b digest of a stable encoding of the value, so a filter keeps
+    its meaning when it is sent to another process, whatever its hash seed.
+
+    Attributes:
+        capacity (int): The expected number of values.
+        error_rate (float): The wanted false positive probability.
+        size (int): The number of bits of the filter.
+        hash_count (int): The number of bit positions set for each value.
+
+    Example usage:
+        >>> bloom = BloomFilter(range(1000), error_rate=0.001)
+        >>> 10 in bloom
+        True
+        >>> len(bloom)
+        1000
+    """
+
+    __slots__ = ("capacity", "error_rate", "size", "hash_count", "_bits", "_count")
+
+    def __init__(
+        self,
+        values: Iterable[Any] = (),
+        capacity: Optional[int] = None,
+        error_rate: float = 0.01,
+    ):
+        """
+        Initialize the filter and add the given values.
+
+        Args:
+            values (iterable): The values to add to the filter.
+            capacity (int, optional): The expected number of values. Defaults to the number
+                of given values.
+            error_rate (float): The wanted false positive probability, between 0 and 1.
+
+        Raises:
+            ValueError: If error_rate is not between 0 and 1.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if capacity is None:
+            values = list(values)
+            capacity = len(values)
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(
+            int(math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)), 8
+        )
+        self.hash_count = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+        for value in values:
+            self.add(value)
+
+    def _positions(self, value: Any):
+        """Return the bit positions of a value (enhanced double hashing)."""
+        size = self.size
+        digest = hashlib.blake2b(_stable_bytes(value), digest_size=16).digest()
+        position = int.from_bytes(digest[:8], "little") % size
+        step = int.from_bytes(digest[8:], "little") % size
+        for index in range(self.hash_count):
+            yield position
+            position = (position + step) % size
+            step = (step + index) % size
+
+    def add(self, value: Any) -> None:
+        """Add a value to the filter."""
+        bits = self._bits
+        for position in self._positions(value):
+            bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, value: Any) -> bool:
+        """Return True if the value was probably added, False if it was surely not."""
+        bits = self._bits
+        for position in self._positions(value):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of values added to the filter."""
+        return self._count
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(count={self._count}, size={self.size}, "
+            f"hash_count={self.hash_count}, error_rate={self.error_rate})"
+        )
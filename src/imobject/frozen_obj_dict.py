@@ -0,0 +1,436 @@
+"""
+This module contains the `FrozenObjDict` class, an immutable `ObjDict` with structural sharing.
+
+A `FrozenObjDict` is stored in a hash array mapped trie (HAMT): `set` and `delete` return a new
+version in O(log n), which shares with the previous one every subtree they did not change. A
+snapshot of a configuration is therefore nearly free, and the old versions stay valid. Nested
+dicts are frozen too, and lists become tuples, so a `FrozenObjDict` is hashable (its hash is
+computed once) and can be used as a dict key. The keys keep their insertion order, as in a
+dict: setting an existing key keeps its position, and a deleted key set again goes last.
+
+Example usage:
+
+    >>> config = FrozenObjDict({"db": {"host": "localhost", "port": 5432}, "debug": False})
+    >>> config.db.host
+    'localhost'
+    >>> updated = config.set_in(("db", "port"), 5433)
+    >>> updated.db.port, config.db.port
+    (5433, 5432)
+    >>> versions = {config: "v1", updated: "v2"}
+
+"""
+from collections.abc import Mapping
+from itertools import chain, count
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+# The hashes are reduced to 64 bits: after 13 levels of 5 bits, the keys of a node share
+# the same hash, and are stored in a collision node.
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 64
+# The position of a new key: keys are ordered by the value they got when they were inserted.
+_INSERTION_ORDER = count()
+
+
+def _popcount(number: int) -> int:
+    """Return the number of bits set in number."""
+    return bin(number).count("1")
+
+
+class _BitmapNode:
+    """
+    A trie node. Its entries are leaves `(hash, key, value, position)` or child nodes, stored
+    in the order of the 5 hash bits which select them; bitmap has one bit set per entry.
+    """
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _CollisionNode:
+    """A node holding the leaves `(hash, key, value, position)` of keys having the same hash."""
+
+    __slots__ = ("key_hash", "entries")
+
+    def __init__(self, key_hash: int, entries: tuple):
+        self.key_hash = key_hash
+        self.entries = entries
+
+
+_EMPTY = _BitmapNode(0, ())
+_MISSING = object()
+
+
+def _find(node, key_hash: int, key: Any) -> Optional[tuple]:
+    """Return the leaf of key, or None."""
+    shift = 0
+    while True:
+        if isinstance(node, _CollisionNode):
+            for leaf in node.entries:
+                if leaf[1] is key or leaf[1] == key:
+                    return leaf
+            return None
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return None
+        entry = node.entries[_popcount(node.bitmap & (bit - 1))]
+        if isinstance(entry, tuple):
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return entry
+            return None
+        node = entry
+        shift += _BITS
+
+
+def _merge(leaf1: tuple, leaf2: tuple, shift: int):
+    """Return the node holding two leaves of different keys."""
+    if shift >= _MAX_SHIFT:
+        return _CollisionNode(leaf1[0], (leaf1, leaf2))
+    index1 = (leaf1[0] >> shift) & _MASK
+    index2 = (leaf2[0] >> shift) & _MASK
+    if index1 == index2:
+        return _BitmapNode(1 << index1, (_merge(leaf1, leaf2, shift + _BITS),))
+    if index1 > index2:
+        leaf1, leaf2 = leaf2, leaf1
+    return _BitmapNode((1 << index1) | (1 << index2), (leaf1, leaf2))
+
+
+def _assoc(node, leaf: tuple, shift: int) -> Tuple[Any, bool]:
+    """
+    Return the node with leaf added or replaced, sharing the unchanged entries, and whether a
+    key was added. The same node is returned if the key already had this value. A replaced
+    leaf keeps the position of the key.
+    """
+    key_hash, key, value, _ = leaf
+    if isinstance(node, _CollisionNode):
+        for index, entry in enumerate(node.entries):
+            if entry[1] is key or entry[1] == key:
+                if entry[2] is value:
+                    return node, False
+                leaf = (key_hash, key, value, entry[3])
+                entries = node.entries[:index] + (leaf,) + node.entries[index + 1 :]
+                return _CollisionNode(node.key_hash, entries), False
+        return _CollisionNode(node.key_hash, node.entries + (leaf,)), True
+
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    index = _popcount(node.bitmap & (bit - 1))
+    entries = node.entries
+    if not node.bitmap & bit:
+        return (
+            _BitmapNode(node.bitmap | bit, entries[:index] + (leaf,) + entries[index:]),
+            True,
+        )
+    entry = entries[index]
+    if isinstance(entry, tuple):
+        if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+            if entry[2] is value:
+                return node, False
+            new_entry, added = (key_hash, key, value, entry[3]), False
+        else:
+            new_entry, added = _merge(entry, leaf, shift + _BITS), True
+    else:
+        new_entry, added = _assoc(entry, leaf, shift + _BITS)
+        if new_entry is entry:
+            return node, False
+    return (
+        _BitmapNode(node.bitmap, entries[:index] + (new_entry,) + entries[index + 1 :]),
+        added,
+    )
+
+
+def _single_leaf(node) -> Optional[tuple]:
+    """Return the leaf of a node holding a single leaf, which its parent can hold instead."""
+    if len(node.entries) == 1 and isinstance(node.entries[0], tuple):
+        return node.entries[0]
+    return None
+
+
+def _dissoc(node, key_hash: int, key: Any, shift: int):
+    """
+    Return the node without key, sharing the unchanged entries, or None if it becomes empty.
+
+    Raises:
+        KeyError: If the key is not found.
+    """
+    if isinstance(node, _CollisionNode):
+        for index, entry in enumerate(node.entries):
+            if entry[1] is key or entry[1] == key:
+                entries = node.entries[:index] + node.entries[index + 1 :]
+                return _CollisionNode(node.key_hash, entries) if entries else None
+        raise KeyError(key)
+
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    if not node.bitmap & bit:
+        raise KeyError(key)
+    index = _popcount(node.bitmap & (bit - 1))
+    entries = node.entries
+    entry = entries[index]
+    if isinstance(entry, tuple):
+        if not (entry[0] == key_hash and (entry[1] is key or entry[1] == key)):
+            raise KeyError(key)
+        new_entry = None
+    else:
+        new_entry = _dissoc(entry, key_hash, key, shift + _BITS)
+        if new_entry is not None:
+            new_entry = _single_leaf(new_entry) or new_entry
+    if new_entry is None:
+        if len(entries) == 1:
+            return None
+        return _BitmapNode(node.bitmap & ~bit, entries[:index] + entries[index + 1 :])
+    return _BitmapNode(
+        node.bitmap, entries[:index] + (new_entry,) + entries[index + 1 :]
+    )
+
+
+def _leaves(node) -> Iterator[tuple]:
+    """Yield the leaves of a node, depth first."""
+    stack = [iter(node.entries)]
+    while stack:
+        for entry in stack[-1]:
+            if isinstance(entry, tuple):
+                yield entry
+            else:
+                stack.append(iter(entry.entries))
+                break
+        else:
+            stack.pop()
+
+
+def _ordered_leaves(node) -> list:
+    """Return the leaves of a node in the insertion order of their keys."""
+    return sorted(_leaves(node), key=itemgetter(3))
+
+
+def _key_hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _leaf(key: Any, value: Any) -> tuple:
+    """Return the leaf of a key set to value (frozen), placed after the keys already set."""
+    return (_key_hash(key), key, freeze(value), next(_INSERTION_ORDER))
+
+
+def _insert_all(root, length: int, data: Any, kwargs: dict) -> Tuple[Any, int]:
+    """Set the (frozen) items of a mapping or iterable of pairs, then of kwargs, in a trie."""
+    pairs = data.items() if isinstance(data, Mapping) else data
+    for key, value in chain(pairs, kwargs.items()):
+        root, added = _assoc(root, _leaf(key, value), 0)
+        length += added
+    return root, length
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return the immutable equivalent of a value: dicts become FrozenObjDict, lists and tuples
+    become tuples of frozen values, sets become frozensets. Other values are returned as is.
+    """
+    if isinstance(value, FrozenObjDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenObjDict(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return the plain equivalent of a frozen value (FrozenObjDict to dict, tuple to list)."""
+    if isinstance(value, FrozenObjDict):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class FrozenObjDict(Mapping):
+    """
+    An immutable, hashable ObjDict sharing structure between its versions.
+
+    The values can be read as attributes or by key, like with an ObjDict. The changes are made
+    with `set`, `delete`, `update` and `set_in`, which return a new FrozenObjDict.
+
+    Attributes:
+        None
+
+    Methods:
+        set: Return a new version with a key set.
+        delete: Return a new version without a key.
+        update: Return a new version with several keys set.
+        set_in: Return a new version with a nested key set.
+        to_dict: Return a plain dict.
+        thaw: Return a mutable ObjDict.
+    """
+
+    __slots__ = ("_root", "_len", "_hash")
+
+    def __init__(self, data: Any = (), **kwargs):
+        """
+        Build a FrozenObjDict from a mapping or an iterable of (key, value) pairs, and keyword
+        arguments. Nested dicts, lists and sets are frozen.
+        """
+        root, length = _insert_all(_EMPTY, 0, data, kwargs)
+        self._init(root, length)
+
+    def _init(self, root, length: int) -> None:
+        object.__setattr__(self, "_root", root)
+        object.__setattr__(self, "_len", length)
+        object.__setattr__(self, "_hash", None)
+
+    @classmethod
+    def _from_root(cls, root, length: int) -> "FrozenObjDict":
+        frozen = cls.__new__(cls)
+        frozen._init(root, length)  # pylint: disable=protected-access
+        return frozen
+
+    def __getitem__(self, key: Any) -> Any:
+        leaf = _find(self._root, _key_hash(key), key)
+        if leaf is None:
+            raise KeyError(key)
+        return leaf[2]
+
+    def __contains__(self, key: Any) -> bool:
+        return _find(self._root, _key_hash(key), key) is not None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value of key, or default if the key is not found"""
+        leaf = _find(self._root, _key_hash(key), key)
+        return default if leaf is None else leaf[2]
+
+    def __iter__(self) -> Iterator:
+        return (leaf[1] for leaf in _ordered_leaves(self._root))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def items(self) -> Iterable[Tuple[Any, Any]]:
+        """Return the (key, value) pairs, in insertion order"""
+        return [(leaf[1], leaf[2]) for leaf in _ordered_leaves(self._root)]
+
+    def values(self) -> Iterable[Any]:
+        """Return the values, in insertion order"""
+        return [leaf[2] for leaf in _ordered_leaves(self._root)]
+
+    def __getattr__(self, name: str) -> Any:
+        if name in FrozenObjDict.__slots__:
+            # Instance pas encore initialisée
+            raise AttributeError(name)
+        leaf = _find(self._root, _key_hash(name), name)
+        if leaf is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        return leaf[2]
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object is immutable, use set() to change '{name}'"
+        )
+
+    def __delattr__(self, name: str):
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object is immutable, use delete() to remove '{name}'"
+        )
+
+    def set(self, key: Any, value: Any) -> "FrozenObjDict":
+        """Return a new version with key set to value (frozen)"""
+        root, added = _assoc(self._root, _leaf(key, value), 0)
+        if root is self._root:
+            return self
+        return self._from_root(root, self._len + added)
+
+    def delete(self, key: Any) -> "FrozenObjDict":
+        """
+        Return a new version without key
+
+        Raises:
+            KeyError: If the key is not found.
+        """
+        root = _dissoc(self._root, _key_hash(key), key, 0)
+        return self._from_root(_EMPTY if root is None else root, self._len - 1)
+
+    def update(self, data: Any = (), **kwargs) -> "FrozenObjDict":
+        """Return a new version with the keys of data and kwargs set"""
+        root, length = _insert_all(self._root, self._len, data, kwargs)
+        if root is self._root:
+            return self
+        return self._from_root(root, length)
+
+    def set_in(self, path: Iterable, value: Any) -> "FrozenObjDict":
+        """
+        Return a new version with the nested key path set to value. The missing intermediate
+        keys are created, and only the FrozenObjDict on the path are copied.
+
+        Example usage:
+            >>> FrozenObjDict().set_in(("db", "port"), 5432).db.port
+            5432
+        """
+        path = tuple(path)
+        if not path:
+            raise ValueError("path must contain at least one key")
+        key = path[0]
+        if len(path) > 1:
+            child = self.get(key)
+            if not isinstance(child, FrozenObjDict):
+                child = FrozenObjDict()
+            value = child.set_in(path[1:], value)
+        return self.set(key, value)
+
+    def to_dict(self) -> dict:
+        """Return a plain dict, with nested FrozenObjDict as dicts and tuples as lists"""
+        return {leaf[1]: _thaw(leaf[2]) for leaf in _ordered_leaves(self._root)}
+
+    def thaw(self):
+        """Return a mutable ObjDict with the same data"""
+        # obj_dict importe ce module
+        from imobject.obj_dict import ObjDict  # pylint: disable=import-outside-toplevel
+
+        return ObjDict(self.to_dict())
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            items = ((leaf[1], leaf[2]) for leaf in _leaves(self._root))
+            object.__setattr__(self, "_hash", hash(frozenset(items)))
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compare with another mapping. The values of a mapping which is not a FrozenObjDict are
+        frozen before they are compared, so that lists are equal to the tuples they became.
+        """
+        if self is other:
+            return True
+        if isinstance(other, FrozenObjDict):
+            if self._root is other._root:
+                return True
+            if self._len != other._len or (
+                self._hash is not None
+                and other._hash is not None
+                and self._hash != other._hash
+            ):
+                return False
+            return all(
+                other.get(leaf[1], _MISSING) == leaf[2] for leaf in _leaves(self._root)
+            )
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for leaf in _leaves(self._root):
+            value = other.get(leaf[1], _MISSING)
+            if value is _MISSING or freeze(value) != leaf[2]:
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key!r}: {value!r}" for key, value in self.items())
+        return f"{self.__class__.__name__}({{{items}}})"
+
+    def __reduce__(self):
+        return (self.__class__, (self.items(),))
@@ -10,8 +10,429 @@ that can store `ObjDict` objects. The `ImprovedList` class adds several useful m
 For more information on the `ImprovedList` class and its methods, see the class documentation below.
 """
 
+import asyncio
+import inspect
+import os
 import pprint
-from typing import List, Any, Union, Callable
+import reprlib
+import sys
+import types
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from functools import partial
+from itertools import chain, islice
+from operator import attrgetter, methodcaller, eq as operator_eq
+from typing import (
+    List,
+    Any,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Dict,
+    Tuple,
+)
+
+from imobject.memoize import Memoized
+
+
+def _call_function(function: Callable, args: tuple, kwargs: dict, obj: Any) -> Any:
+    """Call function on obj with the additional arguments."""
+    return function(obj, *args, **kwargs)
+
+
+_UNBOUND_METHOD_TYPES = (
+    types.FunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+)
+
+
+def _class_attribute(cls: type, name: str) -> Any:
+    """
+    Return the attribute name as found on the class of an object, or None.
+
+    None is also returned when the class customizes `__getattribute__`, as the attribute found on
+    the class may then not be the one returned for its instances.
+    """
+    found = None
+    for klass in cls.__mro__:
+        namespace = vars(klass)
+        getattribute = namespace.get("__getattribute__")
+        if klass is not object and getattribute is not None:
+            if not isinstance(getattribute, types.WrapperDescriptorType):
+                return None
+        if found is None and name in namespace:
+            found = namespace[name]
+    return found
+
+
+def _resolve_method(cls: type, name: str) -> Tuple[Optional[Callable], bool]:
+    """
+    Return the unbound method name of cls, and whether an instance attribute may shadow it.
+
+    The method is None when it cannot be called unbound (missing, static, class method, ...).
+    """
+    if issubclass(cls, type):
+        # The attributes of a class are looked up in its own MRO before its metaclass.
+        return None, False
+    method = _class_attribute(cls, name)
+    if not isinstance(method, _UNBOUND_METHOD_TYPES):
+        return None, False
+    return method, cls.__dictoffset__ != 0
+
+
+def _resolve_attribute(cls: type, name: str) -> Callable:
+    """Return a getter of the attribute name for the instances of cls."""
+    attribute = _class_attribute(cls, name)
+    if isinstance(attribute, property) and attribute.fget is not None:
+        # A property takes precedence over the instance attributes.
+        return attribute.fget
+    return attrgetter(name)
+
+
+class _MethodCaller:
+    """
+    Call the method name of an object with the additional arguments.
+
+    The method is resolved once per type of object, and the resolutions are kept by the
+    instance only: a caller is built for each `map` call, so a method patched on a class is
+    seen by the next call.
+    """
+
+    __slots__ = ("name", "args", "kwargs", "fallback", "resolved")
+
+    def __init__(self, name: str, args: tuple, kwargs: dict):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.fallback = methodcaller(name, *args, **kwargs)
+        self.resolved: Dict[type, Tuple[Optional[Callable], bool]] = {}
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, self.args, self.kwargs))
+
+    def __call__(self, obj: Any) -> Any:
+        cls = type(obj)
+        try:
+            method, shadowable = self.resolved[cls]
+        except KeyError:
+            method, shadowable = self.resolved[cls] = _resolve_method(cls, self.name)
+        if method is None or (shadowable and self.name in obj.__dict__):
+            return self.call_bound(obj)
+        if self.args or self.kwargs:
+            return method(obj, *self.args, **self.kwargs)
+        return method(obj)
+
+    def call_bound(self, obj: Any) -> Any:
+        """Call the method through a regular attribute lookup on obj."""
+        try:
+            return self.fallback(obj)
+        except TypeError as exc:
+            if not callable(getattr(obj, self.name)):
+                raise TypeError(f"{self.name} is not callable") from exc
+            raise
+
+    def map(self, elements: Iterable) -> Iterable:
+        """
+        Yield the result of the call for each element.
+
+        The method is resolved again only when the type of the element changes, so a homogeneous
+        list costs a single lookup.
+        """
+        name = self.name
+        last_cls = None
+        method = shadowable = None
+        for obj in elements:
+            cls = type(obj)
+            if cls is not last_cls:
+                last_cls = cls
+                method, shadowable = _resolve_method(cls, name)
+                if method is not None and (self.args or self.kwargs):
+                    method = partial(_call_function, method, self.args, self.kwargs)
+            if method is None or (shadowable and name in obj.__dict__):
+                yield self.call_bound(obj)
+            else:
+                yield method(obj)
+
+
+class _AttributeGetter:
+    """
+    Return the attribute name of an object.
+
+    As for `_MethodCaller`, the getter is resolved once per type of object, for the lifetime
+    of the instance only.
+    """
+
+    __slots__ = ("name", "resolved")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.resolved: Dict[type, Callable] = {}
+
+    def __reduce__(self):
+        return (self.__class__, (self.name,))
+
+    def __call__(self, obj: Any) -> Any:
+        cls = type(obj)
+        try:
+            getter = self.resolved[cls]
+        except KeyError:
+            getter = self.resolved[cls] = _resolve_attribute(cls, self.name)
+        try:
+            return getter(obj)
+        except AttributeError as exc:
+            raise self.error(obj) from exc
+
+    def error(self, obj: Any) -> AttributeError:
+        """Return the error raised when obj has no attribute name."""
+        return AttributeError(
+            f"{obj.__class__.__name__} object has no attribute '{self.name}'"
+        )
+
+    def map(self, elements: Iterable) -> Iterable:
+        """
+        Yield the attribute of each element.
+
+        The getter is resolved again only when the type of the element changes.
+        """
+        name = self.name
+        last_cls = getter = None
+        for obj in elements:
+            cls = type(obj)
+            if cls is not last_cls:
+                last_cls = cls
+                getter = _resolve_attribute(cls, name)
+            try:
+                value = getter(obj)
+            except AttributeError as exc:
+                raise self.error(obj) from exc
+            yield value
+
+
+def _map_chunk(function: Callable, chunk: list) -> list:
+    """Apply function to each element of a chunk (run by the executor workers)."""
+    return [function(obj) for obj in chunk]
+
+
+def _parallel_map(
+    function: Callable,
+    elements: Iterable,
+    executor: str,
+    workers: Optional[int],
+    chunksize: Optional[int],
+    ordered: bool,
+) -> list:
+    """
+    Apply function to each element with a pool of threads or processes.
+
+    Args:
+        function (callable): The function to apply. It must be picklable for processes.
+        elements (iterable): The elements to process.
+        executor (str): 'thread' or 'process'.
+        workers (int, optional): The number of workers. Defaults to the executor default.
+        chunksize (int, optional): The number of elements sent to a worker at once.
+            Defaults to a quarter of the elements per worker for processes, and 1 for threads.
+        ordered (bool): If False, the results are returned as soon as their chunk is done.
+
+    Returns:
+        list: The results.
+    """
+    elements = list(elements)
+    if chunksize is None:
+        if executor == "process":
+            chunksize = -(-len(elements) // ((workers or os.cpu_count() or 1) * 4))
+        chunksize = max(chunksize or 1, 1)
+    pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        if ordered:
+            return list(pool.map(function, elements, chunksize=chunksize))
+        iterator = iter(elements)
+        futures = [
+            pool.submit(_map_chunk, function, chunk)
+            for chunk in iter(lambda: list(islice(iterator, chunksize)), [])
+        ]
+        results = []
+        for future in as_completed(futures):
+            results.extend(future.result())
+        return results
+
+
+class _BoundedRepr(reprlib.Repr):
+    """A `reprlib.Repr` which also bounds the representation of dict and list subclasses."""
+
+    def __init__(self, max_width: int):
+        super().__init__()
+        self.max_width = max(max_width, 4)
+        self.maxstring = self.maxother = self.max_width
+
+    def repr_instance(self, x: Any, level: int) -> str:
+        if isinstance(x, dict):
+            return self.repr_dict(x, level)
+        if isinstance(x, list):
+            return self.repr_list(x, level)
+        return super().repr_instance(x, level)
+
+    def line(self, value: Any) -> str:
+        """Return the representation of value on one line of at most max_width characters."""
+        text = self.repr(value).replace("\n", "\\n")
+        if len(text) > self.max_width:
+            text = text[: self.max_width - 3] + "..."
+        return text
+
+
+def _format_size(size: int) -> str:
+    """Return a size in bytes in a human readable form."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            break
+        size /= 1024
+    return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+
+class _SliceView(Sequence):
+    """
+    A read-only view of the elements start to stop of a list, which copies nothing.
+
+    The view reads the list when it is accessed, so it must not be used after the list has been
+    modified.
+    """
+
+    __slots__ = ("_data", "_range")
+
+    def __init__(self, data: list, start: int, stop: int):
+        self._data = data
+        self._range = range(start, stop)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = self._range[index]
+            if indices.step == 1:
+                return _SliceView(self._data, indices.start, indices.stop)
+            return list(map(self._data.__getitem__, indices))
+        return self._data[self._range[index]]
+
+    def __iter__(self) -> Iterator:
+        return map(self._data.__getitem__, self._range)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(map(operator_eq, self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+_OBJ_DICT_CLASS = None
+
+
+def _obj_dict_class() -> type:
+    """Return the `ObjDict` class, imported once (obj_dict imports this module)."""
+    global _OBJ_DICT_CLASS  # pylint: disable=global-statement
+    if _OBJ_DICT_CLASS is None:
+        from imobject.obj_dict import ObjDict  # pylint: disable=import-outside-toplevel
+
+        _OBJ_DICT_CLASS = ObjDict
+    return _OBJ_DICT_CLASS
+
+
+def _convert_item(item: Any) -> Any:
+    """Convert a plain dictionary to `ObjDict`, and return any other item unchanged."""
+    obj_dict = _obj_dict_class()
+    if isinstance(item, dict) and not isinstance(item, obj_dict):
+        return obj_dict(item)
+    return item
+
+
+def _convert_from(items: list, start: int = 0) -> None:
+    """Convert in place the plain dictionaries of items[start:] to `ObjDict`."""
+    obj_dict = _obj_dict_class()
+    # list.__iter__ and list.__setitem__ bypass the conversion done by ImprovedList itself.
+    for index, item in enumerate(islice(list.__iter__(items), start, None), start):
+        if isinstance(item, dict) and not isinstance(item, obj_dict):
+            list.__setitem__(items, index, obj_dict(item))
+
+
+def _materialize(items: "ImprovedList") -> None:
+    """Convert the elements of a list created with lazy=True and restore its class."""
+    cls = type(items)
+    if issubclass(cls, _PendingConversion):
+        items.__class__ = cls.converted_class
+        _convert_from(items)
+
+
+def _materializing(name: str) -> Callable:
+    """Return a special method converting the elements before calling the list one."""
+
+    def method(self, *args):
+        _materialize(self)
+        return getattr(self, name)(*args)
+
+    method.__name__ = name
+    return method
+
+
+class _PendingConversion:
+    """
+    Mixin of the lists created with lazy=True, whose elements are not converted yet.
+
+    Any attribute access or special method converts the elements and gives the list back its
+    class, so the converted lists do not pay for the check. Only `len` and `bool` do not
+    convert. The methods which read the elements with the `list` methods themselves (such as
+    `batched_map`) call `_materialize` first, and so must any new one.
+    """
+
+    __slots__ = ()
+    converted_class: type = list
+
+    def __getattribute__(self, name: str) -> Any:
+        _materialize(self)
+        return object.__getattribute__(self, name)
+
+
+# Special methods are looked up on the type, not through __getattribute__.
+_PENDING_METHODS = {
+    name: _materializing(name)
+    for name in (
+        "__iter__",
+        "__reversed__",
+        "__getitem__",
+        "__contains__",
+        "__eq__",
+        "__ne__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "__repr__",
+        "__add__",
+        "__mul__",
+        "__rmul__",
+        "__reduce_ex__",
+    )
+}
+_PENDING_CLASSES: Dict[type, type] = {}
+
+
+def _pending_class(cls: type) -> type:
+    """Return the class of the lists of class cls whose elements are not converted yet."""
+    pending = _PENDING_CLASSES.get(cls)
+    if pending is None:
+        pending = type(
+            cls.__name__,
+            (_PendingConversion, cls),
+            dict(_PENDING_METHODS, converted_class=cls, __qualname__=cls.__qualname__),
+        )
+        _PENDING_CLASSES[cls] = pending
+    return pending
 
 
 class ImprovedList(list):
@@ -39,29 +460,61 @@ class ImprovedList(list):
         lst.map(str)    # Returns a new list with each element converted to a string.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, iterable: Iterable = (), *, lazy: bool = False):
         """
         Constructor for ImprovedList.
 
+        The plain dictionaries of iterable are converted to `ObjDict`, in one pass over the
+        elements.
+
         Parameters:
-        - *args: positional arguments to initialize list
-        - **kwargs: keyword arguments to initialize list
+        - iterable: the elements of the list
+        - lazy (bool): if True, the conversion is deferred until the elements are first
+          accessed, so building a list which is never read costs a single copy
         """
-        super().__init__(*args, **kwargs)
+        super().__init__(iterable)
+        if lazy:
+            self.__class__ = _pending_class(self.__class__)
+        else:
+            _convert_from(self)
+
+    @classmethod
+    def _from_converted(cls, data: Iterable) -> "ImprovedList":
+        """Create a list from elements which are already converted, skipping the conversion."""
+        result = cls()
+        list.extend(result, data)
+        return result
 
     def __add__(self, other):
         """
         Overrides the + operator to concatenate two ImprovedList objects.
 
+        The elements are copied once. To merge many lists, use `concat` or `+=`, which do not
+        copy the accumulated elements again at each step.
+
         Parameters:
         - other (ImprovedList): The other ImprovedList object to concatenate.
 
         Returns:
         - (ImprovedList): The concatenated ImprovedList object.
         """
-        new_list = self.copy()
+        new_list = self._from_converted(self)
         new_list.extend(other)
-        return self.__class__(new_list)
+        return new_list
+
+    @classmethod
+    def concat(cls, *lists: Iterable) -> "ImprovedList":
+        """
+        Concatenate any number of lists into a new list, copying each element once.
+
+        Example usage:
+            >>> ImprovedList.concat([1, 2], ImprovedList([3]), (4, 5))
+            [1, 2, 3, 4, 5]
+        """
+        result = cls()
+        for items in lists:
+            result.extend(items)
+        return result
 
     @property
     def inspect(self) -> None:
@@ -80,23 +533,110 @@ class ImprovedList(list):
         else:
             element_type = self[0].__class__.__name__
             print(f"{self.__class__.__name__}({element_type}) data:")
+            pertty_peint = pprint.PrettyPrinter(indent=3)
             for value in self:
-                method_inspect = getattr(value, "inspect", None)
-                if callable(method_inspect):
+                method_inspect = getattr(type(value), "inspect", None)
+                if isinstance(method_inspect, property):
+                    # ObjDict.inspect est une propriété qui affiche l'objet
+                    value.inspect  # pylint: disable=pointless-statement
+                elif callable(method_inspect):
                     value.inspect()
                 else:
-                    pertty_peint = pprint.PrettyPrinter(indent=3)
                     pertty_peint.pprint(value)
 
+    def inspect_stream(
+        self,
+        stream=None,
+        head: int = 10,
+        tail: int = 10,
+        max_width: int = 120,
+        sample_size: int = 1000,
+    ) -> None:
+        """Display a bounded view of the list, safe to use on very large lists.
+
+        Only the first head and last tail elements are displayed, each one on a single line
+        truncated to max_width characters, followed by a summary line: the number of elements,
+        the number of elements of each type, and the approximate memory used. The memory is
+        estimated from the shallow size of up to sample_size elements spread over the list.
+
+        Args:
+            stream (file-like, optional): Where to write. Defaults to sys.stdout.
+            head (int): The number of leading elements to display. Defaults to 10.
+            tail (int): The number of trailing elements to display. Defaults to 10.
+            max_width (int): The maximum length of an element line. Defaults to 120.
+            sample_size (int): The number of elements measured to estimate the memory used.
+
+        Example usage:
+            >>> ImprovedList(range(100)).inspect_stream(head=2, tail=1)
+            ImprovedList(int) data:
+            [0] 0
+            [1] 1
+            ... 97 elements not shown ...
+            [99] 99
+            100 elements | int: 100 | ~3.6 KiB
+        """
+        stream = sys.stdout if stream is None else stream
+        count = len(self)
+        if not count:
+            print([], file=stream)
+            return
+        short_repr = _BoundedRepr(max_width)
+        element_type = self[0].__class__.__name__
+        print(f"{self.__class__.__name__}({element_type}) data:", file=stream)
+        head = min(max(head, 0), count)
+        tail_start = max(count - max(tail, 0), head)
+        for index in range(head):
+            print(f"[{index}] {short_repr.line(self[index])}", file=stream)
+        if tail_start > head:
+            print(f"... {tail_start - head} elements not shown ...", file=stream)
+        for index in range(tail_start, count):
+            print(f"[{index}] {short_repr.line(self[index])}", file=stream)
+
+        types_count = Counter(map(type, self))
+        histogram = ", ".join(
+            f"{cls.__name__}: {number}" for cls, number in types_count.most_common()
+        )
+        step = max(count // max(sample_size, 1), 1)
+        sample = self[::step]
+        memory = sys.getsizeof(self) + sum(map(sys.getsizeof, sample)) * count // len(
+            sample
+        )
+        print(f"{count} elements | {histogram} | ~{_format_size(memory)}", file=stream)
+
     def append(self, item):
         """Append an item to the ImprovedList."""
         # Convertir les dictionnaires en ObjDict avant de les ajouter
-        from imobject.obj_dict import ObjDict  # pylint: disable=import-outside-toplevel
+        if isinstance(item, dict):
+            item = _convert_item(item)
+        super().append(item)
 
-        if isinstance(item, dict) and not isinstance(item, ObjDict):
-            item = ObjDict(item)
+    def extend(self, iterable: Iterable) -> None:
+        """Extend the ImprovedList with the elements of iterable, converting the dictionaries."""
+        if isinstance(iterable, ImprovedList):
+            # Les éléments d'une ImprovedList sont déjà convertis.
+            super().extend(iterable)
+            return
+        start = len(self)
+        super().extend(iterable)
+        _convert_from(self, start)
 
-        super().append(item)
+    def insert(self, index: int, item: Any) -> None:
+        """Insert an item before index, converting it if it is a dictionary."""
+        super().insert(index, _convert_item(item))
+
+    def __setitem__(self, index, value):
+        """Set an item or a slice, converting the dictionaries."""
+        if isinstance(index, slice):
+            value = list(value)
+            _convert_from(value)
+        else:
+            value = _convert_item(value)
+        super().__setitem__(index, value)
+
+    def __iadd__(self, other: Iterable) -> "ImprovedList":
+        """Extend the ImprovedList in place with +=, converting the dictionaries."""
+        self.extend(other)
+        return self
 
     def first(self, count: int = 1) -> Union[None, Any, "ImprovedList"]:
         """Return the first count elements of the ImprovedList.
@@ -112,7 +652,7 @@ class ImprovedList(list):
         data = self[:count]
         data_size = len(data)
         if data_size > 1:
-            return self.__class__(data)
+            return self._from_converted(data)
         if data_size == 1:
             return data[0]
         return None
@@ -131,34 +671,49 @@ class ImprovedList(list):
         data = self[-count:]
         data_size = len(data)
         if data_size > 1:
-            return self.__class__(data)
+            return self._from_converted(data)
         if data_size == 1:
             return data[0]
         return None
 
     def filter(self, filter_func: Callable) -> "ImprovedList":
         """Return a new ImprovedList containing only the elements for which filter_func returns True."""
-        return self.__class__(filter(filter_func, self))
+        return self._from_converted(filter(filter_func, self))
 
     def convert_result(self, return_type, result):
         """
         Convert the result to the specified return type.
 
         Args:
-            return_type (str): The desired return type ('ImprovedList' or 'list').
+            return_type (str): The desired return type: 'ImprovedList', 'list', 'NumericList'
+                (for int or float results), or 'array' (a typed `array.array` using 8 bytes
+                per int or float result).
             result (iterable): The result to be converted.
 
         Returns:
             The result converted to the specified return type.
 
         Raises:
-            ValueError: If return_type is not 'ImprovedList' or 'list'.
+            ValueError: If return_type is not one of the above.
+            TypeError: If return_type is 'NumericList' or 'array' and a result is not a number.
         """
         if return_type == "ImprovedList":
             return self.__class__(result)
         if return_type == "list":
             return list(result)
-        raise ValueError("return_type must be 'ImprovedList' or 'list'")
+        if return_type in ("NumericList", "array"):
+            # numeric_list importe ce module
+            from imobject import (  # pylint: disable=import-outside-toplevel
+                numeric_list,
+            )
+
+            if return_type == "array":
+                return numeric_list.to_array(result)
+            return numeric_list.NumericList(result)
+        raise ValueError(
+            "return_type must be 'ImprovedList' or 'list' "
+            "(or 'NumericList' or 'array' for numeric results)"
+        )
 
     def when_called_method(self, called, filter_func, elements, *args, **kwargs):
         """
@@ -177,18 +732,12 @@ class ImprovedList(list):
         Raises:
             TypeError: If the method is not callable.
         """
-        method_name = called[1:]
-
-        def call_method(obj):
-            method = getattr(obj, method_name)
-            if not callable(method):
-                raise TypeError(f"{method_name} is not callable")
-            return method(*args, **kwargs)
+        call_method = _MethodCaller(called[1:], args, kwargs)
 
         if filter_func is None:
-            result = map(call_method, elements)
+            result = call_method.map(elements)
         else:
-            result = map(call_method, filter(filter_func, elements))
+            result = call_method.map(filter(filter_func, elements))
 
         return result
 
@@ -207,23 +756,41 @@ class ImprovedList(list):
         Raises:
             AttributeError: If the attribute does not exist for an element.
         """
-        attr_name = called[1:]
-
-        def get_attribute(obj):
-            try:
-                return getattr(obj, attr_name)
-            except AttributeError as exc:
-                raise AttributeError(
-                    f"{obj.__class__.__name__} object has no attribute '{attr_name}'"
-                ) from exc
+        get_attribute = _AttributeGetter(called[1:])
 
         if filter_func is None:
-            result = map(get_attribute, elements)
+            result = get_attribute.map(elements)
         else:
-            result = map(get_attribute, filter(filter_func, elements))
+            result = get_attribute.map(filter(filter_func, elements))
 
         return result
 
+    @staticmethod
+    def _map_function(
+        called: Union[str, Callable], args: tuple, kwargs: dict
+    ) -> Callable:
+        """
+        Build the function applied to each element by map and amap.
+
+        Raises:
+            TypeError: If called is neither a callable nor a string starting with ':' or '.'.
+        """
+        # Construire la fonction appliquée à chaque élément.
+        if callable(called):
+            if args or kwargs:
+                return partial(_call_function, called, args, kwargs)
+            return called
+
+        # Appeler la méthode ou accéder à l'attribut pour chaque élément.
+        if isinstance(called, str) and called.startswith(":"):
+            return _MethodCaller(called[1:], args, kwargs)
+        if isinstance(called, str) and called.startswith("."):
+            return _AttributeGetter(called[1:])
+        # Si l'argument appelé n'est ni une chaîne de caractères ni un objet callable, on lève une erreur.
+        raise TypeError(
+            "called must be a string start with ':' for obj method or '.' obj attribute, or a callable"
+        )
+
     def map(
         self,
         called: Union[str, Callable],
@@ -245,8 +812,21 @@ class ImprovedList(list):
             called (str or callable): The method or attribute name or the callable function to apply.
             filter_func (callable): A function that returns True for elements to be processed, False otherwise.
             max_elements (int, optional): The maximum number of elements to process. Defaults to None.
-            reverse_order (bool): If True, the elements are processed in reverse order.
+            reverse_order (bool): If True, the elements are processed in reverse order, or sorted
+                in descending order when sort_func is given.
+            sort_func (callable, optional): A key function used to sort the selected elements.
             return_type (str): The type of object to return. Defaults to "ImprovedList".
+            executor (str, optional): 'thread' or 'process' to apply the function with a pool of
+                threads (I/O-bound work) or processes (CPU-bound work). With processes, the callable
+                and the elements must be picklable. Defaults to None (serial).
+            workers (int, optional): The number of parallel workers. Defaults to the executor default.
+            chunksize (int, optional): The number of elements sent to a worker at once.
+            ordered (bool): If False, parallel results are returned in completion order. Defaults to True.
+            memoize (bool or int): If True, the function is computed once per distinct element and
+                the result reused for the equal elements; an int keeps only that many most recently
+                used results. Only for pure functions. Defaults to False.
+            memo_key (callable, optional): A function giving the cache key of an element, used with
+                memoize. Defaults to the element itself (dicts, lists and sets are frozen).
             *args: Additional arguments to be passed to the called function or method.
             **kwargs: Additional keyword arguments to be passed to the called function or method.
 
@@ -268,45 +848,225 @@ class ImprovedList(list):
             "return_type", "ImprovedList"
         )  # The type of object to return. Defaults to "ImprovedList".
         sort_func: Callable = kwargs.pop("sort_func", None)  # A function used for sort
+        executor: str = kwargs.pop(
+            "executor", None
+        )  # 'thread' or 'process' to apply the function in parallel.
+        workers: int = kwargs.pop("workers", None)  # The number of parallel workers.
+        chunksize: int = kwargs.pop(
+            "chunksize", None
+        )  # The number of elements sent to a worker at once.
+        ordered: bool = kwargs.pop(
+            "ordered", True
+        )  # If False, parallel results are returned in completion order.
+        memoize: Union[bool, int] = kwargs.pop(
+            "memoize", False
+        )  # True or a cache size to compute the function once per distinct element.
+        memo_key: Callable = kwargs.pop(
+            "memo_key", None
+        )  # A function giving the cache key of an element.
 
         if called is None:
             raise ValueError("called cannot be None")
+        if executor not in (None, "thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'")
 
-        # Sélectionner les éléments dans l'ordre inversé si reverse_order est True.
-        elements = self[:max_elements]
-        if reverse_order:
-            elements = reversed(elements)
-
-        # Trier les éléments si sort_func est fourni.
+        # Sélectionner les éléments sans copier la liste : seuls les indices sont découpés.
+        selected = range(len(self))[:max_elements]
         if sort_func is not None:
-            elements.sort(key=sort_func)
+            # Trier les éléments sélectionnés (chaque clé n'est calculée qu'une fois),
+            # par ordre décroissant si reverse_order est True.
+            elements = sorted(
+                islice(self, len(selected)), key=sort_func, reverse=reverse_order
+            )
+        elif reverse_order:
+            elements = map(self.__getitem__, reversed(selected))
+        elif len(selected) == len(self):
+            elements = iter(self)
+        else:
+            elements = islice(self, len(selected))
 
-        # Appliquer la fonction appelée à chaque élément.
-        if callable(called):
-            if filter_func is None:
-                result = map(lambda x: called(x, *args, **kwargs), elements)
-            else:
-                result = map(
-                    lambda x: called(x, *args, **kwargs),
-                    filter(filter_func, elements),
-                )
+        function = self._map_function(called, args, kwargs)
+        function = Memoized.wrap(function, memoize, memo_key)
 
-        # Appeler la méthode ou accéder à l'attribut pour chaque élément.
-        elif isinstance(called, str):
-            if called.startswith(":"):
-                result = self.when_called_method(
-                    called, filter_func, elements, *args, **kwargs
-                )
-            elif called.startswith("."):
-                result = self.when_called_attribut(called, filter_func, elements)
-            else:
-                raise TypeError(
-                    "called must be a string start with ':' for obj method or '.' obj attribute, or a callable"
-                )
-        else:
-            # Si l'argument appelé n'est ni une chaîne de caractères ni un objet callable, on lève une erreur.
-            raise TypeError(
-                "called must be a string start with ':' for obj method or '.' obj attribute, or a callable"
+        if filter_func is not None:
+            elements = filter(filter_func, elements)
+
+        # Appliquer la fonction, en parallèle si un executor est demandé.
+        if executor is not None:
+            result = _parallel_map(
+                function, elements, executor, workers, chunksize, ordered
             )
+        elif isinstance(function, (_MethodCaller, _AttributeGetter)):
+            # Les méthodes et attributs sont résolus une fois par type d'élément.
+            result = function.map(elements)
+        else:
+            result = map(function, elements)
+
         # Convertir le résultat en ImprovedList ou en list en fonction de return_type.
         return self.convert_result(return_type, result)
+
+    async def amap(
+        self,
+        called: Union[str, Callable],
+        *args,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        filter_func: Optional[Callable] = None,
+        return_type: str = "ImprovedList",
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> Union["ImprovedList", List]:
+        """Apply a coroutine function or async method to each element, concurrently.
+
+        called is given as for map: a callable, ':method' or '.attribute'. Each call may return
+        an awaitable, which is awaited; other values are kept as they are. At most concurrency
+        calls run at the same time, and the results keep the order of the elements.
+
+        Example usage:
+            >>> results = await people.amap(":fetch", concurrency=20, timeout=5)
+
+        Args:
+            called (str or callable): The method or attribute name or the callable to apply.
+            concurrency (int, optional): The maximum number of pending calls. Defaults to None
+                (all the calls at once).
+            timeout (float, optional): The maximum time in seconds to wait for each call.
+            filter_func (callable, optional): A function that returns True for elements to be
+                processed, False otherwise.
+            return_type (str): The type of object to return. Defaults to "ImprovedList".
+            return_exceptions (bool): If True, the exceptions raised by the calls (including
+                `asyncio.TimeoutError`) are returned in place of their result instead of being
+                raised. Defaults to False.
+            *args: Additional arguments to be passed to the called function or method.
+            **kwargs: Additional keyword arguments to be passed to the called function or method.
+
+        Returns:
+            An ImprovedList containing the results, in the order of the elements.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+        """
+        if called is None:
+            raise ValueError("called cannot be None")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be greater than or equal to 1")
+        function = self._map_function(called, args, kwargs)
+        elements = list(self if filter_func is None else filter(filter_func, self))
+        results: List[Any] = [None] * len(elements)
+
+        async def call(index: int, obj: Any) -> None:
+            try:
+                result = function(obj)
+                if inspect.isawaitable(result):
+                    result = await asyncio.wait_for(result, timeout)
+            except Exception as exc:  # pylint: disable=broad-except
+                if not return_exceptions:
+                    raise
+                result = exc
+            results[index] = result
+
+        async def worker(iterator: Iterable) -> None:
+            # Les workers se partagent l'itérateur : chaque élément n'est traité qu'une fois.
+            for index, obj in iterator:
+                await call(index, obj)
+
+        if concurrency is None or concurrency >= len(elements):
+            tasks = [
+                asyncio.ensure_future(call(index, obj))
+                for index, obj in enumerate(elements)
+            ]
+        else:
+            iterator = iter(enumerate(elements))
+            tasks = [
+                asyncio.ensure_future(worker(iterator)) for _ in range(concurrency)
+            ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self.convert_result(return_type, results)
+
+    def chunks(self, size: int) -> Iterator[Sequence]:
+        """Return an iterator of consecutive views of size elements, the last one maybe shorter.
+
+        The views copy nothing: they read the list when they are accessed, so the list must not
+        be modified while they are used.
+
+        Example usage:
+            >>> [list(chunk) for chunk in ImprovedList([1, 2, 3, 4, 5]).chunks(2)]
+            [[1, 2], [3, 4], [5]]
+
+        Raises:
+            ValueError: If size is lower than 1.
+        """
+        if size < 1:
+            raise ValueError("size must be greater than or equal to 1")
+        # A generator expression, not a generator function, so that size is checked on call.
+        return (
+            _SliceView(self, start, min(start + size, len(self)))
+            for start in range(0, len(self), size)
+        )
+
+    def windowed(self, size: int, step: int = 1) -> Iterator[Sequence]:
+        """Return an iterator of views of size consecutive elements, one every step elements.
+
+        Only full windows are yielded: nothing is yielded if the list is shorter than size.
+        As with chunks, the views copy nothing.
+
+        Example usage:
+            >>> [list(window) for window in ImprovedList([1, 2, 3, 4]).windowed(2)]
+            [[1, 2], [2, 3], [3, 4]]
+
+        Raises:
+            ValueError: If size or step is lower than 1.
+        """
+        if size < 1 or step < 1:
+            raise ValueError("size and step must be greater than or equal to 1")
+        return (
+            _SliceView(self, start, start + size)
+            for start in range(0, len(self) - size + 1, step)
+        )
+
+    def batched_map(
+        self,
+        function: Callable[[list], Any],
+        batch_size: int,
+        flatten: bool = True,
+        return_type: str = "ImprovedList",
+    ) -> Union["ImprovedList", List]:
+        """Call function once per batch of batch_size elements.
+
+        Each batch is passed as a plain list, so it can be given directly to functions which
+        are cheaper per batch, such as bulk database writes or vectorized computations.
+
+        Example usage:
+            >>> ImprovedList(range(5)).batched_map(lambda batch: [sum(batch)] * len(batch), 2)
+            [1, 1, 5, 5, 4]
+
+        Args:
+            function (callable): The function called with each batch.
+            batch_size (int): The number of elements per batch, the last one possibly shorter.
+            flatten (bool): If True, the results of the batches are concatenated, those which
+                are None being skipped. If False, the result of each batch is an element of the
+                returned list. Defaults to True.
+            return_type (str): The type of object to return. Defaults to "ImprovedList".
+
+        Returns:
+            An ImprovedList containing the results.
+
+        Raises:
+            ValueError: If batch_size is lower than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than or equal to 1")
+        # The batches are read with list.__getitem__, which does not convert the elements.
+        _materialize(self)
+        results = (
+            function(list.__getitem__(self, slice(start, start + batch_size)))
+            for start in range(0, len(self), batch_size)
+        )
+        if flatten:
+            results = chain.from_iterable(
+                result for result in results if result is not None
+            )
+        return self.convert_result(return_type, results)
@@ -0,0 +1,54 @@
+"""
+This module contains the functions which intern the keys and the short string values of the
+objects built in bulk, by `OrmCollection.from_records`, the `ObjDict` JSON loaders and
+`ObjDict.from_dict` when they are called with intern=True.
+
+A JSON decoder or a CSV reader creates a new string for each key and each value of each row,
+even when the same key, or the same value (a status, a country code...), is repeated across
+millions of rows. Once interned, the equal strings are a single object, stored once.
+
+The strings are interned with `sys.intern`: the pool is the table of interned strings of the
+interpreter, shared by all the collections, and a string leaves it when it is no longer used.
+Only the values of at most MAX_VALUE_LENGTH characters are interned, since longer values
+(names, texts, identifiers) are rarely repeated.
+
+Example usage:
+
+    >>> rows = [{"status": "active"}, {"status": "active"}]
+    >>> people = OrmCollection.from_records(rows, intern=True)  # doctest: +SKIP
+    >>> people[0].status is people[1].status  # doctest: +SKIP
+    True
+
+"""
+import sys
+from collections.abc import Mapping
+from typing import Any, Iterable, List, Tuple
+
+MAX_VALUE_LENGTH = 32
+
+
+def intern_value(value: Any) -> Any:
+    """Return the interned string equal to value if it is a short string, else value."""
+    if value.__class__ is str and len(value) <= MAX_VALUE_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def intern_items(items: Iterable[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+    """Return the (key, value) pairs with their string keys and short string values interned."""
+    return [
+        (sys.intern(key) if key.__class__ is str else key, intern_value(value))
+        for key, value in items
+    ]
+
+
+def intern_row(row: Any) -> Any:
+    """
+    Return a row with its keys and short string values interned: a dict for a mapping, a list
+    of values for a sequence.
+    """
+    if isinstance(row, dict):
+        return dict(intern_items(dict.items(row)))
+    if isinstance(row, Mapping):
+        return dict(intern_items(row.items()))
+    return list(map(intern_value, row))
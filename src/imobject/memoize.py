@@ -0,0 +1,122 @@
+"""
+This module contains the `Memoized` wrapper, used by the memoize option of `ImprovedList.map`,
+`OrmCollection.order_by` and `OrmCollection.group_by`, and the `freeze_key` function giving the
+cache key of an element.
+
+Two elements share a cached result only if they are equal and of the same types at every
+level: 1, 1.0 and True, or {'a': 1} and {'a': True}, are different keys.
+
+Example usage:
+
+    >>> normalize = Memoized.wrap(lambda value: value.strip().lower(), memoize=True)
+    >>> [normalize(value) for value in [" A", "b", " A"]]
+    ['a', 'b', 'a']
+
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Union
+
+from imobject.record import Record
+
+_SCALARS = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def freeze_key(value: Any) -> Any:
+    """
+    Return a hashable key of value, which is equal for two values only if they are equal and of
+    the same types at every level.
+
+    Dicts (ObjDict included), records, lists, tuples and sets are frozen recursively, each level
+    being tagged with its type. The dicts keep the order of their keys, and a record is frozen
+    as the values of its fields, its class giving their names.
+
+    Raises:
+        TypeError: If the value contains an unhashable object of another type.
+    """
+    cls = type(value)
+    if cls in _SCALARS:
+        return (cls, value)
+    if isinstance(value, dict):
+        # dict.items reads the values as stored, without the conversions of ObjDict.
+        items = dict.items(value)
+        return (cls, tuple((freeze_key(key), freeze_key(item)) for key, item in items))
+    if isinstance(value, Record):
+        fields = value._fields  # pylint: disable=protected-access
+        return (cls, tuple(freeze_key(getattr(value, field)) for field in fields))
+    if isinstance(value, (list, tuple)):
+        return (cls, tuple(freeze_key(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (cls, frozenset(freeze_key(item) for item in value))
+    hash(value)
+    return (cls, value)
+
+
+class Memoized:
+    """
+    A wrapper of a pure function which computes it once per distinct input.
+
+    The cache key of an element is memo_key(element) (frozen with `freeze_key` if it is not
+    hashable), or `freeze_key(element)`. With maxsize, only the maxsize most recently used
+    results are kept.
+    """
+
+    __slots__ = ("function", "memo_key", "maxsize", "cache")
+
+    def __init__(
+        self,
+        function: Callable,
+        maxsize: Optional[int] = None,
+        memo_key: Optional[Callable] = None,
+    ):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("memoize must be True or a cache size greater than 0")
+        self.function = function
+        self.memo_key = memo_key
+        self.maxsize = maxsize
+        self.cache = OrderedDict() if maxsize else {}
+
+    def key(self, obj: Any) -> Any:
+        """Return the cache key of an element."""
+        try:
+            if self.memo_key is None:
+                return freeze_key(obj)
+            key = self.memo_key(obj)
+            try:
+                hash(key)
+            except TypeError:
+                key = freeze_key(key)
+            return key
+        except TypeError as exc:
+            raise TypeError(
+                f"Cannot memoize unhashable {type(obj).__name__} elements, "
+                "give a memo_key function"
+            ) from exc
+
+    def __call__(self, obj: Any) -> Any:
+        key = self.key(obj)
+        cache = self.cache
+        try:
+            result = cache[key]
+        except KeyError:
+            result = cache[key] = self.function(obj)
+            if self.maxsize and len(cache) > self.maxsize:
+                cache.popitem(last=False)
+            return result
+        if self.maxsize:
+            try:
+                cache.move_to_end(key)
+            except KeyError:  # evicted by another thread
+                pass
+        return result
+
+    @classmethod
+    def wrap(
+        cls,
+        function: Callable,
+        memoize: Union[bool, int],
+        memo_key: Optional[Callable] = None,
+    ) -> Callable:
+        """Return function memoized as the memoize option asks (True or a cache size)."""
+        if memoize is False or memoize is None:
+            return function
+        return cls(function, None if memoize is True else memoize, memo_key)
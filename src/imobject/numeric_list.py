@@ -0,0 +1,257 @@
+"""
+This module contains the `NumericList` class, an `ImprovedList` of int or float values with
+numeric aggregations and conversions to typed arrays.
+
+A Python list stores a pointer to a boxed number for each value (8 bytes for the pointer and
+24 to 32 bytes for the number), where a typed `array.array` or NumPy array stores 8 bytes per
+value. `NumericList` stays a list, so that it keeps the whole `ImprovedList` interface, and
+converts to a typed array on demand with `to_array()` / `to_numpy()`. Results which only need
+to be stored can be built as typed arrays directly with `map(..., return_type="array")`.
+
+Example usage:
+
+    >>> salaries = people.map(".salary", return_type="NumericList")  # doctest: +SKIP
+    >>> salaries.mean()  # doctest: +SKIP
+    >>> compact = people.map(".salary", return_type="array")  # doctest: +SKIP
+
+NumPy is optional: when it is installed, `to_numpy()` and `map(func, vectorize=True)` are
+available.
+
+"""
+import statistics
+from array import array
+from typing import Any, Callable, Iterable, Optional, Union
+
+from imobject.improved_list import ImprovedList
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+def to_array(values: Iterable) -> array:
+    """
+    Return the values in an `array.array`: of typecode 'q' (64 bits integers) if they are all
+    integers, and 'd' (floats) otherwise.
+
+    Raises:
+        TypeError: If a value is not an int or a float.
+    """
+    if not isinstance(values, (list, tuple, array)):
+        values = list(values)
+    try:
+        return array("q", values)
+    except (TypeError, OverflowError):
+        pass
+    try:
+        return array("d", values)
+    except TypeError as exc:
+        raise TypeError(f"Expected int or float values: {exc}") from exc
+
+
+class NumericList(ImprovedList):
+    """
+    An ImprovedList of int or float values.
+
+    Every method adding values to the list (append, extend, insert, item assignment, + and +=)
+    raises TypeError if a value is not a number. The typecode of the values is computed once
+    and kept up to date as the list changes.
+
+    The aggregations run in C over the list. `map` keeps returning a NumericList as long as the
+    results are numbers, and applies NumPy vectorized callables to the whole list at once with
+    `vectorize=True`.
+
+    Methods:
+        sum, mean, min, max: Numeric aggregations.
+        typecode: The `array.array` typecode able to store the values.
+        to_array: Return the values in a typed `array.array`.
+        to_numpy: Return the values in a NumPy array.
+
+    Example usage:
+        >>> values = NumericList([1, 2, 3.5])
+        >>> values.sum(), values.mean(), values.max()
+        (6.5, 2.1666666666666665, 3.5)
+        >>> values.to_array()
+        array('d', [1.0, 2.0, 3.5])
+    """
+
+    # The typecode of the values, or None until it is computed again after a removal.
+    _typecode: Optional[str] = None
+
+    def __init__(
+        self, iterable: Iterable = (), *, lazy: bool = False
+    ):  # pylint: disable=unused-argument
+        """
+        Constructor for NumericList.
+
+        Parameters:
+        - iterable: the int or float values of the list
+        - lazy (bool): accepted for compatibility with ImprovedList; numbers need no conversion
+
+        Raises:
+            TypeError: If a value is not an int or a float.
+        """
+        list.__init__(self, iterable)
+        self._typecode = to_array(self).typecode
+
+    @classmethod
+    def _from_converted(cls, data: Iterable) -> "NumericList":
+        """Create a list from values which are already known to be numbers."""
+        result = super()._from_converted(data)
+        result._typecode = None
+        return result
+
+    @staticmethod
+    def _checked(values: Iterable) -> str:
+        """
+        Return the typecode of values added to the list.
+
+        Raises:
+            TypeError: If a value is not an int or a float.
+        """
+        return to_array(values).typecode
+
+    def _added(self, typecode: str) -> None:
+        """Update the cached typecode once values of the given typecode are added."""
+        if typecode == "d":
+            self._typecode = "d"
+
+    def _removed(self) -> None:
+        """Forget the cached typecode once values are removed, it may become 'q'."""
+        if self._typecode == "d":
+            self._typecode = None
+
+    def append(self, item: Any) -> None:
+        """Append a number to the list. Raises TypeError if it is not an int or a float."""
+        typecode = self._checked((item,))
+        list.append(self, item)
+        self._added(typecode)
+
+    def extend(self, iterable: Iterable) -> None:
+        """Extend the list with numbers. Raises TypeError if a value is not an int or a float."""
+        values = iterable
+        if not isinstance(values, (list, tuple, array)):
+            values = list(values)
+        typecode = self._checked(values)
+        list.extend(self, values)
+        self._added(typecode)
+
+    def insert(self, index: int, item: Any) -> None:
+        """Insert a number before index. Raises TypeError if it is not an int or a float."""
+        typecode = self._checked((item,))
+        list.insert(self, index, item)
+        self._added(typecode)
+
+    def __setitem__(self, index, value):
+        """Set a value or a slice. Raises TypeError if a value is not an int or a float."""
+        if isinstance(index, slice):
+            value = list(value)
+            typecode = self._checked(value)
+        else:
+            typecode = self._checked((value,))
+        list.__setitem__(self, index, value)
+        self._removed()
+        self._added(typecode)
+
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._removed()
+
+    def pop(self, index: int = -1) -> Union[int, float]:
+        value = list.pop(self, index)
+        self._removed()
+        return value
+
+    def remove(self, value: Any) -> None:
+        list.remove(self, value)
+        self._removed()
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._typecode = "q"
+
+    def __imul__(self, count: int) -> "NumericList":
+        list.__imul__(self, count)
+        if not self:
+            self._typecode = "q"
+        return self
+
+    def sum(self) -> Union[int, float]:
+        """Return the sum of the values, 0 if the list is empty."""
+        return sum(self)
+
+    def mean(self) -> float:
+        """
+        Return the arithmetic mean of the values.
+
+        Raises:
+            statistics.StatisticsError: If the list is empty.
+        """
+        return statistics.fmean(self)
+
+    def min(self) -> Union[int, float]:
+        """Return the smallest value. Raises ValueError if the list is empty."""
+        return min(self)
+
+    def max(self) -> Union[int, float]:
+        """Return the largest value. Raises ValueError if the list is empty."""
+        return max(self)
+
+    @property
+    def typecode(self) -> str:
+        """The `array.array` typecode able to store the values ('q' or 'd')."""
+        if self._typecode is None:
+            self._typecode = to_array(self).typecode
+        return self._typecode
+
+    def to_array(self) -> array:
+        """Return the values in a typed `array.array`, using 8 bytes per value."""
+        if self._typecode is None:
+            values = to_array(self)
+            self._typecode = values.typecode
+            return values
+        return array(self._typecode, self)
+
+    def to_numpy(self):
+        """
+        Return the values in a NumPy array.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("to_numpy requires NumPy to be installed")
+        values = self.to_array()
+        return np.frombuffer(values, dtype=values.typecode)
+
+    def map(self, called: Union[str, Callable], *args, **kwargs) -> Any:
+        """
+        Apply a map function to the NumericList, as `ImprovedList.map` does.
+
+        With vectorize=True and NumPy installed, called is a callable applied once to the
+        NumPy array of all the values (e.g. `lambda values: values * 1.1`), instead of once per
+        value. Without NumPy, or with other map options, the values are mapped one by one.
+        """
+        vectorize = kwargs.pop("vectorize", False)
+        if vectorize and np is not None and callable(called) and not (args or kwargs):
+            return self.convert_result("ImprovedList", called(self.to_numpy()).tolist())
+        return super().map(called, *args, **kwargs)
+
+    def convert_result(self, return_type, result):
+        """
+        Convert the result to the specified return type, as `ImprovedList.convert_result` does.
+
+        An 'ImprovedList' result is a NumericList if all its elements are numbers, and an
+        ImprovedList otherwise.
+        """
+        if return_type != "ImprovedList":
+            return super().convert_result(return_type, result)
+        result = list(result)
+        try:
+            typecode = to_array(result).typecode
+        except TypeError:
+            return ImprovedList(result)
+        numbers = self._from_converted(result)
+        numbers._typecode = typecode  # pylint: disable=protected-access
+        return numbers
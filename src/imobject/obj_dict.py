@@ -23,7 +23,15 @@ Note that when you use dot notation to access an attribute, if the attribute doe
  `ObjDict` will create it for you.
 
 """
+import codecs
+import json
 import pprint
+import re
+from collections.abc import ItemsView, Mapping
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Union
 from imobject.improved_list import (
     ImprovedList,
 )
@@ -31,6 +39,12 @@ from imobject.improved_list import (
 from imobject.orm_collection import (
     OrmCollection,
 )
+from imobject.record import record_class
+from imobject.frozen_obj_dict import FrozenObjDict
+from imobject.serializer import to_json, to_plain
+from imobject.interning import intern_items, intern_value
+
+_MISSING = object()
 
 
 class ObjDict(dict):
@@ -53,13 +67,31 @@ class ObjDict(dict):
         __dict__: A dictionary holding the object's attributes.
     """
 
+    # True once an attribute is cached in the instance __dict__ (see __getattr__).
+    _cached_attributes = False
+
     def __getattr__(self, name: str):
-        """Get attribute value"""
-        if name not in self:
+        """
+        Get attribute value
+
+        A plain dict or list value is converted to ObjDict or OrmCollection on first access, and
+        stored back, so the changes made through the returned object are kept. The converted
+        value is also cached in the instance __dict__: the next accesses find it there directly,
+        without calling __getattr__ again. The cache entry is dropped when the key is set or
+        deleted. The values returned unchanged (scalars, ObjDict...) are not cached, so reading
+        them does not give each object its own instance __dict__.
+        """
+        try:
+            value = dict.__getitem__(self, name)
+        except KeyError:
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
-            )
-        return self._clean_item(self[name])
+            ) from None
+        converted = self._clean_item(value)
+        if converted is not value:
+            dict.__setitem__(self, name, converted)
+            self._cache_attribute(name, converted)
+        return converted
 
     def __setattr__(self, name: str, value):
         """Set Any attribute value"""
@@ -70,9 +102,50 @@ class ObjDict(dict):
         # Convertir les listes en ImprovedList
         elif isinstance(value, list) and not isinstance(value, ImprovedList):
             value = ImprovedList(value)
-        super().__setattr__(name, value)
         self[name] = value
 
+    def _cache_attribute(self, name: str, value) -> None:
+        """Store value in the instance __dict__, where attribute lookups find it first."""
+        instance_dict = self.__dict__
+        instance_dict[name] = value
+        instance_dict["_cached_attributes"] = True
+
+    def _forget_attribute(self, key) -> None:
+        """Drop the value cached in the instance __dict__ for key, if any."""
+        if self._cached_attributes:
+            self.__dict__.pop(key, None)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._forget_attribute(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._forget_attribute(key)
+
+    def pop(self, key, *default):
+        """Remove a key and return its value, or default if the key is not found"""
+        self._forget_attribute(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        """Remove and return the last inserted (key, value) pair"""
+        key, value = super().popitem()
+        self._forget_attribute(key)
+        return key, value
+
+    def clear(self):
+        """Remove all the keys"""
+        if self._cached_attributes:
+            instance_dict = self.__dict__
+            for key in dict.keys(self):
+                instance_dict.pop(key, None)
+        super().clear()
+
+    def __ior__(self, data):
+        self.update(data)
+        return self
+
     def __delattr__(self, name: str):
         """
         Supprime un attribut de l'objet.
@@ -90,52 +163,283 @@ class ObjDict(dict):
         # If the attribute exists in the dictionary, delete it
         if name in self:
             del self[name]
-            if hasattr(self, name):
-                super().__delattr__(name)
         else:
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
             )
 
     def to_dict(self) -> dict:
-        """Return a dictionary representation of the object"""
-        result = {}
-        for key, value in self.items():
-            if isinstance(value, ObjDict):
-                result[key] = value.to_dict()
-            elif isinstance(value, OrmCollection):  # Ajouté cette partie
-                result[key] = list(value)  # Convertir OrmCollection en liste
-            else:
-                result[key] = value
-        return result
+        """
+        Return a dictionary representation of the object
+
+        The nested ObjDict and lists are converted to plain dict and list at any depth, without
+        recursion. A value referenced several times is converted once (see `to_plain`).
+        """
+        return to_plain(self)
+
+    def to_json(self, fp=None, **kwargs):
+        """
+        Return the JSON document of the object, or write it to the text file fp
+
+        The object is encoded directly, without building its `to_dict()` copy. The keyword
+        arguments are passed to `json.dumps`.
+
+        Example usage:
+            >>> ObjDict({"a": [{"b": 1}]}).to_json()
+            '{"a": [{"b": 1}]}'
+        """
+        return to_json(self, fp, **kwargs)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "ObjDict":
-        """Create an object from a dictionary"""
+    def from_dict(cls, data: dict, intern: bool = False) -> "ObjDict":
+        """
+        Create an object from a dictionary
+
+        With intern=True, the keys and the short string values are interned, in the nested
+        dictionaries and lists too, so that the objects created from many similar dictionaries
+        share their strings (see `imobject.interning`).
+        """
+        if intern:
+            return _interned(data, cls)
         result = cls()
+        set_item = dict.__setitem__  # result is new: no cached attribute to drop
         for key, value in data.items():
-            result[key] = cls._clean_item(value)
+            set_item(result, key, cls._clean_item(value))
+        return result
+
+    @classmethod
+    def loads(
+        cls, data: Union[str, bytes, bytearray], intern: bool = False, **kwargs
+    ) -> Any:
+        """
+        Decode a JSON document straight into ObjDict and OrmCollection objects
+
+        The objects are built as ObjDict by the decoder itself, and the arrays are wrapped in
+        OrmCollection without converting their elements again, so the result needs no further
+        conversion on access. With intern=True, the keys, the short string values and the
+        short strings of the arrays held by the objects are interned, so that the objects share
+        their strings (see `imobject.interning`). The other keyword arguments are passed to
+        `json.loads`.
+
+        Example usage:
+            >>> people = ObjDict.loads('[{"name": "Alice", "tags": ["a"]}]')
+            >>> people.where(name="Alice")[0].tags
+            ['a']
+        """
+        return _from_json(
+            json.loads(data, object_pairs_hook=cls._json_hook(intern), **kwargs)
+        )
+
+    @classmethod
+    def load(cls, fp, **kwargs) -> Any:
+        """Decode the JSON document read from a text or binary file, as `loads` does"""
+        return cls.loads(fp.read(), **kwargs)
+
+    @classmethod
+    def iterload(
+        cls, fp, chunk_size: int = 65536, intern: bool = False, **kwargs
+    ) -> Iterator:
+        """
+        Decode the elements of a top-level JSON array one by one, as `loads` does
+
+        The file (text or binary, encoded in UTF-8) is read chunk_size characters or bytes at
+        a time, and each element is yielded as soon as it is read, so only one chunk and the
+        element being decoded are held in memory. The other keyword arguments are passed to
+        `json.JSONDecoder`.
+
+        Raises:
+            ValueError: If chunk_size is lower than 1.
+            json.JSONDecodeError: If the document is not a valid JSON array.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than or equal to 1")
+        decoder = json.JSONDecoder(object_pairs_hook=cls._json_hook(intern), **kwargs)
+        return _iter_json_array(_read_text(fp, chunk_size), decoder)
+
+    @classmethod
+    def _json_hook(cls, intern: bool) -> Callable[[list], "ObjDict"]:
+        """Return the object_pairs_hook building the ObjDict of the JSON objects."""
+        if intern:
+            return cls._from_interned_json_pairs
+        return cls._from_json_pairs
+
+    @classmethod
+    def _from_interned_json_pairs(cls, pairs: list) -> "ObjDict":
+        """Build an ObjDict from the decoded pairs of a JSON object, interning its strings."""
+        for _, value in pairs:
+            if value.__class__ is list:
+                value[:] = map(intern_value, value)
+        return cls._from_json_pairs(intern_items(pairs))
+
+    @classmethod
+    def _from_json_pairs(cls, pairs: list) -> "ObjDict":
+        """Build an ObjDict from the decoded (key, value) pairs of a JSON object."""
+        result = cls(pairs)
+        for key, value in pairs:
+            if value.__class__ is list:
+                dict.__setitem__(result, key, _from_json(value))
         return result
 
+    @staticmethod
+    def schema(schema: dict, name: str = "Record") -> type:
+        """
+        Return a compact record class for rows with the given fields.
+
+        The instances of the returned class store their values in `__slots__` instead of a
+        dictionary, and still support attribute access, access by key and `to_dict()`.
+
+        Example usage:
+            >>> Person = ObjDict.schema({"name": str, "age": int}, name="Person")
+            >>> Person("Alice", 25).name
+            'Alice'
+            >>> Person.from_dict({"name": "Bob", "age": 40}).to_dict()
+            {'name': 'Bob', 'age': 40}
+        """
+        return record_class(schema, name)
+
     def update(self, data: dict):
         """Update the object with a dictionary"""
         for key, value in data.items():
             self[key] = self._clean_item(value)
 
-    def items(self):
-        """Return the keys and values of the object as tuples"""
-        return [(key, self._clean_item(value)) for key, value in super().items()]
+    def items(self) -> "ObjDictItemsView":
+        """
+        Return a view of the keys and values of the object as tuples
+
+        The values are converted as with attribute access, one by one while the view is
+        iterated, so a partial iteration only converts the values it reads.
+        """
+        return ObjDictItemsView(self)
 
     def copy(self) -> "ObjDict":
         """Return a deep copy of the object"""
         return self.__class__(self.to_dict())
 
+    def freeze(self) -> FrozenObjDict:
+        """
+        Return an immutable, hashable snapshot of the object
+
+        The snapshot shares its structure with the versions derived from it by
+        `FrozenObjDict.set`, so taking and updating snapshots is cheap.
+        """
+        return FrozenObjDict(self)
+
     @property
     def inspect(self):
         """Return a pretty formatted information of object"""
         pprint.pprint(self, indent=4)
         return self
 
+    @staticmethod
+    def compile_path(path: str) -> Callable[[Any], Any]:
+        """
+        Return a function reading the value at a dotted path, e.g. "address.city"
+
+        The segments made of digits are list indexes, e.g. "children.0.name", or string keys
+        when the value they are read from is a mapping, e.g. "codes.75". The function uses
+        plain item access, so it neither converts nor wraps the intermediate values, and it
+        returns the value as stored. It raises KeyError, IndexError or TypeError when the path
+        does not exist. The functions are cached by path.
+
+        Example usage:
+            >>> city = ObjDict.compile_path("address.city")
+            >>> city(ObjDict({"address": {"city": "Paris"}}))
+            'Paris'
+        """
+        return _compile_path(path)
+
+    def get_path(self, path: str, default: Any = _MISSING) -> Any:
+        """
+        Return the value at a dotted path (see `compile_path`), or default if it does not exist
+
+        Raises:
+            KeyError: If the path does not exist and no default is given.
+        """
+        try:
+            return _compile_path(path)(self)
+        except (LookupError, TypeError) as exc:
+            if default is _MISSING:
+                raise KeyError(path) from exc
+            return default
+
+    def set_path(self, path: str, value: Any) -> None:
+        """
+        Set the value at a dotted path (see `compile_path`)
+
+        The missing keys on the way are created with an empty ObjDict.
+
+        Raises:
+            IndexError: If a list index of the path is out of range.
+            TypeError: If a value on the path is neither a dict nor a list.
+        """
+        *parents, last = path.split(".")
+        target = self
+        for segment in parents:
+            key = _path_key(target, segment)
+            try:
+                target = target[key]
+            except KeyError:
+                target[key] = target = ObjDict()
+        target[_path_key(target, last)] = value
+
+    def diff(self, other: Mapping) -> dict:
+        """
+        Return the patch turning the object into other
+
+        The patch is a dict of three lists: "added" and "changed" hold `(path, value)` pairs,
+        and "removed" holds paths, a path being the tuple of the keys leading to a value. The
+        nested dicts are compared key by key; any other value (lists included) is compared as a
+        whole. The subtrees which are the same object, or equal FrozenObjDict (compared by
+        their cached hash first), are skipped without being walked. The values of the patch
+        are plain copies (see `to_dict`), so the patch can be sent as JSON.
+
+        Example usage:
+            >>> old = ObjDict({"db": {"host": "a", "port": 1}, "debug": True})
+            >>> old.diff({"db": {"host": "b", "port": 1}, "workers": 2})
+            {'added': [(('workers',), 2)], 'removed': [('debug',)], 'changed': [(('db', 'host'), 'b')]}
+        """
+        added, removed, changed = [], [], []
+        pending = [((), self, other)]
+        # The subtrees to compare are appended while the list is iterated (breadth first).
+        for path, old, new in pending:
+            for key, value in _raw_items(old):
+                if key not in new:
+                    removed.append(path + (key,))
+                    continue
+                new_value = new[key]
+                if value is new_value:
+                    continue
+                if isinstance(value, Mapping) and isinstance(new_value, Mapping):
+                    if not (
+                        isinstance(value, FrozenObjDict)
+                        and isinstance(new_value, FrozenObjDict)
+                        and value == new_value
+                    ):
+                        pending.append((path + (key,), value, new_value))
+                elif value != new_value:
+                    changed.append((path + (key,), to_plain(new_value)))
+            for key, value in _raw_items(new):
+                if key not in old:
+                    added.append((path + (key,), to_plain(value)))
+        return {"added": added, "removed": removed, "changed": changed}
+
+    def apply(self, patch: Mapping) -> "ObjDict":
+        """
+        Apply in place a patch returned by `diff`, and return the object
+
+        The missing keys on the way to an added value are created with an empty ObjDict.
+
+        Raises:
+            KeyError: If a removed path does not exist.
+        """
+        for path in patch.get("removed", ()):
+            *parents, last = path
+            del _walk(self, parents, create=False)[last]
+        for path, value in chain(patch.get("changed", ()), patch.get("added", ())):
+            *parents, last = path
+            _walk(self, parents)[last] = to_plain(value)
+        return self
+
     def select(self, wanted_keys: list) -> "ObjDict":
         """Filter dict by returning only some keys"""
         if not isinstance(wanted_keys, list):
@@ -160,6 +464,199 @@ class ObjDict(dict):
         """Improve type of object"""
         if isinstance(item, dict) and not isinstance(item, ObjDict):
             return ObjDict(item)
-        if isinstance(item, list):
+        if isinstance(item, list) and not isinstance(item, ImprovedList):
             return OrmCollection(item)
         return item
+
+
+class ObjDictItemsView(ItemsView):
+    """
+    The view returned by `ObjDict.items()`.
+
+    Like `dict_items`, it supports `len`, membership tests and set operations, and reflects the
+    changes of the ObjDict. Each value is converted when it is yielded, not before: plain dicts
+    and lists become ObjDict and OrmCollection, and are stored back in the ObjDict as with
+    attribute access, so stopping the iteration early leaves the other values unconverted.
+    A view is also equal to the list of its items, in order.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self):
+        mapping = self._mapping
+        clean_item = ObjDict._clean_item  # pylint: disable=protected-access
+        for key, value in dict.items(mapping):
+            if isinstance(value, (dict, list)):
+                converted = clean_item(value)
+                if converted is not value:
+                    # Remplacer une valeur ne change pas la taille : l'itération reste valide.
+                    dict.__setitem__(mapping, key, converted)
+                    mapping._forget_attribute(key)  # pylint: disable=protected-access
+                    value = converted
+            yield key, value
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+def _interned(value: Any, cls: type) -> Any:
+    """
+    Return value converted as `ObjDict.from_dict` does, at any depth, with its keys and short
+    string values interned.
+    """
+    if isinstance(value, dict):
+        return cls(
+            (key, _interned(item, cls)) for key, item in intern_items(dict.items(value))
+        )
+    if isinstance(value, list):
+        return OrmCollection._from_converted(  # pylint: disable=protected-access
+            [_interned(item, cls) for item in list.__iter__(value)]
+        )
+    return intern_value(value)
+
+
+def _walk(target: Any, keys, create: bool = True) -> Any:
+    """
+    Return the value reached from target through keys, with plain item access.
+
+    If create is True, the missing keys are created with an empty ObjDict.
+    """
+    for key in keys:
+        try:
+            target = target[key]
+        except KeyError:
+            if not create:
+                raise
+            target[key] = target = ObjDict()
+    return target
+
+
+def _raw_items(mapping: Mapping):
+    """Return the items of mapping, as stored if it is a dict (without ObjDict conversions)."""
+    return dict.items(mapping) if isinstance(mapping, dict) else mapping.items()
+
+
+def _path_key(target: Any, segment: str) -> Union[str, int]:
+    """
+    Return the key of a dotted path segment in target: a segment made of digits is a list
+    index, except in a mapping, where it stays a string key.
+    """
+    if segment.isascii() and segment.isdigit() and not isinstance(target, Mapping):
+        return int(segment)
+    return segment
+
+
+def _segment_getter(segment: str) -> Callable[[Any], Any]:
+    """Return a function reading a dotted path segment from a value, with plain item access."""
+    if not (segment.isascii() and segment.isdigit()):
+        return itemgetter(segment)
+    index = int(segment)
+
+    def get(target: Any) -> Any:
+        if isinstance(target, Mapping):
+            return target[segment]
+        return target[index]
+
+    return get
+
+
+@lru_cache(maxsize=4096)
+def _compile_path(path: str) -> Callable[[Any], Any]:
+    """Return a function reading the value at path, walking the getters of its segments."""
+    getters = tuple(map(_segment_getter, path.split(".")))
+
+    def read(obj: Any) -> Any:
+        for getter in getters:
+            obj = getter(obj)
+        return obj
+
+    return read
+
+
+def _from_json(value: Any) -> Any:
+    """
+    Wrap a decoded JSON array, and the arrays it contains, in OrmCollection; the objects are
+    already ObjDict.
+    """
+    if value.__class__ is not list:
+        return value
+    if list in map(type, value):
+        value[:] = map(_from_json, value)
+    return OrmCollection._from_converted(value)  # pylint: disable=protected-access
+
+
+def _read_text(fp, chunk_size: int) -> Iterator[str]:
+    """Yield the text read from a text or UTF-8 binary file, chunk_size at a time."""
+    decode = codecs.getincrementaldecoder("utf-8")().decode
+    while True:
+        chunk = fp.read(chunk_size)
+        text = decode(chunk, final=not chunk) if isinstance(chunk, bytes) else chunk
+        if text:
+            yield text
+        if not chunk:
+            return
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _iter_json_array(chunks: Iterator[str], decoder: json.JSONDecoder) -> Iterator:
+    """
+    Yield the elements of the JSON array read from chunks.
+
+    An element is decoded with `raw_decode` from the buffer. If it fails to decode, or is not
+    followed by a delimiter yet (a number such as "12" may go on with "3.5" in the next chunk),
+    it is decoded again once the pending text has at least doubled, so an element spanning many
+    chunks is decoded a logarithmic number of times.
+    """
+    buffer, index, state = "", 0, "start"
+    while True:
+        index = _WHITESPACE.match(buffer, index).end()
+        if index == len(buffer):
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise json.JSONDecodeError(
+                    "Unexpected end of JSON array", buffer, index
+                )
+            buffer, index = buffer[index:] + chunk, 0
+            continue
+        char = buffer[index]
+        if state == "start":
+            if char != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, index)
+            index, state = index + 1, "first"
+        elif char == "]" and state != "value":
+            return
+        elif state == "separator":
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, index)
+            index, state = index + 1, "value"
+        else:
+            try:
+                value, end = decoder.raw_decode(buffer, index)
+                error = None
+                following = _WHITESPACE.match(buffer, end).end()
+                complete = following < len(buffer) and buffer[following] in ",]"
+            except json.JSONDecodeError as exc:
+                error, complete = exc, False
+            if not complete:
+                parts = [buffer[index:]]
+                size = len(parts[0])
+                while size < 2 * len(parts[0]):
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    parts.append(chunk)
+                    size += len(chunk)
+                if len(parts) > 1:
+                    buffer, index = "".join(parts), 0
+                    continue
+                if error is not None:
+                    raise error
+            yield _from_json(value)
+            index, state = end, "separator"
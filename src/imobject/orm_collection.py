@@ -6,13 +6,54 @@ The `OrmCollection` class is designed to work with any iterable of objects, prov
 It allows for the use of chained queries, so that multiple filters and transformations can be applied to a collection in a single statement.
 
 """
+import operator
 import re
-from typing import Any, List, Union, Dict
+from typing import Any, Callable, List, Union, Dict, Iterable, Optional
 from collections import OrderedDict
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter
+from imobject.bloom_filter import BloomFilter
 from imobject.improved_list import ImprovedList
+from imobject.interning import intern_row
+from imobject.memoize import Memoized
+from imobject.record import Record, record_class, records_by_shape
+from imobject.serializer import to_json
 from imobject.exception import BaseMultipleFound, BaseNotFound
 
 
+def _in_members(value: Any, members: Any) -> bool:
+    """
+    Return True if value is one of the members of an "in"/"nin" operand prepared by
+    `Filter.membership_operand`.
+
+    An unhashable value (list, dict...) cannot be looked up in a frozenset: it is compared with
+    each member instead. It cannot have been added to a `BloomFilter`.
+    """
+    try:
+        return value in members
+    except TypeError:
+        if isinstance(members, BloomFilter):
+            return False
+        return any(member == value for member in members)
+
+
+def _not_in_members(value: Any, members: Any) -> bool:
+    """Return True if value is not one of the members of an "in"/"nin" operand."""
+    return not _in_members(value, members)
+
+
+def _ends_with(first_operand: str, second_operand: str) -> bool:
+    return first_operand.endswith(second_operand)
+
+
+def _starts_with(first_operand: str, second_operand: str) -> bool:
+    return first_operand.startswith(second_operand)
+
+
+def _contains(first_operand: Any, second_operand: Any) -> bool:
+    return second_operand in first_operand
+
+
 class Filter:
     """
     A helper class for creating filters on collections of data.
@@ -50,6 +91,9 @@ class Filter:
         not_in_list(first_operand: Any, second_operand: Union[List, Tuple]) -> bool:
             Returns True if the first operand is not in the second operand list, otherwise raises a TypeError.
 
+        membership_operand(value: Any) -> Optional[Union[frozenset, tuple, BloomFilter]]:
+            Returns the value of an "in"/"nin" filter prepared for fast lookups, or None if it is not a valid operand.
+
         starts_with(first_operand: str, second_operand: str) -> bool:
             Returns True if the first string starts with the second string, otherwise raises a TypeError.
 
@@ -100,6 +144,24 @@ class Filter:
         ),
     }
 
+    # Comparisons without type checks, used once the operands have been validated. They are
+    # module level functions, so that the filters using them can be pickled.
+    raw_op_funcs = {
+        "lt": operator.lt,
+        "gt": operator.gt,
+        "endswith": _ends_with,
+        "startswith": _starts_with,
+        "in": _in_members,
+        "contains": _contains,
+        "nin": _not_in_members,
+        "not": operator.ne,
+        "eq": operator.eq,
+        "lte": operator.le,
+        "gte": operator.ge,
+    }
+
+    membership_types = (frozenset, set, list, tuple, BloomFilter)
+
     @staticmethod
     def less_than(first_operand: Any, second_operand: Any) -> bool:
         if isinstance(first_operand, type(second_operand)):
@@ -126,7 +188,7 @@ class Filter:
 
     @staticmethod
     def in_list(first_operand: Any, second_operand: Any) -> bool:
-        if type(second_operand) in (list, set):
+        if isinstance(second_operand, Filter.membership_types):
             return first_operand in second_operand
         return Filter.raise_type_error("in", first_operand, second_operand)
 
@@ -138,7 +200,7 @@ class Filter:
 
     @staticmethod
     def not_in_list(first_operand: Any, second_operand: Any) -> bool:
-        if type(second_operand) in (list, set):
+        if isinstance(second_operand, Filter.membership_types):
             return first_operand not in second_operand
         return Filter.raise_type_error("nin", first_operand, second_operand)
 
@@ -166,15 +228,68 @@ class Filter:
             return first_operand >= second_operand
         return Filter.raise_type_error(">=", first_operand, second_operand)
 
-    def __init__(self, attribute: str, operator: str, value: Any):
+    @staticmethod
+    def membership_operand(
+        value: Any,
+    ) -> Optional[Union[frozenset, tuple, BloomFilter]]:
+        """
+        Prepares the value of an "in"/"nin" filter for fast membership tests.
+
+        Any iterable except strings, bytes and mappings is accepted. It is turned into a frozenset
+        so that each lookup is O(1), or into a tuple if its elements are not hashable.
+        A `BloomFilter` is kept as is.
+
+        Args:
+            value (Any): The value of the filter.
+
+        Returns:
+            The prepared value, or None if the value is not a valid operand.
+        """
+        if isinstance(value, (frozenset, BloomFilter)):
+            return value
+        if isinstance(value, (str, bytes, dict)) or not isinstance(value, Iterable):
+            return None
+        if not isinstance(value, (list, tuple, set)):
+            # Un itérateur ne peut être parcouru qu'une fois
+            value = tuple(value)
+        try:
+            return frozenset(value)
+        except TypeError:
+            return tuple(value)
+
+    def __init__(
+        self, attribute: str, operator: str, value: Any, trusted: bool = False
+    ):
+        """
+        Initialize a filter.
+
+        Args:
+            attribute (str): The name of the attribute to compare.
+            operator (str): The name of the operator, or None for equality (or regex matching).
+            value (Any): The value to compare the attribute with.
+            trusted (bool): If True, the types of the attribute values are known to match the
+                operator (see `OrmCollection.validate_schema`), and the comparison is run
+                without the per element type checks.
+        """
         self.attribute = attribute
         self.operator = operator
         self.value = value
+        self._compare = None
+        if operator in ("in", "nin"):
+            members = self.membership_operand(value)
+            if members is not None:
+                # The operand is validated once here instead of for every element.
+                self.value = members
+                self._compare = self.raw_op_funcs[operator]
+        elif trusted and operator in self.raw_op_funcs:
+            self._compare = self.raw_op_funcs[operator]
 
     def evaluate(self, obj: Dict[str, Any]) -> bool:
         # if not isinstance(obj, object):
         #     return False
         attr_value = getattr(obj, self.attribute)
+        if self._compare is not None:
+            return self._compare(attr_value, self.value)
         if self.operator is not None:
             if self.operator in self.op_funcs:
                 return self.op_funcs[self.operator](attr_value, self.value)
@@ -183,6 +298,20 @@ class Filter:
             return re.match(self.value, attr_value)
         return attr_value == self.value
 
+    def signature(self) -> tuple:
+        """
+        Returns a key identifying the behavior of this filter.
+
+        Two filters with the same signature give the same result for any object. It is used by
+        `Query.normalize` to remove duplicate filters.
+        """
+        try:
+            hash(self.value)
+            value_key = (type(self.value), self.value)
+        except TypeError:
+            value_key = (type(self.value), id(self.value))
+        return (self.attribute, self.operator, value_key, self._compare)
+
     def contains_regex(self, string):
         """
         Checks whether a string contains a regular expression.
@@ -238,6 +367,8 @@ class Query:
     ----------
     filters : List[Union[Query, Filter]]
         Liste de filtres à appliquer à l'objet.
+    connector : str
+        "AND" si tous les filtres doivent être satisfaits, "OR" s'il suffit d'un seul.
 
     Méthodes:
     ---------
@@ -249,9 +380,17 @@ class Query:
 
     evaluate(self, obj) -> bool:
         Évalue cette requête sur l'objet donné et renvoie True si l'objet satisfait la requête, False sinon.
+
+    normalize(self) -> Query:
+        Renvoie une requête équivalente aplatie, sans filtres en double.
+
+    compile(self) -> Callable[[Any], bool]:
+        Renvoie un prédicat qui évalue chaque filtre distinct au plus une fois par objet.
     """
 
-    def __init__(self, filters: List[Union["Query", "Filter"]]) -> None:
+    def __init__(
+        self, filters: List[Union["Query", "Filter"]], connector: Optional[str] = None
+    ) -> None:
         """
         Initialise une nouvelle requête avec les filtres donnés.
 
@@ -259,8 +398,22 @@ class Query:
         -----------
         filters : List[Union[Query, Filter]]
             Liste de filtres à appliquer à l'objet.
+        connector : str, optional
+            "AND" ou "OR". Par défaut, une liste commençant par une requête est une disjonction,
+            et une liste de filtres une conjonction.
         """
+        if connector is None:
+            connector = "OR" if filters and isinstance(filters[0], Query) else "AND"
+        if connector not in ("AND", "OR"):
+            raise ValueError(f"'{connector}' is not a valid connector")
         self.filters = filters
+        self.connector = connector
+
+    def _operands(self, connector: str) -> List[Union["Query", "Filter"]]:
+        """Renvoie les opérandes de cette requête pour une combinaison avec le connecteur donné."""
+        if self.connector == connector:
+            return list(self.filters)
+        return [self]
 
     def __and__(self, other: "Query") -> "Query":
         """
@@ -276,12 +429,14 @@ class Query:
         Query
             Une nouvelle requête qui est la conjonction de cette requête et de la requête donnée.
         """
-        return Query(self.filters + other.filters)
+        return Query(self._operands("AND") + other._operands("AND"), "AND")
 
     def __or__(self, other: "Query") -> "Query":
         """
         Renvoie une nouvelle requête qui est la disjonction de cette requête et de la requête donnée.
 
+        Les disjonctions successives sont aplaties au lieu d'être imbriquées.
+
         Parameters:
         -----------
         other : Query
@@ -292,7 +447,7 @@ class Query:
         Query
             Une nouvelle requête qui est la disjonction de cette requête et de la requête donnée.
         """
-        return Query([self, other])
+        return Query(self._operands("OR") + other._operands("OR"), "OR")
 
     def evaluate(self, obj: Dict[str, Any]) -> bool:
         """
@@ -308,12 +463,103 @@ class Query:
         bool
             True si l'objet satisfait la requête, False sinon.
         """
-        if isinstance(self.filters[0], Query):
-            # opération OR
+        if self.connector == "OR":
             return any(subquery.evaluate(obj) for subquery in self.filters)
-            # opération AND
         return all(filter.evaluate(obj) for filter in self.filters)
 
+    def normalize(self) -> "Query":
+        """
+        Renvoie une requête équivalente sous forme aplatie.
+
+        Les sous-requêtes de même connecteur sont fusionnées dans leur parent, les sous-requêtes
+        d'un seul élément sont remplacées par cet élément et les filtres en double sont supprimés.
+
+        Returns:
+        --------
+        Query
+            Une nouvelle requête équivalente.
+        """
+        operands = []
+        signatures = set()
+        pending = list(reversed(self.filters))
+        while pending:
+            operand = pending.pop()
+            if isinstance(operand, Query):
+                operand = operand.normalize()
+                if operand.connector == self.connector or len(operand.filters) == 1:
+                    pending.extend(reversed(operand.filters))
+                    continue
+            signature = operand.signature()
+            if signature not in signatures:
+                signatures.add(signature)
+                operands.append(operand)
+        return Query(operands, self.connector)
+
+    def signature(self) -> tuple:
+        """Renvoie une clé identifiant le comportement de cette requête."""
+        return (
+            self.connector,
+            tuple(operand.signature() for operand in self.filters),
+        )
+
+    def compile(self) -> Callable[[Any], bool]:
+        """
+        Renvoie un prédicat équivalent à `evaluate`, calculé sur la forme normalisée.
+
+        Un filtre présent dans plusieurs branches de la requête n'est évalué qu'une fois par
+        objet, son résultat étant réutilisé par les autres branches.
+
+        Returns:
+        --------
+        Callable[[Any], bool]
+            Une fonction qui prend un objet et renvoie True s'il satisfait la requête.
+        """
+        query = self.normalize()
+        leaves: List[Filter] = []
+        indexes: Dict[tuple, int] = {}
+        occurrences = 0
+
+        def build(node):
+            nonlocal occurrences
+            if isinstance(node, Query):
+                return (
+                    node.connector == "OR",
+                    tuple(build(operand) for operand in node.filters),
+                )
+            occurrences += 1
+            signature = node.signature()
+            if signature not in indexes:
+                indexes[signature] = len(leaves)
+                leaves.append(node)
+            return indexes[signature]
+
+        tree = build(query)
+        if occurrences == len(leaves):
+            # Aucun filtre partagé : l'évaluation directe n'a rien à mémoriser.
+            return query.evaluate
+        return lambda obj: _evaluate_tree(tree, leaves, obj, {})
+
+
+def _evaluate_tree(
+    node: tuple, leaves: List[Filter], obj: Any, memo: Dict[int, bool]
+) -> bool:
+    """
+    Évalue un arbre compilé par `Query.compile` sur un objet.
+
+    Les feuilles sont des indices dans `leaves`, et leurs résultats sont conservés dans `memo`.
+    """
+    is_or, operands = node
+    for operand in operands:
+        if isinstance(operand, int):
+            if operand not in memo:
+                memo[operand] = bool(leaves[operand].evaluate(obj))
+            result = memo[operand]
+        else:
+            result = _evaluate_tree(operand, leaves, obj, memo)
+        if result is is_or:
+            return is_or
+    return not is_or
+
 
 class OrmCollection(ImprovedList):
     """
@@ -326,6 +572,137 @@ class OrmCollection(ImprovedList):
     #     items_repr = ", ".join([repr(item) for item in self])
     #     return f"OrmCollection([{items_repr}])"
 
+    _schema = None
+
+    @classmethod
+    def from_records(
+        cls, rows: Iterable, schema=None, compact: bool = False, intern: bool = False
+    ) -> "OrmCollection":
+        """
+        Create a collection from rows, given as mappings or as sequences of values.
+
+        Without a schema, each mapping is stored as an `ObjDict`, or with compact=True as a
+        compact record whose class is derived from the keys of the row: the rows with the same
+        keys share one record class, so each row only stores its values. With a schema, each row
+        is stored as a compact record (see `ObjDict.schema`), and sequences are matched to the
+        fields by position. If the schema declares types, the collection is validated against
+        them (see `validate_schema`).
+
+        Args:
+            rows (iterable): The rows of the collection.
+            schema (dict, iterable or Record class, optional): The fields of the rows, a mapping
+                of the fields to their type, or a record class.
+            compact (bool): Without a schema, store the mappings as records shared by the rows
+                of the same keys. The rows whose keys cannot be record fields (not identifiers,
+                or names such as 'keys' used by records) are stored as `ObjDict`.
+                Defaults to False.
+            intern (bool): Intern the keys and the short string values of the rows, so that the
+                rows share the repeated strings (see `imobject.interning`). Defaults to False.
+
+        Returns:
+            OrmCollection: A new collection holding the rows.
+
+        Raises:
+            TypeError: If a row does not match the schema.
+        """
+        from imobject.obj_dict import ObjDict  # pylint: disable=import-outside-toplevel
+
+        if intern:
+            rows = map(intern_row, rows)
+        clean_item = ObjDict._clean_item  # pylint: disable=protected-access
+        if schema is None:
+            if compact:
+                return cls._from_converted(records_by_shape(rows, ObjDict, clean_item))
+            return cls._from_converted(map(ObjDict, rows))
+        if isinstance(schema, type) and issubclass(schema, Record):
+            record_cls = schema
+        else:
+            record_cls = record_class(schema)
+        from_dict = record_cls.from_dict
+        collection = cls(
+            (
+                from_dict(row, clean_item)
+                if isinstance(row, Mapping)
+                else record_cls(*map(clean_item, row))
+            )
+            for row in rows
+        )
+        if record_cls._types:  # pylint: disable=protected-access
+            collection.validate_schema(
+                record_cls._types  # pylint: disable=protected-access
+            )
+        return collection
+
+    def validate_schema(self, schema: Dict[str, type]) -> "OrmCollection":
+        """
+        Checks once that the attributes of every object match the given types.
+
+        After a successful validation, `where` runs the comparisons on these attributes without
+        checking the type of each element, and the collections derived from this one (`where`,
+        `order_by`, `limit`, ...) keep the schema. Adding or replacing objects (`append`,
+        `extend`, `insert`, item assignment, `+=`) drops the schema, so the filters check the
+        types of every element again until the collection is validated anew.
+
+        Args:
+            schema (dict): A mapping of attribute names to their expected type.
+
+        Returns:
+            OrmCollection: The collection itself.
+
+        Raises:
+            TypeError: If an attribute of an object does not match its expected type.
+        """
+        fields = list(schema.items())
+        for elm in self:
+            for field, field_type in fields:
+                value = getattr(elm, field)
+                if not isinstance(value, field_type):
+                    raise TypeError(
+                        f"Invalid type for field '{field}' : expected {field_type.__name__}, found {type(value).__name__}"
+                    )
+        self._schema = dict(schema)
+        return self
+
+    def append(self, item):
+        """Append an item, dropping the validated schema."""
+        self._schema = None
+        super().append(item)
+
+    def extend(self, iterable: Iterable) -> None:
+        """Extend the collection with the elements of iterable, dropping the validated schema."""
+        self._schema = None
+        super().extend(iterable)
+
+    def insert(self, index: int, item: Any) -> None:
+        """Insert an item before index, dropping the validated schema."""
+        self._schema = None
+        super().insert(index, item)
+
+    def __setitem__(self, index, value):
+        """Set an item or a slice, dropping the validated schema."""
+        self._schema = None
+        super().__setitem__(index, value)
+
+    def _derive(self, data=()) -> "OrmCollection":
+        """Return a new collection of the same class holding data, keeping the validated schema."""
+        derived = self._from_converted(data)
+        derived._schema = self._schema  # pylint: disable=protected-access
+        return derived
+
+    def _is_trusted(self, attribute: str, operator: str, value: Any) -> bool:
+        """
+        Checks whether a filter can skip the per element type checks.
+
+        It is the case when the validated schema guarantees that every value of the attribute
+        passes the type check the operator would run.
+        """
+        if not self._schema or attribute not in self._schema:
+            return False
+        field_type = self._schema[attribute]
+        if operator in ("contains", "startswith", "endswith"):
+            return issubclass(field_type, str) and isinstance(value, str)
+        return issubclass(field_type, type(value))
+
     def where(self, *queries, **filters) -> "OrmCollection":
         """
         Filters the collection to only include objects that match the provided criteria.
@@ -354,22 +731,25 @@ class OrmCollection(ImprovedList):
                 attribute, operator = key.split("__")
                 if operator not in Filter.op_funcs:
                     raise ValueError(f"'{operator}' is not a valid operator")
-                filters_list.append(Filter(attribute, operator, value))
+                filters_list.append(
+                    Filter(
+                        attribute,
+                        operator,
+                        value,
+                        trusted=self._is_trusted(attribute, operator, value),
+                    )
+                )
             else:
                 filters_list.append(Filter(key, None, value))
 
         if not filters_list:
-            return self.__class__()
-
-        results = self.__class__()
+            return self._derive()
 
-        for elm in self:
-            if any(query.evaluate(elm) for query in queries) or all(
-                filt.evaluate(elm) for filt in filters_list
-            ):
-                results.append(elm)
-
-        return results
+        # An element matches if one of the queries matches, or if all the filters match. The
+        # filters of the queries appear in both branches, so the predicate is compiled to
+        # evaluate each of them once per element.
+        predicate = Query(list(queries) + [Query(filters_list, "AND")], "OR").compile()
+        return self._derive(filter(predicate, self))
 
     def find_by(self, **kwargs) -> object:
         """
@@ -395,13 +775,16 @@ class OrmCollection(ImprovedList):
             )
         return matching_objs.first()
 
-    def order_by(self, key=None, reverse=False):
+    def order_by(self, key=None, reverse=False, memoize=False, memo_key=None):
         """
         Sort the objects in the collection based on a field or a custom function.
 
         Args:
             key (str or function, optional): Field name or function to sort by. Defaults to None.
             reverse (bool, optional): True to sort in descending order, False to sort in ascending order. Defaults to False.
+            memoize (bool or int, optional): If True, a key function is computed once per distinct
+                object, as with `map(..., memoize=True)`; an int bounds the cache size.
+            memo_key (function, optional): A function giving the cache key of an object.
 
         Returns:
             A new OrmCollection containing the sorted objects.
@@ -412,12 +795,12 @@ class OrmCollection(ImprovedList):
         """
         if not key:
             if all(isinstance(item, (int, float)) for item in self):
-                return self.__class__(sorted(self))
+                return self._derive(sorted(self))
             if all(isinstance(item, str) for item in self):
-                return self.__class__(sorted(self, key=len))
+                return self._derive(sorted(self, key=len))
             raise ValueError("All elements in the list must be integers or floats.")
         if isinstance(key, str):
-            return self.__class__(
+            return self._derive(
                 sorted(
                     self,
                     key=lambda x: getattr(x, key),
@@ -425,15 +808,19 @@ class OrmCollection(ImprovedList):
                 )
             )
         if callable(key):
-            return self.__class__(sorted(self, key=key, reverse=reverse))
+            key = Memoized.wrap(key, memoize, memo_key)
+            return self._derive(sorted(self, key=key, reverse=reverse))
         raise TypeError("key must be a string attribute name or a function")
 
-    def group_by(self, key_func):
+    def group_by(self, key_func, memoize=False, memo_key=None):
         """
         Group the objects in the collection based on a given function.
 
         Args:
             key_func (function): A function that takes an object as input and returns the group key.
+            memoize (bool or int, optional): If True, key_func is computed once per distinct
+                object, as with `map(..., memoize=True)`; an int bounds the cache size.
+            memo_key (function, optional): A function giving the cache key of an object.
 
         Returns:
             A dictionary where the keys are the return values of the key function and
@@ -442,12 +829,14 @@ class OrmCollection(ImprovedList):
         Raises:
             N/A
         """
+        key_func = Memoized.wrap(key_func, memoize, memo_key)
         groups = {}
         for obj in self:
             key = key_func(obj)
             if key not in groups:
-                groups[key] = OrmCollection()
-            groups[key].append(obj)
+                groups[key] = self._derive()
+            # L'élément vient de la collection : le schéma validé reste valable
+            list.append(groups[key], obj)
         return groups
 
     def limit(self, count):
@@ -463,7 +852,7 @@ class OrmCollection(ImprovedList):
         Raises:
             N/A
         """
-        return self.__class__(self[:count])
+        return self._derive(self[:count])
 
     def offset(self, count):
         """
@@ -478,7 +867,7 @@ class OrmCollection(ImprovedList):
         Raises:
             N/A
         """
-        return self.__class__(self[count:])
+        return self._derive(self[count:])
 
     def all(self):
         """
@@ -493,7 +882,26 @@ class OrmCollection(ImprovedList):
         Raises:
             N/A
         """
-        return self.__class__(self)
+        return self._derive(self)
+
+    def to_json(self, fp=None, **kwargs):
+        """
+        Encode the objects of the collection to a JSON array.
+
+        The objects are encoded directly, without building plain copies of them first. Compact
+        records are encoded as JSON objects.
+
+        Args:
+            fp (file, optional): A text file the JSON document is written to. Defaults to None.
+            **kwargs: The arguments of `json.dumps` (indent, sort_keys, default...).
+
+        Returns:
+            str: The JSON document, or None if it is written to fp.
+
+        Raises:
+            TypeError: If an object cannot be encoded.
+        """
+        return to_json(self, fp, **kwargs)
 
     def _check_simple_type(self, lst):
         """
@@ -528,7 +936,7 @@ class OrmCollection(ImprovedList):
 
         # If no args are provided, return a new collection with unique elements
         if not args and self._check_simple_type(self):
-            return self.__class__(list(OrderedDict.fromkeys(self)))
+            return self._derive(list(OrderedDict.fromkeys(self)))
         if not args and not self._check_simple_type(self):
             raise ValueError("At least one field must be provided")
 
@@ -548,4 +956,101 @@ class OrmCollection(ImprovedList):
                 distinct_values.append(elm)
 
         # return self.__class__(list(dict.fromkeys(distinct_values)))
-        return self.__class__(distinct_values)
+        return self._derive(distinct_values)
+
+    def values_list(self, *fields: str, flat: bool = False) -> ImprovedList:
+        """
+        Return the values of the given attributes of each object, in a single pass.
+
+        Args:
+            *fields (str): The attribute names, or dotted paths such as 'address.city'.
+            flat (bool): With a single field, return its values instead of 1-tuples.
+                Defaults to False.
+
+        Returns:
+            ImprovedList: A tuple of values per object, or a value per object if flat is True.
+
+        Raises:
+            ValueError: If no field is given, or flat is True with several fields.
+            AttributeError: If an object has no such attribute.
+
+        Example usage:
+            >>> people.values_list("name", "age")  # doctest: +SKIP
+            [('Alice', 25), ('Bob', 40)]
+            >>> people.values_list("name", flat=True)  # doctest: +SKIP
+            ['Alice', 'Bob']
+        """
+        if not fields:
+            raise ValueError("At least one field must be provided")
+        if flat and len(fields) > 1:
+            raise ValueError("flat=True requires a single field")
+        getter = attrgetter(*fields) if flat else _tuple_getter(attrgetter, fields)
+        return ImprovedList._from_converted(map(getter, self))
+
+    def only(self, *fields: str) -> "OrmCollection":
+        """
+        Return a new OrmCollection of compact records holding only the given attributes.
+
+        The records share one record class (see `ObjDict.schema`) whose fields are the given
+        attributes; a dotted path such as 'address.city' gives the field 'address_city'.
+
+        Args:
+            *fields (str): The attribute names, or dotted paths.
+
+        Returns:
+            OrmCollection: A record per object, with the values of its attributes.
+
+        Raises:
+            ValueError: If no field is given, or a field cannot be a record field (see
+                `record_class`).
+            AttributeError: If an object has no such attribute.
+        """
+        if not fields:
+            raise ValueError("At least one field must be provided")
+        make = record_class(
+            [field.replace(".", "_") for field in fields], "Row"
+        )._make  # pylint: disable=protected-access
+        getter = _tuple_getter(attrgetter, fields)
+        return self._derive(map(make, map(getter, self)))
+
+    def select(self, wanted_keys: list) -> "OrmCollection":
+        """
+        Return a new OrmCollection where each object only keeps the given keys, as
+        `ObjDict.select` does for one object.
+
+        Args:
+            wanted_keys (list): The keys to keep.
+
+        Returns:
+            OrmCollection: An ObjDict per object, with the given keys in order.
+
+        Raises:
+            TypeError: If wanted_keys is not a list of strings.
+            KeyError: If an object has no such key.
+        """
+        if not isinstance(wanted_keys, list):
+            raise TypeError(
+                f"Argument 'wanted_keys' should be a list, "
+                f"got '{type(wanted_keys).__name__}' instead."
+            )
+        for key in wanted_keys:
+            if not isinstance(key, str):
+                raise TypeError(f"Element {key} in 'wanted_keys' list is not a string")
+        from imobject.obj_dict import (  # pylint: disable=import-outside-toplevel
+            ObjDict,
+        )
+
+        keys = tuple(wanted_keys)
+        getter = _tuple_getter(itemgetter, keys)
+        return self._derive(ObjDict(zip(keys, getter(obj))) for obj in self)
+
+
+def _tuple_getter(getter_class: type, fields: tuple) -> Callable[[Any], tuple]:
+    """
+    Return a getter of the fields (an attrgetter or itemgetter) which always returns a tuple,
+    even for a single field.
+    """
+    getter = getter_class(*fields)
+    if len(fields) == 1:
+        return lambda obj: (getter(obj),)
+    return getter
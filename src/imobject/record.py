@@ -0,0 +1,260 @@
+"""
+This module contains the `Record` class and the `record_class` factory, which generate compact
+record classes from a list of fields.
+
+A record stores its values in `__slots__` instead of a per instance dictionary, which makes it
+several times smaller than an `ObjDict` holding the same data. It still supports attribute access,
+access by key and `to_dict()`, so it can be used in an `OrmCollection` like an `ObjDict`.
+
+Example usage:
+
+    >>> Person = record_class({"name": str, "age": int}, name="Person")
+    >>> alice = Person("Alice", 25)
+    >>> alice.name
+    'Alice'
+    >>> alice["age"]
+    25
+    >>> alice.to_dict()
+    {'name': 'Alice', 'age': 25}
+
+"""
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+
+class Record:
+    """
+    Base class of the generated record classes.
+
+    The generated classes define one slot per field. Fields that are not given at construction
+    are set to None.
+
+    Attributes:
+        _fields (tuple): The names of the fields, in order.
+        _types (dict): The declared type of each field, if any.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+    _types: Dict[str, type] = {}
+    _key: Tuple = ()
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize a record from positional and/or keyword values.
+
+        Raises:
+            TypeError: If too many values or an unknown field are given.
+        """
+        if len(args) > len(self._fields):
+            raise TypeError(
+                f"{self.__class__.__name__} takes {len(self._fields)} values, got {len(args)}"
+            )
+        values = dict(zip(self._fields, args))
+        for field, value in kwargs.items():
+            if field not in self._field_set:
+                raise TypeError(
+                    f"{self.__class__.__name__} got an unexpected field '{field}'"
+                )
+            values[field] = value
+        for field in self._fields:
+            setattr(self, field, values.get(field))
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Any], convert: Optional[Callable[[Any], Any]] = None
+    ) -> "Record":
+        """
+        Create a record from a mapping.
+
+        Args:
+            data (Mapping): The values of the fields.
+            convert (callable, optional): A function applied to each value, e.g. to wrap nested
+                dicts and lists as `ObjDict` does.
+
+        Raises:
+            TypeError: If the mapping contains a key which is not a field of the record.
+        """
+        if not data.keys() <= cls._field_set:
+            unknown = sorted(str(key) for key in data.keys() - cls._field_set)
+            raise TypeError(f"{cls.__name__} got unexpected fields {unknown}")
+        record = cls.__new__(cls)
+        for field in cls._fields:
+            value = data.get(field)
+            setattr(record, field, value if convert is None else convert(value))
+        return record
+
+    def to_dict(self) -> dict:
+        """Return a dictionary representation of the record"""
+        return {field: getattr(self, field) for field in self._fields}
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the names of the fields"""
+        return self._fields
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a field, or default if the record has no such field"""
+        if key in self._field_set:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._field_set
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Record):
+            if self._fields != other._fields:
+                # Same fields in another order (e.g. rows of different shapes)
+                return self.to_dict() == other.to_dict()
+            return all(
+                getattr(self, field) == getattr(other, field) for field in self._fields
+            )
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._fields
+        )
+        return f"{self.__class__.__name__}({values})"
+
+    def __reduce__(self):
+        """Pickle the record through its fields, since its class is generated at runtime."""
+        return (
+            _restore_record,
+            (self._key, tuple(getattr(self, field) for field in self._fields)),
+        )
+
+
+_RECORD_CLASSES: Dict[Tuple, type] = {}
+_RESERVED_NAMES = frozenset(dir(Record)) | {"_make"}
+
+
+def record_class(
+    schema: Union[Mapping[str, Optional[type]], Iterable[str]], name: str = "Record"
+) -> type:
+    """
+    Return a record class with one slot per field of the schema.
+
+    The classes are cached, so the same schema always gives the same class.
+
+    Args:
+        schema (dict or iterable): The field names, or a mapping of the field names to their
+            type (None when the type is not declared).
+        name (str): The name of the generated class.
+
+    Returns:
+        type: A subclass of `Record`.
+
+    Raises:
+        ValueError: If a field name is not a valid identifier or is used by `Record` itself.
+    """
+    if isinstance(schema, Mapping):
+        fields = tuple(schema)
+        types = tuple(schema.values())
+    else:
+        fields = tuple(schema)
+        types = (None,) * len(fields)
+    key = (name, fields, types)
+    cls = _RECORD_CLASSES.get(key)
+    if cls is not None:
+        return cls
+    for field in fields:
+        if not isinstance(field, str) or not field.isidentifier():
+            raise ValueError(f"Invalid field name {field!r} : expected an identifier")
+        if field in _RESERVED_NAMES:
+            raise ValueError(f"Invalid field name '{field}' : reserved by Record")
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"Duplicate field names in {fields}")
+    cls = type(
+        name,
+        (Record,),
+        {
+            "__slots__": fields,
+            "_fields": fields,
+            "_field_set": frozenset(fields),
+            "_types": {
+                field: type_ for field, type_ in zip(fields, types) if type_ is not None
+            },
+            "_key": key,
+        },
+    )
+    cls._make = classmethod(_make_function(cls))
+    _RECORD_CLASSES[key] = cls
+    return cls
+
+
+def _make_function(cls: type):
+    """
+    Return a function creating a record of cls from exactly one value per field, in order.
+
+    The values are stored through the slot descriptors of the fields, looked up once, so that
+    each record is filled without a `setattr` lookup per field. The function raises ValueError
+    if the number of values differs from the number of fields.
+    """
+    setters = tuple(getattr(cls, field).__set__ for field in cls._fields)
+    count = len(setters)
+
+    def _make(record_cls, values):
+        if len(values) != count:
+            raise ValueError(
+                f"{record_cls.__name__} takes {count} values, got {len(values)}"
+            )
+        record = _new(record_cls)
+        for setter, value in zip(setters, values):
+            setter(record, value)
+        return record
+
+    return _make
+
+
+_new = object.__new__
+
+
+def records_by_shape(
+    rows: Iterable[Mapping],
+    fallback: Callable[[Mapping], Any],
+    convert: Callable[[Any], Any],
+):
+    """
+    Yield a compact record for each row, of a record class shared by the rows with the same
+    keys in the same order (their "shape").
+
+    The values are passed through convert (e.g. to wrap nested dicts and lists as `ObjDict`
+    does). The rows whose keys cannot be fields (not identifiers, or names used by `Record`)
+    are passed to fallback instead.
+    """
+    classes: Dict[Tuple, Any] = {}
+    for row in rows:
+        shape = tuple(row)
+        cls = classes.get(shape)
+        if cls is None:
+            try:
+                cls = record_class(shape, "Row")._make
+            except ValueError:
+                cls = fallback
+            classes[shape] = cls
+        if cls is fallback:
+            yield fallback(row)
+        else:
+            yield cls(list(map(convert, row.values())))
+
+
+def _restore_record(key: Tuple, values: Tuple) -> Record:
+    """Rebuild a pickled record."""
+    name, fields, types = key
+    return record_class(dict(zip(fields, types)), name)(*values)
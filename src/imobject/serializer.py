@@ -0,0 +1,322 @@
+"""
+This module contains the functions which serialize `ObjDict` and `OrmCollection` objects to
+plain Python objects and to JSON.
+
+`to_plain` converts the nested dictionaries (`ObjDict` and compact records included) and lists
+(`ImprovedList` and `OrmCollection` included) to plain `dict` and `list`, at any depth,
+including inside tuples. It walks the tree with an explicit stack, so deep trees do not hit the recursion
+limit, and converts an object referenced several times only once: the shared references, and
+the cycles, are kept in the result.
+
+`to_json` encodes the objects directly, reading their dictionaries and lists as stored, without
+building the plain copy first, and can write the document to a file as it is encoded. The
+compact records and `FrozenObjDict` values are encoded as JSON objects.
+
+Example usage:
+
+    >>> to_plain(ObjDict({"people": OrmCollection([{"name": "Alice"}])}))  # doctest: +SKIP
+    {'people': [{'name': 'Alice'}]}
+    >>> to_json(collection, response)  # doctest: +SKIP
+
+"""
+import json
+from collections.abc import Mapping
+from functools import partial
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from imobject.frozen_obj_dict import FrozenObjDict
+from imobject.record import Record
+
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Return a copy of value where the dictionaries and records are plain `dict`, the lists are
+    plain `list`, and the tuples are tuples of converted values.
+
+    The other values (strings, numbers, FrozenObjDict...) are kept as they are.
+    """
+    memo = {}
+    pending: List[Tuple[Any, Optional[Iterable], Iterable]] = []
+
+    def convert(item: Any) -> Any:
+        if item.__class__ in _SCALARS:
+            return item
+        if isinstance(item, dict):
+            result = memo.get(id(item))
+            if result is None:
+                if _SCALARS.issuperset(map(type, dict.values(item))):
+                    result = memo[id(item)] = dict(dict.items(item))
+                else:
+                    result = memo[id(item)] = {}
+                    pending.append((result, dict.keys(item), dict.values(item)))
+            return result
+        if isinstance(item, list):
+            result = memo.get(id(item))
+            if result is None:
+                # list.__iter__ reads the elements as stored, without the conversions of
+                # ImprovedList.
+                if _SCALARS.issuperset(map(type, list.__iter__(item))):
+                    result = memo[id(item)] = list(list.__iter__(item))
+                else:
+                    result = memo[id(item)] = []
+                    pending.append((result, None, list.__iter__(item)))
+            return result
+        if isinstance(item, tuple):
+            result = memo.get(id(item))
+            if result is None:
+                if _SCALARS.issuperset(map(type, item)):
+                    result = item
+                else:
+                    # The dicts and lists of the tuple are filled later: only nested tuples
+                    # are converted recursively.
+                    result = tuple(map(convert, item))
+                memo[id(item)] = result
+            return result
+        if isinstance(item, Record):
+            result = memo.get(id(item))
+            if result is None:
+                result = memo[id(item)] = {}
+                fields = item._fields  # pylint: disable=protected-access
+                pending.append((result, fields, map(partial(getattr, item), fields)))
+            return result
+        return item
+
+    result = convert(value)
+    while pending:
+        target, keys, values = pending.pop()
+        if keys is None:
+            target.extend(map(convert, values))
+        else:
+            target.update(zip(keys, map(convert, values)))
+    return result
+
+
+def _json_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Return the `default` function of the JSON encoder, which encodes the records."""
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, (Record, FrozenObjDict)):
+            return value.to_dict()
+        if isinstance(value, Mapping):
+            return dict(value)
+        if default is not None:
+            return default(value)
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+
+    return encode
+
+
+_BATCH_SIZE = 1024
+_NOT_PLAIN = object()
+
+
+def _plain(value: Any) -> Any:
+    """
+    Return value as the C encoder can read it without the conversions of `ObjDict`: the value
+    itself for a scalar or a list of scalars, a dict for a dict of scalars, else _NOT_PLAIN.
+    """
+    if value.__class__ in _SCALARS:
+        return value
+    if isinstance(value, dict):
+        if _SCALARS.issuperset(map(type, dict.values(value))):
+            return value if value.__class__ is dict else dict(dict.items(value))
+    elif isinstance(value, list):
+        if _SCALARS.issuperset(map(type, list.__iter__(value))):
+            return value
+    return _NOT_PLAIN
+
+
+def _key_text(key: Any, encoder: json.JSONEncoder) -> Optional[str]:
+    """
+    Return the JSON object key of a dict key, as `json.dumps` does, or None to skip it.
+
+    Raises:
+        TypeError: If the key cannot be encoded and encoder.skipkeys is False.
+    """
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float):
+        return encoder.encode(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if encoder.skipkeys:
+        return None
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    )
+
+
+def _iterencode(value: Any, encoder: json.JSONEncoder) -> Iterator[str]:
+    """
+    Yield the JSON document of value in chunks.
+
+    The dictionaries and lists are read as stored (`dict.items`, `list.__iter__`): `ObjDict`
+    values are neither converted nor stored back, as `json.dumps` does through `ObjDict.items`.
+    The dictionaries and lists of scalars are encoded in one call to the C encoder.
+    """
+    indent = encoder.indent
+    if indent is not None and not isinstance(indent, str):
+        indent = " " * indent
+    item_separator, key_separator = encoder.item_separator, encoder.key_separator
+    encode = encoder.encode
+    encode_string = (
+        json.encoder.encode_basestring_ascii
+        if encoder.ensure_ascii
+        else json.encoder.encode_basestring
+    )
+    markers: Optional[dict] = {} if encoder.check_circular else None
+
+    def encode_plain(item: Any, level: int) -> str:
+        text = encode(item)
+        if indent is not None and level:
+            # The strings of a JSON document contain no raw newline.
+            text = text.replace("\n", "\n" + indent * level)
+        return text
+
+    def walk(item: Any, level: int) -> Iterator[str]:
+        if isinstance(item, str):
+            yield encode_string(item)
+            return
+        if item is None or item is True or item is False or isinstance(item, float):
+            yield encode(item)
+            return
+        if isinstance(item, int):
+            yield int.__repr__(item)
+            return
+        if isinstance(item, dict):
+            if _SCALARS.issuperset(map(type, dict.values(item))):
+                if item.__class__ is not dict:
+                    item = dict(dict.items(item))
+                yield encode_plain(item, level)
+                return
+            items: Optional[Iterable] = dict.items(item)
+            elements = None
+        elif isinstance(item, (list, tuple)):
+            # list.__iter__ reads the elements as stored, without the conversions of
+            # ImprovedList.
+            elements = list.__iter__(item) if isinstance(item, list) else iter(item)
+            if _SCALARS.issuperset(map(type, elements)):
+                yield encode_plain(item, level)
+                return
+            elements = list.__iter__(item) if isinstance(item, list) else iter(item)
+            items = None
+        else:
+            if markers is not None:
+                if id(item) in markers:
+                    raise ValueError("Circular reference detected")
+                markers[id(item)] = item
+            yield from walk(encoder.default(item), level)
+            if markers is not None:
+                del markers[id(item)]
+            return
+
+        if not item:
+            yield "{}" if items is not None else "[]"
+            return
+        if markers is not None:
+            if id(item) in markers:
+                raise ValueError("Circular reference detected")
+            markers[id(item)] = item
+        if indent is None:
+            newline, separator = "", item_separator
+        else:
+            level += 1
+            newline = "\n" + indent * level
+            separator = item_separator + newline
+        if items is None:
+            yield "[" + newline
+            if indent is None:
+                yield from walk_compact_elements(elements, level)
+            else:
+                for index, element in enumerate(elements):
+                    if index:
+                        yield separator
+                    yield from walk(element, level)
+            closing = "]"
+        else:
+            yield "{" + newline
+            if encoder.sort_keys:
+                items = sorted(items, key=itemgetter(0))
+            first = True
+            for key, element in items:
+                key = _key_text(key, encoder)
+                if key is None:
+                    continue
+                if not first:
+                    yield separator
+                first = False
+                yield encode_string(key) + key_separator
+                yield from walk(element, level)
+            closing = "}"
+        if indent is not None:
+            yield "\n" + indent * (level - 1)
+        yield closing
+        if markers is not None:
+            del markers[id(item)]
+
+    def walk_compact_elements(elements: Iterable, level: int) -> Iterator[str]:
+        # Without indent, the runs of plain elements (scalars, and dicts or lists of scalars)
+        # are encoded together, in one call to the C encoder per _BATCH_SIZE elements.
+        batch: list = []
+        first = True
+        for element in elements:
+            plain = _plain(element)
+            if plain is not _NOT_PLAIN:
+                batch.append(plain)
+                if len(batch) < _BATCH_SIZE:
+                    continue
+            if batch:
+                text = encode(batch)[1:-1]
+                yield text if first else item_separator + text
+                batch, first = [], False
+            if plain is _NOT_PLAIN:
+                if not first:
+                    yield item_separator
+                first = False
+                yield from walk(element, level)
+        if batch:
+            text = encode(batch)[1:-1]
+            yield text if first else item_separator + text
+
+    return walk(value, 0)
+
+
+def to_json(value: Any, fp=None, **kwargs) -> Optional[str]:
+    """
+    Encode value to JSON.
+
+    The dictionaries and lists are read as stored, so encoding an `ObjDict` neither converts
+    nor changes its nested values, and no plain copy of the tree is built. With fp, the
+    document is written to the file in chunks, as it is encoded.
+
+    Args:
+        value: The object to encode.
+        fp (file, optional): A text file the JSON document is written to. Defaults to None.
+        **kwargs: The arguments of `json.dumps` (indent, sort_keys, default, cls...).
+
+    Returns:
+        str: The JSON document, or None if it is written to fp.
+
+    Raises:
+        TypeError: If a value cannot be encoded.
+        ValueError: If value contains a cycle.
+    """
+    cls = kwargs.pop("cls", None) or json.JSONEncoder
+    kwargs["default"] = _json_default(kwargs.get("default"))
+    chunks = _iterencode(value, cls(**kwargs))
+    if fp is None:
+        return "".join(chunks)
+    for chunk in chunks:
+        fp.write(chunk)
+    return None
@@ -0,0 +1,263 @@
+"""
+This module contains the `ShardedOrmCollection` class, which spreads a collection of objects over
+local worker processes.
+
+The objects are partitioned by key into shards. Each shard is pickled into a
+`multiprocessing.shared_memory` segment, which is only a transfer buffer: the worker process
+which owns the shard unpickles its own copy of it, and the segment is then released. The
+`where`, `count` and `aggregate` calls, with their queries and filters, are pickled to every
+worker, run on each shard in parallel, and their results are merged.
+
+Once the workers are started, the parent process drops its partitions, so the shards are held
+by the workers only. When the collection is created before forking (for example in a gunicorn
+application loaded with `--preload`), the forked processes query the same workers, but only the
+process which created the collection stops them on `close`.
+
+Example usage:
+
+    >>> with ShardedOrmCollection(people, key="name", shards=4) as sharded:
+    ...     adults = sharded.where(age__gte=18)
+    ...     total = sharded.count(gender="female")
+
+"""
+
+import multiprocessing
+import os
+import pickle
+from collections.abc import Iterator
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterable, List, Union
+
+from imobject.orm_collection import OrmCollection
+
+
+def _where(shard: OrmCollection, queries: tuple, filters: dict) -> OrmCollection:
+    """Return the objects of a shard matching the queries and filters."""
+    return shard.where(*queries, **filters)
+
+
+def _count(shard: OrmCollection, queries: tuple, filters: dict) -> int:
+    """Return the number of objects of a shard matching the queries and filters."""
+    if not queries and not filters:
+        return len(shard)
+    return len(shard.where(*queries, **filters))
+
+
+def _aggregate(
+    shard: OrmCollection, func: Callable, queries: tuple, filters: dict
+) -> Any:
+    """Apply func to the objects of a shard matching the queries and filters."""
+    if queries or filters:
+        shard = shard.where(*queries, **filters)
+    return func(shard)
+
+
+def _materialize(filters: dict) -> dict:
+    """Return the filters with their iterator values turned into tuples, so they can be pickled."""
+    return {
+        name: tuple(value) if isinstance(value, Iterator) else value
+        for name, value in filters.items()
+    }
+
+
+def _shard_worker(segment_name: str, connection) -> None:
+    """
+    Load a shard from its shared memory segment and answer the requests sent on connection.
+
+    Once the shard is loaded, its size is sent on connection. A request is then a tuple
+    `(function, args)`, answered with `(True, function(shard, *args))`, or `(False, exception)` if
+    the call failed. None stops the worker.
+    """
+    segment = shared_memory.SharedMemory(name=segment_name)
+    try:
+        shard = pickle.loads(segment.buf)
+    finally:
+        segment.close()
+    connection.send(len(shard))
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        function, args = request
+        try:
+            connection.send((True, function(shard, *args)))
+        except Exception as exc:  # pylint: disable=broad-except
+            connection.send((False, exc))
+    connection.close()
+
+
+class ShardedOrmCollection:
+    """
+    A collection partitioned by key across worker processes.
+
+    Attributes:
+        key (str or callable): The attribute name, or the function, giving the partition key
+            of an object.
+        shards (int): The number of shards, and of worker processes.
+
+    Methods:
+        where: Return the objects matching the given queries and filters.
+        count: Return the number of objects matching the given queries and filters.
+        aggregate: Apply a function to each shard and combine the partial results.
+        close: Stop the workers.
+    """
+
+    def __init__(
+        self,
+        data: Iterable,
+        key: Union[str, Callable[[Any], Any]],
+        shards: int = 2,
+        context=None,
+    ):
+        """
+        Partition the data and start one worker process per shard.
+
+        Args:
+            data (iterable): The objects of the collection. They must be picklable.
+            key (str or callable): The attribute name, or the function, giving the partition key
+                of an object.
+            shards (int): The number of shards. Defaults to 2.
+            context (multiprocessing context, optional): The context used to create the workers.
+                Defaults to the default multiprocessing context.
+
+        Raises:
+            ValueError: If shards is lower than 1.
+        """
+        if shards < 1:
+            raise ValueError("shards must be greater than or equal to 1")
+        self.key = key
+        self.shards = shards
+        self._owner_pid = os.getpid()
+        context = context or multiprocessing.get_context()
+        key_func = (lambda obj: getattr(obj, key)) if isinstance(key, str) else key
+        partitions: List[OrmCollection] = [OrmCollection() for _ in range(shards)]
+        for obj in data:
+            partitions[hash(key_func(obj)) % shards].append(obj)
+        self._sizes = [len(partition) for partition in partitions]
+
+        self._segments = []
+        self._connections = []
+        self._locks = []
+        self._workers = []
+        try:
+            for index in range(shards):
+                payload = pickle.dumps(partitions[index], pickle.HIGHEST_PROTOCOL)
+                partitions[index] = None
+                segment = shared_memory.SharedMemory(create=True, size=len(payload))
+                segment.buf[: len(payload)] = payload
+                self._segments.append(segment)
+                parent_connection, child_connection = context.Pipe()
+                worker = context.Process(
+                    target=_shard_worker,
+                    args=(segment.name, child_connection),
+                    daemon=True,
+                )
+                worker.start()
+                child_connection.close()
+                self._connections.append(parent_connection)
+                self._locks.append(context.Lock())
+                self._workers.append(worker)
+            # The workers hold their own copy of the shards, the segments are no longer needed.
+            for connection in self._connections:
+                connection.recv()
+            self._release_segments()
+        except Exception:
+            self.close()
+            raise
+
+    def _release_segments(self) -> None:
+        """Release the shared memory segments used to hand the shards over to the workers."""
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+    def _scatter(self, function: Callable, *args) -> list:
+        """Run function on every shard in parallel and return the results in shard order."""
+        if not self._workers:
+            raise ValueError(f"{self.__class__.__name__} is closed")
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            for connection in self._connections:
+                connection.send((function, args))
+            replies = [connection.recv() for connection in self._connections]
+        finally:
+            for lock in self._locks:
+                lock.release()
+        for success, result in replies:
+            if not success:
+                raise result
+        return [result for _, result in replies]
+
+    def where(self, *queries, **filters) -> OrmCollection:
+        """
+        Return the objects matching the queries and filters, as `OrmCollection.where` does.
+
+        The objects are returned shard by shard, so their order differs from the original one.
+        """
+        results = OrmCollection()
+        for part in self._scatter(_where, queries, _materialize(filters)):
+            results.extend(part)
+        return results
+
+    def count(self, *queries, **filters) -> int:
+        """Return the number of objects matching the queries and filters, or of all objects."""
+        return sum(self._scatter(_count, queries, _materialize(filters)))
+
+    def aggregate(
+        self,
+        func: Callable[[OrmCollection], Any],
+        *queries,
+        combine: Callable[[list], Any] = sum,
+        **filters,
+    ) -> Any:
+        """
+        Apply func to each shard and combine the partial results.
+
+        Args:
+            func (callable): A picklable function called with the `OrmCollection` of each shard,
+                restricted to the objects matching the queries and filters if any.
+            *queries (Query): Query objects restricting the objects passed to func.
+            combine (callable): A function called with the list of partial results. Defaults to sum.
+            **filters: Key-value pairs restricting the objects passed to func.
+
+        Returns:
+            The combined result.
+        """
+        return combine(self._scatter(_aggregate, func, queries, _materialize(filters)))
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared memory segments if any.
+
+        In a process forked after the collection was created, only the inherited connections are
+        closed: the workers keep serving the process which created the collection.
+        """
+        if os.getpid() != self._owner_pid:
+            for connection in self._connections:
+                connection.close()
+            self._segments = []
+            self._connections, self._locks, self._workers = [], [], []
+            return
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._release_segments()
+        self._connections, self._locks, self._workers = [], [], []
+
+    def __enter__(self) -> "ShardedOrmCollection":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,159 @@
+"""
+Module test_frozen_obj_dict.py - Test suite for the FrozenObjDict module.
+
+This module contains unit tests for the FrozenObjDict implementation.
+
+Functions:
+
+  describe_frozen_obj_dict(): Function to test the access, versioning and hashing of
+                              FrozenObjDict.
+
+To run the tests, simply execute this module as a script, e.g.,
+with the command `python -m pytest test_frozen_obj_dict.py`.
+The tests will be discovered and run automatically by the Pytest testing framework.
+"""
+import pickle
+import random
+import pytest
+from imobject import FrozenObjDict, ObjDict
+
+
+class CollidingKey:
+    """Key whose hash collides with the hash of other keys"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 3
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.value == self.value
+
+    def __repr__(self):
+        return f"CollidingKey({self.value})"
+
+
+def describe_frozen_obj_dict():
+    """Function to test all functions for FrozenObjDict class."""
+
+    @pytest.fixture
+    def config():
+        return FrozenObjDict(
+            {"db": {"host": "localhost", "ports": [5432, 5433]}, "debug": False}
+        )
+
+    def test_access(config):  # pylint: disable=unused-variable
+        assert config.db.host == "localhost"
+        assert config["db"]["ports"] == (5432, 5433)
+        assert config.get("missing", 1) == 1
+        assert "debug" in config
+        assert len(config) == 2
+        assert sorted(config) == ["db", "debug"]
+        with pytest.raises(KeyError):
+            config["missing"]  # pylint: disable=pointless-statement
+        with pytest.raises(AttributeError):
+            config.missing  # pylint: disable=pointless-statement
+
+    def test_immutable(config):  # pylint: disable=unused-variable
+        with pytest.raises(AttributeError, match="immutable"):
+            config.debug = True
+        with pytest.raises(AttributeError, match="immutable"):
+            del config.debug
+        with pytest.raises(TypeError):
+            config["debug"] = True  # pylint: disable=unsupported-assignment-operation
+
+    def test_versions(config):  # pylint: disable=unused-variable
+        updated = config.set("debug", True)
+        assert updated.debug is True
+        assert config.debug is False
+        assert updated.db is config.db
+        assert config.set("debug", False) is config
+        removed = updated.delete("debug")
+        assert removed == {"db": config.db}
+        assert "debug" in updated
+        with pytest.raises(KeyError):
+            removed.delete("debug")
+        assert config.update({"a": 1}, b=2).to_dict() == {
+            "db": {"host": "localhost", "ports": [5432, 5433]},
+            "debug": False,
+            "a": 1,
+            "b": 2,
+        }
+
+    def test_set_in(config):  # pylint: disable=unused-variable
+        updated = config.set_in(("db", "host"), "remote")
+        assert updated.db.host == "remote"
+        assert config.db.host == "localhost"
+        assert updated.db.ports is config.db.ports
+        assert updated.set_in(["cache", "ttl"], 60).cache.ttl == 60
+        with pytest.raises(ValueError):
+            config.set_in((), 1)
+
+    def test_hash_and_equality(config):  # pylint: disable=unused-variable
+        same = FrozenObjDict(
+            debug=False, db={"ports": (5432, 5433), "host": "localhost"}
+        )
+        assert same == config
+        assert hash(same) == hash(config)
+        assert {config: "v1"}[same] == "v1"
+        assert config == {
+            "db": {"host": "localhost", "ports": (5432, 5433)},
+            "debug": False,
+        }
+        assert config != config.set("debug", True)
+        assert pickle.loads(pickle.dumps(config)) == config
+
+    def test_equality_with_lists():  # pylint: disable=unused-variable
+        data = {"a": [1, {"b": [2, 3]}], "c": {"d": [4]}}
+        assert FrozenObjDict(data) == data
+        assert FrozenObjDict(data) == ObjDict(data)
+        assert FrozenObjDict(data) != {"a": [1, {"b": [2]}], "c": {"d": [4]}}
+
+    def test_insertion_order():  # pylint: disable=unused-variable
+        keys = [f"key{index}" for index in range(40, 0, -1)]
+        frozen = FrozenObjDict(zip(keys, range(40)))
+        assert list(frozen) == keys
+        updated = frozen.set("key40", -1).delete("key20").set("key20", 0).set("new", 1)
+        expected = [key for key in keys if key != "key20"] + ["key20", "new"]
+        assert list(updated) == expected
+        assert list(updated.to_dict()) == expected
+        assert list(updated.thaw()) == expected
+        assert list(pickle.loads(pickle.dumps(updated))) == expected
+        assert list(frozen) == keys
+
+    def test_freeze_and_thaw():  # pylint: disable=unused-variable
+        obj = ObjDict({"a": {"b": [1, {"c": 2}]}})
+        frozen = obj.freeze()
+        assert isinstance(frozen.a.b[1], FrozenObjDict)
+        thawed = frozen.thaw()
+        assert isinstance(thawed, ObjDict)
+        assert thawed.to_dict() == {"a": {"b": [1, {"c": 2}]}}
+
+    def test_matches_dict():  # pylint: disable=unused-variable
+        rng = random.Random(42)
+        frozen, expected, versions = FrozenObjDict(), {}, []
+        for step in range(5000):
+            key = rng.choice(
+                [
+                    rng.randrange(300),
+                    f"key{rng.randrange(200)}",
+                    CollidingKey(rng.randrange(20)),
+                ]
+            )
+            if key in expected and rng.random() < 0.4:
+                frozen = frozen.delete(key)
+                del expected[key]
+            else:
+                frozen = frozen.set(key, step)
+                expected[key] = step
+            if step % 500 == 0:
+                versions.append((frozen, dict(expected)))
+        assert frozen == expected
+        assert len(frozen) == len(expected)
+        for version, version_expected in versions:
+            assert version == version_expected
+        for key in list(expected):
+            frozen = frozen.delete(key)
+        assert len(frozen) == 0
+        assert not list(frozen)
@@ -16,11 +16,14 @@ The tests will be discovered and run automatically by the Pytest testing framewo
 This module requires the following external libraries to be installed:
 -
 """
+import asyncio
+import pickle
 import sys
 from datetime import datetime
 from io import StringIO
+from unittest import mock
 import pytest
-from imobject import ImprovedList
+from imobject import ImprovedList, ObjDict, OrmCollection
 
 
 def describe_inspect():
@@ -81,6 +84,13 @@ def describe_inspect():
             == "ImprovedList(Inspectable) data:\nInspectable(element1)\nInspectable(element2)\n"
         )  # la chaîne de caractères attendue pour la sortie de la méthode
 
+    def test_inspect_obj_dict(capsys):  # pylint: disable=unused-variable
+        # ObjDict.inspect is a property which prints the element: it is printed once
+        lst = ImprovedList([ObjDict({"a": 1}), ObjDict({"b": 2})])
+        lst.inspect  # pylint: disable=pointless-statement
+        expected_output = "ImprovedList(ObjDict) data:\n{'a': 1}\n{'b': 2}\n"
+        assert capsys.readouterr().out == expected_output
+
 
 def describe_fist():
     """Describe fist() function of ImprovedList"""
@@ -492,6 +502,30 @@ def describe_map():  # pylint: disable=too-many-statements
         result = my_list.map(lambda x: x**2, max_elements=3, reverse_order=True)
         assert result == [9, 4, 1]
 
+    @pytest.mark.parametrize(
+        "max_elements, reverse_order, expected_output",
+        [
+            pytest.param(3, False, [1, 2, 3], id="head"),
+            pytest.param(-2, False, [1, 2, 3], id="negative_head"),
+            pytest.param(-2, True, [3, 2, 1], id="negative_head_reversed"),
+            pytest.param(0, True, [], id="empty_head_reversed"),
+            pytest.param(10, True, [5, 4, 3, 2, 1], id="head_larger_than_list"),
+        ],
+    )
+    def test_map_selection(max_elements, reverse_order, expected_output):
+        my_list = ImprovedList([1, 2, 3, 4, 5])
+        result = my_list.map(
+            lambda x: x, max_elements=max_elements, reverse_order=reverse_order
+        )
+        assert result == expected_output
+
+    def test_map_sort_reversed():  # pylint: disable=unused-variable
+        my_list = ImprovedList(["bb", "a", "dddd", "ccc", "e"])
+        result = my_list.map(":upper", sort_func=len, reverse_order=True)
+        assert result == ["DDDD", "CCC", "BB", "A", "E"]
+        result = my_list.map(":upper", sort_func=len, max_elements=3)
+        assert result == ["A", "BB", "DDDD"]
+
     def test_map_sort():  # pylint: disable=unused-variable
         class MyClass:  # pylint: disable=too-few-public-methods
             """class for test"""
@@ -518,3 +552,449 @@ def describe_map():  # pylint: disable=too-many-statements
         # liste triée des noms d'objets MyClass
         sorted_names = objects.map(called=lambda obj: obj.name, sort_func=sort_by_date)
         assert sorted_names == ["Obj3", "Obj1", "Obj4", "Obj2"]
+
+
+def describe_map_resolvers():
+    """Describe the per type resolution of ':method' and '.attr' specs of map()"""
+
+    def test_map_mixed_types(person_class):  # pylint: disable=unused-variable
+        lst = ImprovedList(["a", b"c", "d"])
+        assert lst.map(":upper") == ["A", b"C", "D"]
+        lst.append(person_class("Bob", 30, 10))
+        with pytest.raises(AttributeError):
+            lst.map(":upper")
+
+    def test_map_instance_attribute_shadows_method(person_class):  # pylint: disable=unused-variable
+        shadowed = person_class("Alice", 25, 100)
+        shadowed.get_name = lambda: "shadowed"
+        lst = ImprovedList([person_class("Bob", 30, 10), shadowed])
+        assert lst.map(":get_name") == ["Bob", "shadowed"]
+
+    def test_map_custom_getattribute():  # pylint: disable=unused-variable
+        class Proxy:  # pylint: disable=too-few-public-methods
+            """Class redirecting every attribute lookup"""
+
+            def __getattribute__(self, name):
+                return lambda: name
+
+            def hello(self):  # pylint: disable=no-self-use
+                """Method hidden by __getattribute__"""
+                return "method"
+
+        assert ImprovedList([Proxy()]).map(":hello") == ["hello"]
+        assert ImprovedList([int, str]).map(".__name__") == ["int", "str"]
+        assert ImprovedList([int]).map(":mro") == [[int, object]]
+
+    def test_map_sees_patched_class(person_class):  # pylint: disable=unused-variable
+        lst = ImprovedList([person_class("Bob", 30, 10)])
+        assert lst.map(":get_name") == ["Bob"]
+        with mock.patch.object(person_class, "get_name", lambda self: "patched"):
+            assert lst.map(":get_name") == ["patched"]
+            assert lst.map(":get_name", memoize=True) == ["patched"]
+        assert lst.map(":get_name") == ["Bob"]
+        with mock.patch.object(
+            person_class, "name", property(lambda self: "property"), create=True
+        ):
+            assert lst.map(".name") == ["property"]
+        assert lst.map(".name") == ["Bob"]
+
+
+def describe_parallel_map():
+    """Describe map() function of ImprovedList with an executor"""
+
+    @pytest.mark.parametrize(
+        "executor, called, expected_output",
+        [
+            pytest.param("thread", ":upper", ["A", "B", "C", "D"], id="thread_method"),
+            pytest.param("thread", str.lower, ["a", "b", "c", "d"], id="thread_callable"),
+            pytest.param("process", ":lower", ["a", "b", "c", "d"], id="process_method"),
+            pytest.param("process", len, [1, 1, 1, 1], id="process_callable"),
+        ],
+    )
+    def test_map_executor(executor, called, expected_output):
+        lst = ImprovedList(["A", "b", "C", "d"])
+        result = lst.map(called, executor=executor, workers=2, chunksize=2)
+        assert isinstance(result, ImprovedList)
+        assert result == expected_output
+
+    def test_map_executor_unordered(person_class):  # pylint: disable=unused-variable
+        people = ImprovedList(
+            [person_class(name, age, 0) for name, age in [("Alice", 25), ("Bob", 12)]]
+            * 5
+        )
+        result = people.map(
+            ":get_name",
+            executor="thread",
+            ordered=False,
+            filter_func=lambda person: person.age > 18,
+            return_type="list",
+        )
+        assert result == ["Alice"] * 5
+
+    def test_map_executor_errors():  # pylint: disable=unused-variable
+        lst = ImprovedList([1, 2, 3])
+        with pytest.raises(ValueError, match="executor must be 'thread' or 'process'"):
+            lst.map(str, executor="gpu")
+        with pytest.raises(AttributeError):
+            lst.map(".unknown", executor="thread")
+
+
+def describe_conversion():
+    """Describe the conversion of dictionaries to ObjDict by ImprovedList"""
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            pytest.param(lambda lst: lst.append({"a": 1}), id="append"),
+            pytest.param(lambda lst: lst.extend([{"a": 1}]), id="extend"),
+            pytest.param(lambda lst: lst.insert(0, {"a": 1}), id="insert"),
+            pytest.param(lambda lst: lst.__setitem__(0, {"a": 1}), id="setitem"),
+            pytest.param(
+                lambda lst: lst.__setitem__(slice(0, 1), [{"a": 1}]), id="set_slice"
+            ),
+            pytest.param(lambda lst: lst.__iadd__([{"a": 1}]), id="iadd"),
+        ],
+    )
+    def test_mutators_convert(mutate):  # pylint: disable=unused-variable
+        lst = ImprovedList([0])
+        mutate(lst)
+        converted = [item for item in lst if item != 0]
+        assert converted == [{"a": 1}]
+        assert isinstance(converted[0], ObjDict)
+
+    def test_constructor_converts():  # pylint: disable=unused-variable
+        obj = ObjDict({"a": 2})
+        lst = OrmCollection([{"a": 1}, obj, 3, [{"b": 1}]])
+        assert isinstance(lst[0], ObjDict)
+        assert lst[1] is obj
+        assert lst[2:] == [3, [{"b": 1}]]
+        assert OrmCollection([{"a": 1}, {"a": 2}]).where(a=1) == [{"a": 1}]
+
+    def test_lazy_batched_map():  # pylint: disable=unused-variable
+        lst = OrmCollection([{"a": 1}, {"a": 2}], lazy=True)
+        batches = lst.batched_map(lambda batch: batch, 1)
+        assert all(isinstance(item, ObjDict) for item in batches)
+
+    def test_lazy_conversion():  # pylint: disable=unused-variable
+        row = {"a": 1}
+        lst = OrmCollection([row, 2], lazy=True)
+        assert len(lst) == 2
+        assert list.__getitem__(lst, 0) is row
+        assert lst[0].a == 1
+        assert type(lst) is OrmCollection  # pylint: disable=unidiomatic-typecheck
+        assert list.__getitem__(lst, 0) is not row
+
+    @pytest.mark.parametrize(
+        "access",
+        [
+            pytest.param(list, id="iter"),
+            pytest.param(lambda lst: {"a": 1} in lst, id="contains"),
+            pytest.param(lambda lst: lst == [], id="eq"),
+            pytest.param(lambda lst: lst.where(a=1), id="method"),
+            pytest.param(lambda lst: pickle.loads(pickle.dumps(lst)), id="pickle"),
+            pytest.param(
+                lambda lst: ImprovedList.batched_map(lst, list, 1), id="batched_map"
+            ),
+        ],
+    )
+    def test_lazy_first_access(access):  # pylint: disable=unused-variable
+        lst = OrmCollection([{"a": 1}], lazy=True)
+        access(lst)
+        assert type(lst) is OrmCollection  # pylint: disable=unidiomatic-typecheck
+        assert isinstance(list.__getitem__(lst, 0), ObjDict)
+
+
+def describe_concat():
+    """Describe + and concat() of ImprovedList"""
+
+    def test_add():  # pylint: disable=unused-variable
+        left = OrmCollection([{"a": 1}])
+        result = left + [{"a": 2}]
+        assert type(result) is OrmCollection  # pylint: disable=unidiomatic-typecheck
+        assert result == [{"a": 1}, {"a": 2}]
+        assert isinstance(result[1], ObjDict)
+        assert left == [{"a": 1}]
+
+    def test_iadd_keeps_identity():  # pylint: disable=unused-variable
+        merged = ImprovedList()
+        alias = merged
+        for part in (ImprovedList([1, 2]), [3], (4,)):
+            merged += part
+        assert merged is alias
+        assert merged == [1, 2, 3, 4]
+
+    @pytest.mark.parametrize(
+        "lists, expected_output",
+        [
+            pytest.param((), [], id="no_list"),
+            pytest.param(([1], ImprovedList([2, 3]), (4,)), [1, 2, 3, 4], id="mixed"),
+            pytest.param((iter([1, 2]), []), [1, 2], id="iterator"),
+        ],
+    )
+    def test_concat(lists, expected_output):  # pylint: disable=unused-variable
+        result = OrmCollection.concat(*lists)
+        assert type(result) is OrmCollection  # pylint: disable=unidiomatic-typecheck
+        assert result == expected_output
+
+    def test_concat_converts():  # pylint: disable=unused-variable
+        result = ImprovedList.concat([{"a": 1}], ImprovedList([{"a": 2}]))
+        assert all(isinstance(item, ObjDict) for item in result)
+
+
+def describe_inspect_stream():
+    """Describe inspect_stream() function of ImprovedList"""
+
+    @pytest.mark.parametrize(
+        "lst, head, tail, expected_lines",
+        [
+            pytest.param([], 2, 2, ["[]"], id="empty_list"),
+            pytest.param(
+                [1, "a"],
+                5,
+                5,
+                ["ImprovedList(int) data:", "[0] 1", "[1] 'a'"],
+                id="short",
+            ),
+            pytest.param(
+                list(range(10)),
+                2,
+                1,
+                [
+                    "ImprovedList(int) data:",
+                    "[0] 0",
+                    "[1] 1",
+                    "... 7 elements not shown ...",
+                    "[9] 9",
+                ],
+                id="truncated",
+            ),
+            pytest.param(
+                list(range(3)),
+                0,
+                0,
+                ["ImprovedList(int) data:", "... 3 elements not shown ..."],
+                id="summary_only",
+            ),
+        ],
+    )
+    def test_inspect_stream(
+        lst, head, tail, expected_lines
+    ):  # pylint: disable=unused-variable
+        stream = StringIO()
+        ImprovedList(lst).inspect_stream(stream, head=head, tail=tail)
+        lines = stream.getvalue().splitlines()
+        if lst:
+            summary = lines.pop()
+            assert summary.startswith(f"{len(lst)} elements | ")
+        assert lines == expected_lines
+
+    def test_inspect_stream_bounds():  # pylint: disable=unused-variable
+        lst = ImprovedList(
+            [{"text": "x" * 1000, "values": list(range(1000))}, "a"] * 50
+        )
+        stream = StringIO()
+        lst.inspect_stream(stream, head=1, tail=0, max_width=40)
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 4
+        assert len(lines[1]) <= len("[0] ") + 40
+        assert lines[-1].startswith("100 elements | ObjDict: 50, str: 50 | ~")
+        assert lines[-1].endswith("KiB")
+
+
+def describe_amap():
+    """Describe amap() function of ImprovedList"""
+
+    class Client:  # pylint: disable=too-few-public-methods
+        """Class with an async method counting the concurrent calls"""
+
+        running = 0
+        max_running = 0
+
+        def __init__(self, value):
+            self.value = value
+
+        async def fetch(self, factor=1):
+            """Return value * factor after a short delay"""
+            Client.running += 1
+            Client.max_running = max(Client.max_running, Client.running)
+            await asyncio.sleep(0.01 if self.value % 2 else 0)
+            Client.running -= 1
+            return self.value * factor
+
+    @pytest.fixture
+    def clients():
+        Client.running = Client.max_running = 0
+        return ImprovedList([Client(value) for value in range(10)])
+
+    @pytest.mark.parametrize("concurrency", [None, 1, 3, 20])
+    def test_amap_ordered(clients, concurrency):  # pylint: disable=unused-variable
+        result = asyncio.run(clients.amap(":fetch", 2, concurrency=concurrency))
+        assert isinstance(result, ImprovedList)
+        assert result == [value * 2 for value in range(10)]
+        assert Client.max_running <= (concurrency or 10)
+
+    def test_amap_callables(clients):  # pylint: disable=unused-variable
+        async def double(client):
+            return client.value * 2
+
+        assert asyncio.run(
+            clients.amap(double, filter_func=lambda client: client.value < 3)
+        ) == [0, 2, 4]
+        assert asyncio.run(clients.amap(".value", return_type="list")) == list(
+            range(10)
+        )
+
+    def test_amap_timeout(clients):  # pylint: disable=unused-variable
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(clients.amap(":fetch", timeout=0.001))
+        result = asyncio.run(
+            clients.amap(":fetch", timeout=0.001, return_exceptions=True, concurrency=2)
+        )
+        assert result[::2] == list(range(0, 10, 2))
+        assert all(isinstance(exc, asyncio.TimeoutError) for exc in result[1::2])
+
+    def test_amap_errors(clients):  # pylint: disable=unused-variable
+        with pytest.raises(ValueError, match="concurrency must be"):
+            asyncio.run(clients.amap(":fetch", concurrency=0))
+        with pytest.raises(AttributeError):
+            asyncio.run(clients.amap(":unknown", concurrency=2))
+        with pytest.raises(TypeError):
+            asyncio.run(clients.amap(42))
+
+
+def describe_batches():
+    """Describe chunks(), windowed() and batched_map() functions of ImprovedList"""
+
+    @pytest.mark.parametrize(
+        "size, expected_output",
+        [
+            pytest.param(2, [[0, 1], [2, 3], [4]], id="last_shorter"),
+            pytest.param(5, [[0, 1, 2, 3, 4]], id="one_chunk"),
+            pytest.param(10, [[0, 1, 2, 3, 4]], id="bigger_than_list"),
+        ],
+    )
+    def test_chunks(size, expected_output):  # pylint: disable=unused-variable
+        assert list(ImprovedList(range(5)).chunks(size)) == expected_output
+
+    @pytest.mark.parametrize(
+        "size, step, expected_output",
+        [
+            pytest.param(2, 1, [[0, 1], [1, 2], [2, 3], [3, 4]], id="sliding"),
+            pytest.param(2, 2, [[0, 1], [2, 3]], id="tumbling"),
+            pytest.param(3, 2, [[0, 1, 2], [2, 3, 4]], id="overlapping"),
+            pytest.param(6, 1, [], id="too_short"),
+        ],
+    )
+    def test_windowed(size, step, expected_output):  # pylint: disable=unused-variable
+        assert list(ImprovedList(range(5)).windowed(size, step)) == expected_output
+
+    def test_views_do_not_copy():  # pylint: disable=unused-variable
+        items = [object() for _ in range(6)]
+        chunk = next(ImprovedList(items).chunks(4))
+        assert len(chunk) == 4
+        assert chunk[-1] is items[3]
+        assert chunk[1:3] == items[1:3]
+        assert chunk[::2] == [items[0], items[2]]
+        with pytest.raises(IndexError):
+            chunk[4]  # pylint: disable=pointless-statement
+
+    def test_batched_map():  # pylint: disable=unused-variable
+        batches = []
+
+        def write(batch):
+            batches.append(batch)
+
+        lst = ImprovedList(range(5))
+        assert lst.batched_map(write, 2) == []
+        assert batches == [[0, 1], [2, 3], [4]]
+        assert all(type(batch) is list for batch in batches)
+        doubled = lst.batched_map(lambda batch: [x * 2 for x in batch], 3)
+        assert doubled == [0, 2, 4, 6, 8]
+        assert lst.batched_map(sum, 2, flatten=False, return_type="list") == [1, 5, 4]
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            pytest.param(lambda lst: lst.chunks(0), id="chunks"),
+            pytest.param(lambda lst: lst.windowed(2, 0), id="windowed"),
+            pytest.param(lambda lst: lst.windowed(0), id="windowed_size"),
+            pytest.param(lambda lst: lst.batched_map(sum, 0), id="batched_map"),
+        ],
+    )
+    def test_batches_errors(call):  # pylint: disable=unused-variable
+        with pytest.raises(ValueError):
+            call(ImprovedList([1, 2]))
+
+
+def describe_memoized_map():
+    """Describe map() function of ImprovedList with memoize"""
+
+    @pytest.fixture
+    def counted():
+        calls = []
+
+        def normalize(value):
+            calls.append(value)
+            return str(value).strip().lower()
+
+        normalize.calls = calls
+        return normalize
+
+    def test_map_memoize(counted):  # pylint: disable=unused-variable
+        lst = ImprovedList([" A", "b", " A", "b", "c", " A"])
+        assert lst.map(counted, memoize=True) == ["a", "b", "a", "b", "c", "a"]
+        assert counted.calls == [" A", "b", "c"]
+
+    def test_map_memoize_types(counted):  # pylint: disable=unused-variable
+        assert ImprovedList([1, 1.0, True]).map(counted, memoize=True) == [
+            "1",
+            "1.0",
+            "true",
+        ]
+        assert len(counted.calls) == 3
+
+    def test_map_memoize_unhashable(counted):  # pylint: disable=unused-variable
+        lst = ImprovedList([{"a": [1]}, {"a": [1]}, {"a": [2]}, [1, {2}], [1, {2}]])
+        assert lst.map(counted, memoize=True) == [
+            "{'a': [1]}",
+            "{'a': [1]}",
+            "{'a': [2]}",
+            "[1, {2}]",
+            "[1, {2}]",
+        ]
+        assert len(counted.calls) == 3
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            pytest.param([{"a": 1}, {"a": True}, {"a": 1.0}], id="dict_values"),
+            pytest.param([[1], [True]], id="list_items"),
+            pytest.param([{"a": [1]}, {"a": (1,)}], id="list_tuple"),
+            pytest.param([(1,), (True,)], id="tuple_items"),
+            pytest.param([{1: "a"}, {True: "a"}], id="dict_keys"),
+            pytest.param([{"a": 1, "b": 2}, {"b": 2, "a": 1}], id="dict_order"),
+        ],
+    )
+    def test_map_memoize_nested_types(values):  # pylint: disable=unused-variable
+        lst = ImprovedList(values)
+        assert lst.map(repr, memoize=True) == [repr(value) for value in lst]
+
+    def test_map_memoize_key(counted):  # pylint: disable=unused-variable
+        lst = ImprovedList([{"id": 1, "x": 1}, {"id": 1, "x": 2}])
+        result = lst.map(counted, memoize=True, memo_key=lambda obj: obj.id)
+        assert result == ["{'id': 1, 'x': 1}"] * 2
+        with pytest.raises(TypeError, match="give a memo_key function"):
+            ImprovedList([[object.__new__(Unhashable)]]).map(counted, memoize=True)
+
+    def test_map_memoize_lru(counted):  # pylint: disable=unused-variable
+        lst = ImprovedList(["a", "b", "a", "c", "b", "a"])
+        assert lst.map(counted, memoize=2) == list(lst)
+        assert counted.calls == ["a", "b", "c", "b", "a"]
+        with pytest.raises(ValueError, match="memoize must be True or a cache size"):
+            lst.map(counted, memoize=0)
+
+
+class Unhashable:  # pylint: disable=too-few-public-methods
+    """Class whose instances cannot be hashed"""
+
+    __hash__ = None
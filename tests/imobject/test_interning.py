@@ -0,0 +1,93 @@
+"""
+Module test_interning.py - Test suite for the interning module.
+
+This module contains unit tests for the interning of the keys and values of the objects
+built in bulk.
+
+Functions:
+
+  describe_interning(): Function to test the intern option of the bulk constructors.
+
+To run the tests, simply execute this module as a script, e.g.,
+with the command `python -m pytest test_interning.py`.
+The tests will be discovered and run automatically by the Pytest testing framework.
+"""
+import io
+import pytest
+from imobject import ObjDict, OrmCollection
+from imobject.interning import MAX_VALUE_LENGTH, intern_row, intern_value
+
+
+def _string(value: str) -> str:
+    """Return a new string object equal to value."""
+    return "".join(list(value))
+
+
+def describe_interning():
+    """Function to test the intern option of the bulk constructors."""
+
+    @pytest.fixture
+    def document():
+        long_value = "x" * (MAX_VALUE_LENGTH + 1)
+        return (
+            '[{"status": "active", "note": "%s", "tags": ["new"]},'
+            ' {"status": "active", "note": "%s", "tags": ["new"]}]'
+        ) % (long_value, long_value)
+
+    def test_intern_value():  # pylint: disable=unused-variable
+        assert intern_value(_string("active")) is intern_value(_string("active"))
+        long_value = "x" * (MAX_VALUE_LENGTH + 1)
+        assert intern_value(_string(long_value)) is not intern_value(
+            _string(long_value)
+        )
+        assert intern_value(1) == 1
+
+    def test_intern_row():  # pylint: disable=unused-variable
+        first = intern_row({_string("key"): _string("a")})
+        second = intern_row({_string("key"): _string("a")})
+        assert next(iter(first)) is next(iter(second))
+        assert first["key"] is second["key"]
+        assert intern_row((_string("a"), 1)) == ["a", 1]
+
+    @pytest.mark.parametrize("intern", [False, True])
+    def test_loads(document, intern):  # pylint: disable=unused-variable
+        first, second = ObjDict.loads(document, intern=intern)
+        assert first == second
+        assert (first.status is second.status) is intern
+        assert (first.tags[0] is second.tags[0]) is intern
+        assert first.note is not second.note
+
+    def test_iterload(document):  # pylint: disable=unused-variable
+        first, second = ObjDict.iterload(io.StringIO(document), 8, intern=True)
+        assert first.status is second.status
+
+    @pytest.mark.parametrize(
+        "compact, schema",
+        [
+            pytest.param(False, None, id="obj_dict"),
+            pytest.param(True, None, id="compact"),
+            pytest.param(False, ["name", "status"], id="schema"),
+        ],
+    )
+    def test_from_records(compact, schema):  # pylint: disable=unused-variable
+        rows = [{"name": name, "status": _string("on")} for name in "ab"]
+        first, second = OrmCollection.from_records(
+            rows, schema=schema, compact=compact, intern=True
+        )
+        assert (first.name, second.name) == ("a", "b")
+        assert first.status is second.status
+
+    def test_from_records_sequences():  # pylint: disable=unused-variable
+        rows = [(_string("a"), _string("on")), (_string("b"), _string("on"))]
+        first, second = OrmCollection.from_records(
+            rows, schema=["name", "status"], intern=True
+        )
+        assert first.status is second.status
+
+    def test_from_dict():  # pylint: disable=unused-variable
+        data = {"a": {"b": _string("on")}, "c": [{"d": _string("on")}, _string("on")]}
+        obj = ObjDict.from_dict(data, intern=True)
+        assert obj == data
+        assert isinstance(dict.__getitem__(obj, "a"), ObjDict)
+        assert isinstance(dict.__getitem__(obj, "c"), OrmCollection)
+        assert obj.a.b is obj.c[0].d is obj.c[1]
@@ -0,0 +1,131 @@
+"""
+Module test_numeric_list.py - Test suite for the NumericList module.
+
+This module contains unit tests for the NumericList implementation.
+
+Functions:
+
+  describe_numeric_list(): Function to test the aggregations and conversions of NumericList.
+  describe_numeric_results(): Function to test the numeric return types of ImprovedList.map.
+
+To run the tests, simply execute this module as a script, e.g.,
+with the command `python -m pytest test_numeric_list.py`.
+The tests will be discovered and run automatically by the Pytest testing framework.
+"""
+import statistics
+from array import array
+import pytest
+from imobject import ImprovedList, NumericList
+
+
+def describe_numeric_list():
+    """Function to test all functions for NumericList class."""
+
+    @pytest.mark.parametrize(
+        "values, expected_output",
+        [
+            pytest.param([1, 2, 3], (6, 2.0, 1, 3, "q"), id="ints"),
+            pytest.param([1, 2.5, -0.5], (3.0, 1.0, -0.5, 2.5, "d"), id="mixed"),
+            pytest.param([2**70, 1], (2**70 + 1, 2.0**69, 1, 2**70, "d"), id="big_int"),
+        ],
+    )
+    def test_aggregations(values, expected_output):  # pylint: disable=unused-variable
+        numbers = NumericList(values)
+        assert (
+            numbers.sum(),
+            numbers.mean(),
+            numbers.min(),
+            numbers.max(),
+            numbers.typecode,
+        ) == expected_output
+
+    def test_empty():  # pylint: disable=unused-variable
+        numbers = NumericList()
+        assert numbers.sum() == 0
+        assert numbers.to_array() == array("q")
+        with pytest.raises(statistics.StatisticsError):
+            numbers.mean()
+        with pytest.raises(ValueError):
+            numbers.max()
+
+    def test_not_numbers():  # pylint: disable=unused-variable
+        with pytest.raises(TypeError, match="Expected int or float values"):
+            NumericList([1, "2"])
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            pytest.param(lambda numbers: numbers.append("x"), id="append"),
+            pytest.param(lambda numbers: numbers.extend([{}]), id="extend"),
+            pytest.param(lambda numbers: numbers.insert(0, None), id="insert"),
+            pytest.param(lambda numbers: numbers.__setitem__(0, "a"), id="setitem"),
+            pytest.param(
+                lambda numbers: numbers.__setitem__(slice(0, 1), ["a"]), id="slice"
+            ),
+            pytest.param(lambda numbers: numbers + ["a"], id="add"),
+            pytest.param(lambda numbers: numbers.__iadd__(["a"]), id="iadd"),
+        ],
+    )
+    def test_mutators_reject_not_numbers(mutate):  # pylint: disable=unused-variable
+        numbers = NumericList([1, 2])
+        with pytest.raises(TypeError, match="Expected int or float values"):
+            mutate(numbers)
+        assert numbers == [1, 2]
+        assert numbers.typecode == "q"
+
+    def test_typecode_follows_mutations():  # pylint: disable=unused-variable
+        numbers = NumericList([1, 2])
+        numbers.append(0.5)
+        assert numbers.typecode == "d"
+        assert numbers.pop() == 0.5
+        assert numbers.typecode == "q"
+        numbers[0] = 1.5
+        assert numbers.to_array() == array("d", [1.5, 2.0])
+        numbers[0] = 1
+        assert numbers.typecode == "q"
+        numbers += [2**70]
+        assert numbers.typecode == "d"
+        del numbers[-1]
+        assert numbers.typecode == "q"
+        assert numbers.filter(lambda value: value > 1).typecode == "q"
+
+    def test_to_array():  # pylint: disable=unused-variable
+        assert NumericList([1, 2]).to_array() == array("q", [1, 2])
+        assert NumericList([1, 0.5]).to_array() == array("d", [1.0, 0.5])
+
+    def test_map_keeps_numeric():  # pylint: disable=unused-variable
+        numbers = NumericList([1, 2, 3])
+        assert type(numbers.map(lambda x: x * 2)) is NumericList
+        assert type(numbers.map(str)) is ImprovedList
+        assert type(numbers.first(2)) is NumericList
+        assert numbers.map(float, vectorize=True) == [1.0, 2.0, 3.0]
+
+    def test_vectorized_map():  # pylint: disable=unused-variable
+        numpy = pytest.importorskip("numpy")
+        numbers = NumericList([1.0, 4.0, 9.0])
+        assert numbers.to_numpy().dtype == numpy.float64
+        result = numbers.map(numpy.sqrt, vectorize=True)
+        assert type(result) is NumericList
+        assert result == [1.0, 2.0, 3.0]
+
+
+def describe_numeric_results():
+    """Function to test the numeric return types of ImprovedList.map."""
+
+    @pytest.mark.parametrize(
+        "return_type, expected_type",
+        [
+            pytest.param("NumericList", NumericList, id="numeric_list"),
+            pytest.param("array", array, id="array"),
+        ],
+    )
+    def test_map_return_type(
+        return_type, expected_type
+    ):  # pylint: disable=unused-variable
+        result = ImprovedList(["a", "bb", "ccc"]).map(len, return_type=return_type)
+        assert type(result) is expected_type
+        assert list(result) == [1, 2, 3]
+
+    def test_map_return_type_error():  # pylint: disable=unused-variable
+        with pytest.raises(TypeError):
+            ImprovedList(["a"]).map(str.upper, return_type="array")
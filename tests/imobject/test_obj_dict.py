@@ -16,9 +16,13 @@ This module requires the following external libraries to be installed:
 # - 
 
 """
+import io
+import json
+from unittest import mock
 import pytest
 from imobject import ObjDict
 from imobject import ImprovedList
+from imobject import OrmCollection
 
 
 def describe_objdict():
@@ -209,3 +213,367 @@ def describe_objdict():
         assert copied_dict.to_dict() == sample_obj_dict.to_dict()
         assert copied_dict is not sample_obj_dict
         assert copied_dict["address"] is not sample_obj_dict["address"]
+
+
+def describe_schema():
+    """Function to test the record classes generated by ObjDict.schema()."""
+
+    def test_schema_record():  # pylint: disable=unused-variable
+        """Test attribute access, access by key and to_dict() of a record."""
+        person = ObjDict.schema({"name": str, "age": int}, name="Person")
+        assert person is ObjDict.schema({"name": str, "age": int}, name="Person")
+        alice = person("Alice", age=25)
+        assert alice.name == "Alice"
+        assert alice["age"] == 25
+        assert alice.to_dict() == {"name": "Alice", "age": 25}
+        assert alice == {"name": "Alice", "age": 25}
+        assert not hasattr(alice, "__dict__")
+        assert person.from_dict({"name": "Bob"}).age is None
+        alice.age = 26
+        assert alice.age == 26
+        with pytest.raises(TypeError):
+            person.from_dict({"name": "Bob", "unknown": 1})
+        with pytest.raises(KeyError):
+            alice["unknown"]  # pylint: disable=pointless-statement
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param(["first-name"], id="not_identifier"),
+            pytest.param(["to_dict"], id="reserved_name"),
+            pytest.param(["a", "a"], id="duplicate_name"),
+        ],
+    )
+    def test_schema_errors(fields):  # pylint: disable=unused-variable
+        with pytest.raises(ValueError):
+            ObjDict.schema(fields)
+
+
+def describe_attribute_access():
+    """Function to test the conversion of the values read as attributes."""
+
+    @pytest.fixture
+    def config():
+        return ObjDict({"db": {"host": "localhost"}, "users": [{"name": "Alice"}]})
+
+    def test_converted_once(config):  # pylint: disable=unused-variable
+        assert type(dict.__getitem__(config, "db")) is dict
+        database = config.db
+        assert isinstance(database, ObjDict)
+        assert config.db is database
+        assert config["db"] is database
+        assert config.users is config.users
+        assert isinstance(config.users, OrmCollection)
+
+    def test_unchanged_values_not_cached():  # pylint: disable=unused-variable
+        obj = ObjDict({"name": "Alice", "age": 30})
+        obj.age = 31
+        assert (obj.name, obj.age) == ("Alice", 31)
+        assert not vars(obj)
+
+    def test_changes_are_kept(config):  # pylint: disable=unused-variable
+        config.db.port = 5432
+        config.users.append({"name": "Bob"})
+        config.users[0].name = "Alicia"
+        assert config.db.port == 5432
+        assert config["db"]["port"] == 5432
+        assert config.users.map(".name") == ["Alicia", "Bob"]
+
+    @pytest.mark.parametrize(
+        "change, expected_output",
+        [
+            pytest.param(lambda obj: obj.__setitem__("db", 1), 1, id="setitem"),
+            pytest.param(lambda obj: obj.update({"db": 2}), 2, id="update"),
+            pytest.param(lambda obj: obj.__ior__({"db": 3}), 3, id="ior"),
+            pytest.param(lambda obj: setattr(obj, "db", 4), 4, id="setattr"),
+            pytest.param(lambda obj: obj.pop("db"), None, id="pop"),
+            pytest.param(lambda obj: obj.__delitem__("db"), None, id="delitem"),
+            pytest.param(lambda obj: delattr(obj, "db"), None, id="delattr"),
+            pytest.param(lambda obj: obj.clear(), None, id="clear"),
+        ],
+    )
+    def test_cache_follows_changes(
+        config, change, expected_output
+    ):  # pylint: disable=unused-variable
+        assert config.db.host == "localhost"
+        change(config)
+        assert getattr(config, "db", None) == expected_output
+
+    def test_cache_clear_keeps_instance_attributes():  # pylint: disable=unused-variable
+        obj = ObjDict({"a": {"b": 1}})
+        object.__setattr__(obj, "source", "config.json")
+        assert obj.a.b == 1
+        obj.clear()
+        assert not hasattr(obj, "a")
+        assert obj.source == "config.json"
+
+    def test_cache_popitem():  # pylint: disable=unused-variable
+        obj = ObjDict({"a": 1, "b": {"c": 2}})
+        assert obj.b.c == 2
+        assert obj.popitem() == ("b", {"c": 2})
+        assert not hasattr(obj, "b")
+
+    def test_missing_attribute(config):  # pylint: disable=unused-variable
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            config.missing  # pylint: disable=pointless-statement
+
+
+def describe_items_view():
+    """Function to test the view returned by ObjDict.items()."""
+
+    @pytest.fixture
+    def record():
+        return ObjDict({"a": 1, "b": {"c": 2}, "d": [{"e": 3}]})
+
+    def test_items_view(record):  # pylint: disable=unused-variable
+        items = record.items()
+        assert len(items) == 3
+        assert ("a", 1) in items
+        assert ("b", {"c": 2}) in items
+        assert ("a", 2) not in items
+        assert items == [("a", 1), ("b", {"c": 2}), ("d", [{"e": 3}])]
+        assert items == {"a": 1, "b": {"c": 2}, "d": [{"e": 3}]}.items()
+        assert repr(items).startswith("ObjDictItemsView([('a', 1), ")
+        record["f"] = 4
+        assert len(items) == 4
+
+    def test_items_keep_set_lists():  # pylint: disable=unused-variable
+        obj = ObjDict()
+        obj.tags = [1, 2]
+        tags = dict.__getitem__(obj, "tags")
+        assert list(obj.items()) == [("tags", [1, 2])]
+        obj.tags.append(3)
+        assert obj.tags is tags
+        assert obj["tags"] == [1, 2, 3]
+        assert obj.to_dict() == {"tags": [1, 2, 3]}
+
+    def test_items_drop_stale_cache():  # pylint: disable=unused-variable
+        obj = ObjDict({"config": {"a": 1}})
+        assert obj.config.a == 1
+        dict.__setitem__(obj, "config", {"a": 2})
+        [(_, config)] = obj.items()
+        assert obj.config is config
+        assert obj.config.a == 2
+
+    def test_items_lazy_conversion(record):  # pylint: disable=unused-variable
+        iterator = iter(record.items())
+        assert next(iterator) == ("a", 1)
+        assert type(dict.__getitem__(record, "b")) is dict
+        key, value = next(iterator)
+        assert key == "b"
+        assert isinstance(value, ObjDict)
+        assert record.b is value
+        assert type(dict.__getitem__(record, "d")) is list
+        assert isinstance(dict(record.items())["d"], OrmCollection)
+
+
+def describe_json():
+    """Function to test the JSON decoding of ObjDict."""
+
+    DOCUMENT = '[{"name": "Alice", "tags": ["a", "b"], "address": {"city": "Paris"}},'
+    DOCUMENT += ' 12.5e1, "a,]\\"b", [[1]], true, null, {"city": "Montréal"}]'
+
+    def test_loads():  # pylint: disable=unused-variable
+        people = ObjDict.loads(DOCUMENT.encode())
+        assert isinstance(people, OrmCollection)
+        alice = people[0]
+        assert isinstance(alice, ObjDict)
+        assert isinstance(dict.__getitem__(alice, "address"), ObjDict)
+        assert isinstance(dict.__getitem__(alice, "tags"), OrmCollection)
+        assert alice.address.city == "Paris"
+        assert isinstance(people[3], OrmCollection)
+        assert people[1:6] == [125.0, 'a,]"b', [[1]], True, None]
+        assert ObjDict.loads('{"a": {"b": 1}}').a.b == 1
+        assert ObjDict.loads("1") == 1
+
+    def test_load():  # pylint: disable=unused-variable
+        assert ObjDict.load(io.StringIO(DOCUMENT)) == ObjDict.loads(DOCUMENT)
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 65536])
+    def test_iterload(chunk_size):  # pylint: disable=unused-variable
+        expected = ObjDict.loads(DOCUMENT)
+        for stream in (io.StringIO(DOCUMENT), io.BytesIO(DOCUMENT.encode())):
+            elements = list(ObjDict.iterload(stream, chunk_size))
+            assert elements == expected
+            assert [type(element) for element in elements] == [
+                type(element) for element in expected
+            ]
+
+    def test_iterload_is_incremental():  # pylint: disable=unused-variable
+        stream = io.StringIO('[{"a": 1}, {"a": 2}, ' + " " * 1000 + "{")
+        elements = ObjDict.iterload(stream, chunk_size=16)
+        assert next(elements) == {"a": 1}
+        assert stream.tell() < 100
+
+    def test_iterload_large_element():  # pylint: disable=unused-variable
+        element = {"values": list(range(2000))}
+        stream = io.StringIO(json.dumps([element, 1]))
+        raw_decode = json.JSONDecoder.raw_decode
+        with mock.patch.object(
+            json.JSONDecoder, "raw_decode", autospec=True, side_effect=raw_decode
+        ) as decode:
+            assert list(ObjDict.iterload(stream, chunk_size=8)) == [element, 1]
+        assert decode.call_count < 30
+
+    @pytest.mark.parametrize(
+        "document, message",
+        [
+            pytest.param("{}", "Expecting '\\['", id="not_an_array"),
+            pytest.param("[1,]", "Expecting value", id="trailing_comma"),
+            pytest.param("[1 2]", "Expecting ',' delimiter", id="missing_comma"),
+            pytest.param("[1", "Unexpected end", id="truncated"),
+        ],
+    )
+    def test_iterload_errors(document, message):  # pylint: disable=unused-variable
+        with pytest.raises(json.JSONDecodeError, match=message):
+            list(ObjDict.iterload(io.StringIO(document), chunk_size=2))
+        with pytest.raises(ValueError):
+            ObjDict.iterload(io.StringIO(document), chunk_size=0)
+
+    def test_iterload_empty():  # pylint: disable=unused-variable
+        assert not list(ObjDict.iterload(io.StringIO(" [ ] ")))
+
+
+def describe_paths():
+    """Function to test the dotted path access of ObjDict."""
+
+    @pytest.fixture
+    def person():
+        return ObjDict(
+            {
+                "name": "Alice",
+                "address": {"city": "Paris"},
+                "children": [{"name": "Bob"}],
+            }
+        )
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            pytest.param("name", "Alice", id="top_level"),
+            pytest.param("address.city", "Paris", id="nested"),
+            pytest.param("children.0.name", "Bob", id="list_index"),
+        ],
+    )
+    def test_get_path(person, path, expected):  # pylint: disable=unused-variable
+        assert person.get_path(path) == expected
+        assert ObjDict.compile_path(path)(person) == expected
+
+    def test_get_path_skips_conversion(person):  # pylint: disable=unused-variable
+        assert type(person.get_path("address")) is dict
+        assert type(dict.__getitem__(person, "address")) is dict
+        assert "address" not in person.__dict__
+
+    @pytest.mark.parametrize(
+        "path", ["missing", "address.zip", "children.3.name", "name.first"]
+    )
+    def test_get_path_missing(person, path):  # pylint: disable=unused-variable
+        assert person.get_path(path, None) is None
+        with pytest.raises(KeyError, match=path):
+            person.get_path(path)
+
+    def test_numeric_keys():  # pylint: disable=unused-variable
+        obj = ObjDict({"codes": {"75": "Paris"}, "rows": [[1, 2], {"0": "zero"}]})
+        assert obj.get_path("codes.75") == "Paris"
+        assert obj.get_path("rows.0.1") == 2
+        assert obj.get_path("rows.1.0") == "zero"
+        assert obj.get_path("codes.0", None) is None
+        obj.set_path("codes.13", "Marseille")
+        obj.set_path("rows.0.1", 3)
+        assert dict.__getitem__(obj, "codes") == {"75": "Paris", "13": "Marseille"}
+        assert obj.get_path("rows.0") == [1, 3]
+
+    def test_compile_path_cached():  # pylint: disable=unused-variable
+        assert ObjDict.compile_path("a.b") is ObjDict.compile_path("a.b")
+
+    def test_set_path(person):  # pylint: disable=unused-variable
+        assert person.address.city == "Paris"
+        person.set_path("address.city", "Lyon")
+        assert person.address.city == "Lyon"
+        person.set_path("children.0.age", 5)
+        assert person.children[0].age == 5
+        person.set_path("job.company.name", "ACME")
+        assert person.job.company.name == "ACME"
+        assert isinstance(dict.__getitem__(person, "job"), ObjDict)
+
+    def test_set_path_errors(person):  # pylint: disable=unused-variable
+        with pytest.raises(IndexError):
+            person.set_path("children.3.name", "Eve")
+        with pytest.raises(TypeError):
+            person.set_path("name.first", "Eve")
+
+
+def describe_diff():
+    """Function to test the diff and patch of ObjDict."""
+
+    @pytest.fixture
+    def config():
+        return ObjDict(
+            {
+                "db": {"host": "localhost", "port": 5432, "options": {"ssl": True}},
+                "workers": [1, 2],
+                "debug": False,
+            }
+        )
+
+    def test_diff(config):  # pylint: disable=unused-variable
+        other = config.to_dict()
+        other["db"]["port"] = 5433
+        del other["db"]["options"]["ssl"]
+        other["db"]["options"]["timeout"] = 3
+        other["workers"].append(3)
+        other["name"] = {"first": "app"}
+        del other["debug"]
+        assert config.diff(other) == {
+            "added": [(("name",), {"first": "app"}), (("db", "options", "timeout"), 3)],
+            "removed": [("debug",), ("db", "options", "ssl")],
+            "changed": [(("workers",), [1, 2, 3]), (("db", "port"), 5433)],
+        }
+
+    def test_diff_same(config):  # pylint: disable=unused-variable
+        empty = {"added": [], "removed": [], "changed": []}
+        assert config.diff(config) == empty
+        assert config.diff(config.copy()) == empty
+
+    def test_diff_changed_type(config):  # pylint: disable=unused-variable
+        patch = config.diff({**config, "db": "sqlite", "debug": {"level": 1}})
+        assert patch["changed"] == [(("db",), "sqlite"), (("debug",), {"level": 1})]
+
+    def test_diff_frozen(config):  # pylint: disable=unused-variable
+        frozen = config.freeze()
+        updated = frozen.set_in(("db", "port"), 1)
+        assert ObjDict({"c": frozen}).diff({"c": frozen.set("debug", False)}) == {
+            "added": [],
+            "removed": [],
+            "changed": [],
+        }
+        patch = ObjDict({"c": frozen}).diff({"c": updated})
+        assert patch["changed"] == [(("c", "db", "port"), 1)]
+
+    def test_apply(config):  # pylint: disable=unused-variable
+        other = config.copy()
+        other.set_path("db.port", 5433)
+        other.set_path("db.options.timeout", 3)
+        other.set_path("cache.size", 10)
+        del other["debug"]
+        patch = config.diff(other)
+        assert config.apply(patch) is config
+        assert config == other
+        assert config.db.port == 5433
+        assert isinstance(config.cache, ObjDict)
+
+    def test_apply_json_patch(config):  # pylint: disable=unused-variable
+        other = config.copy()
+        other.set_path("db.options.ssl", False)
+        patch = json.loads(json.dumps(config.diff(other)))
+        assert config.apply(patch) == other
+
+    def test_apply_copies_values(config):  # pylint: disable=unused-variable
+        patch = config.diff({**config, "extra": {"a": [1]}})
+        config.apply(patch)
+        config.extra.a.append(2)
+        assert patch["added"] == [(("extra",), {"a": [1]})]
+
+    def test_apply_missing_path(config):  # pylint: disable=unused-variable
+        with pytest.raises(KeyError):
+            config.apply({"removed": [("db", "missing")]})
@@ -11,6 +11,7 @@ Functions:
   describe_destinct(): Function to test the destinct() method of ORMCollection class.
   describe_all_offset_limit(): Function to test the all(), offset and limit of ORMCollection class.
   describe_order_by(): Function to test the order_by() method of ORMCollection class.
+  describe_projection(): Function to test the values_list(), only() and select() methods.
 
 To run the tests, simply execute this module as a script, e.g., 
 with the command `python -m pytest test_orm.py`.
@@ -22,13 +23,18 @@ This module requires the following external libraries to be installed:
 
 """
 
+import pickle
 import re
 import pytest
 from imobject import (
     OrmCollection,
     BaseMultipleFound,
     BaseNotFound,
+    BloomFilter,
+    ImprovedList,
+    ObjDict,
     Query,
+    Record,
     Filter,
 )
 
@@ -183,6 +189,29 @@ def describe_where():
                 {"Dave", "Charlie"},
                 id="age=40&name__endswith_v",
             ),
+            pytest.param({"age__in": (25, 40)}, {"Alice", "Bob"}, id="age_in_tuple"),
+            pytest.param(
+                {"age__in": frozenset([30])}, {"Charlie", "Dave"}, id="age_in_frozenset"
+            ),
+            pytest.param(
+                {"age__in": (age for age in range(26, 35))},
+                {"Charlie", "Dave"},
+                id="age_in_generator",
+            ),
+            pytest.param(
+                {"age__in": BloomFilter([25, 40], capacity=100, error_rate=1e-6)},
+                {"Alice", "Bob"},
+                id="age_in_bloom",
+            ),
+            pytest.param(
+                {
+                    "name__nin": BloomFilter(
+                        ["Alice", "Bob"], capacity=100, error_rate=1e-6
+                    )
+                },
+                {"Charlie", "Dave"},
+                id="name_nin_bloom",
+            ),
             # Test pour trouver tous les éléments avec le nom contenant la lettre "z"
             pytest.param(
                 {"name": re.compile(r".*z.*", re.IGNORECASE)},
@@ -234,6 +263,214 @@ def describe_where():
         results = my_orm_collection.where(age=25)
         assert my_orm_collection != results
 
+    def test_filter_membership_operand():  # pylint: disable=unused-variable
+        # The "in" operand is turned into a frozenset once, when the filter is built
+        assert Filter("age", "in", [25, 30]).value == frozenset([25, 30])
+        # Unhashable values are kept in a tuple
+        assert Filter("tags", "in", [["a"], ["b"]]).value == (["a"], ["b"])
+        # A one-shot iterator is read entirely before its elements are found unhashable
+        generator = (value for value in [1, [1], 3])
+        assert Filter("tags", "in", generator).value == (1, [1], 3)
+        # Invalid operands are left untouched and still raise when evaluated
+        assert Filter("name", "in", "abc").value == "abc"
+        with pytest.raises(TypeError):
+            Filter("name", "in", "abc").evaluate(ObjDict({"name": "a"}))
+
+    def test_membership_unhashable_values():  # pylint: disable=unused-variable
+        collection = OrmCollection(
+            [{"name": "A", "tags": ["a"]}, {"name": "B", "tags": ["b"]}, {"name": "C"}]
+        )
+        collection[2].tags = {"c": 1}
+        assert collection.where(tags__in=[("a",), "x"]).map(".name") == []
+        assert collection.where(tags__in=[["a"], ["c"]]).map(".name") == ["A"]
+        assert collection.where(tags__in=frozenset(["a", "b"])).map(".name") == []
+        assert collection.where(tags__nin={"a", "b"}).map(".name") == ["A", "B", "C"]
+        bloom = BloomFilter(["a"], capacity=100, error_rate=1e-6)
+        assert collection.where(tags__in=bloom).map(".name") == []
+        assert collection.where(tags__nin=bloom).map(".name") == ["A", "B", "C"]
+
+
+def describe_validate_schema():
+    """Function to test the validate_schema() method of the ORMCollection class."""
+
+    def test_validate_schema(my_orm_collection):  # pylint: disable=unused-variable
+        collection = my_orm_collection.validate_schema({"name": str, "age": int})
+        assert collection is my_orm_collection
+        results = collection.where(age__gte=30, name__startswith="D")
+        assert [result.name for result in results] == ["Dave"]
+        # The schema is kept by the derived collections
+        assert results.where(age=30).first().name == "Dave"
+        assert {result.name for result in collection.limit(2).where(age__lt=30)} == {
+            "Alice"
+        }
+        # Values of another type are still checked
+        with pytest.raises(TypeError):
+            collection.where(age__gt="25")
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            pytest.param(lambda coll: coll.append({"age": "2"}), id="append"),
+            pytest.param(lambda coll: coll.extend([{"age": "2"}]), id="extend"),
+            pytest.param(lambda coll: coll.insert(0, {"age": "2"}), id="insert"),
+            pytest.param(lambda coll: coll.__setitem__(0, {"age": "2"}), id="setitem"),
+            pytest.param(lambda coll: coll.__iadd__([{"age": "2"}]), id="iadd"),
+        ],
+    )
+    def test_mutators_drop_schema(mutate):  # pylint: disable=unused-variable
+        collection = OrmCollection([{"age": 1}, {"age": 2}])
+        collection.validate_schema({"age": int})
+        mutate(collection)
+        # The new row is not trusted: its value is checked as without a schema
+        with pytest.raises(TypeError):
+            collection.where(age__eq=2)
+        with pytest.raises(TypeError):
+            collection.where(age__not=2)
+
+    def test_validate_schema_error(my_orm_collection):  # pylint: disable=unused-variable
+        with pytest.raises(TypeError, match="Invalid type for field 'age'"):
+            my_orm_collection.validate_schema({"age": str})
+
+    def test_trusted_filter():  # pylint: disable=unused-variable
+        obj = ObjDict({"age": 30})
+        with pytest.raises(TypeError):
+            Filter("age", "lt", 30.5).evaluate(obj)
+        assert Filter("age", "lt", 30.5, trusted=True).evaluate(obj)
+
+
+def describe_from_records():
+    """Function to test the from_records() method of the ORMCollection class."""
+
+    def test_from_records_with_schema():  # pylint: disable=unused-variable
+        rows = [{"name": "Alice", "age": 25}, ("Bob", 40), {"name": "Dave", "age": 30}]
+        collection = OrmCollection.from_records(rows, schema={"name": str, "age": int})
+        assert collection.where(age__gte=30).map(".name") == ["Bob", "Dave"]
+        assert collection.first().to_dict() == {"name": "Alice", "age": 25}
+        assert pickle.loads(pickle.dumps(collection)) == collection
+        with pytest.raises(TypeError, match="Invalid type for field 'age'"):
+            OrmCollection.from_records([("Bob", "40")], schema={"name": str, "age": int})
+
+    def test_from_records_without_schema():  # pylint: disable=unused-variable
+        collection = OrmCollection.from_records([{"name": "Alice", "age": 25}])
+        assert isinstance(collection.first(), ObjDict)
+        assert collection.find_by(name="Alice").age == 25
+
+    def test_from_records_compact():  # pylint: disable=unused-variable
+        rows = [
+            {"name": "Alice", "age": 25},
+            {"name": "Bob", "age": 40},
+            {"age": 30, "name": "Dave"},
+            {"name": "Eve", "age": 20, "first-name": "E"},
+            {"name": "Keys", "age": 10, "keys": 1},
+        ]
+        collection = OrmCollection.from_records(rows, compact=True)
+        alice, bob, dave, eve, keys = collection
+        assert type(alice) is type(bob)  # pylint: disable=unidiomatic-typecheck
+        assert isinstance(alice, Record)
+        assert not hasattr(alice, "__dict__")
+        assert isinstance(dave, Record)
+        assert dave == ObjDict.schema(["name", "age"])("Dave", 30)
+        assert isinstance(eve, ObjDict)
+        assert isinstance(keys, ObjDict)
+        assert collection == rows
+        assert collection.where(age__gte=30).map(".name") == ["Bob", "Dave"]
+        assert pickle.loads(pickle.dumps(collection)) == rows
+
+    def test_from_records_compact_keywords():  # pylint: disable=unused-variable
+        rows = [{"from": "a", "to": "b"}]
+        collection = OrmCollection.from_records(rows, compact=True)
+        assert isinstance(collection[0], Record)
+        assert collection.where(to="b")[0].to_dict() == {"from": "a", "to": "b"}
+        record = ObjDict.schema(["class", "x"])("A", 1)
+        assert record["class"] == "A"
+        assert OrmCollection([{"class": "A"}]).only("class")[0]["class"] == "A"
+
+    def test_from_records_compact_nested():  # pylint: disable=unused-variable
+        rows = [{"name": "Alice", "addr": {"city": "Paris"}, "tags": [{"a": 1}]}]
+        compact = OrmCollection.from_records(rows, compact=True)
+        plain = OrmCollection.from_records(rows)
+        assert compact[0].addr.city == plain[0].addr.city == "Paris"
+        assert isinstance(compact[0].tags, OrmCollection)
+        assert compact[0].tags[0].a == 1
+        assert compact == plain
+
+    def test_from_records_schema_nested():  # pylint: disable=unused-variable
+        rows = [{"name": "Alice", "addr": {"city": "Paris"}}, ("Bob", {"city": "Lyon"})]
+        collection = OrmCollection.from_records(rows, schema=["name", "addr"])
+        assert collection.map(".addr.city") == ["Paris", "Lyon"]
+        record = collection.first()
+        assert isinstance(record.addr, ObjDict)
+        assert record == OrmCollection.from_records(rows[:1])[0]
+
+
+def describe_bloom_filter():
+    """Function to test the BloomFilter class used by the "in" and "nin" operators."""
+
+    def test_bloom_filter_no_false_negative():  # pylint: disable=unused-variable
+        values = [f"user{index}@example.com" for index in range(2000)]
+        bloom = BloomFilter(values, error_rate=0.01)
+        assert len(bloom) == 2000
+        assert all(value in bloom for value in values)
+        false_positives = sum(f"other{index}" in bloom for index in range(2000))
+        assert false_positives < 100
+
+    def test_bloom_filter_add():  # pylint: disable=unused-variable
+        bloom = BloomFilter(capacity=100, error_rate=1e-6)
+        assert "a" not in bloom
+        bloom.add("a")
+        assert "a" in bloom
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
+
+
+def describe_query():
+    """Function to test the normalization and compilation of Query objects."""
+
+    def test_or_chain_is_flat(my_orm_collection):  # pylint: disable=unused-variable
+        query = Query([Filter("age", None, 1)])
+        for age in range(2, 40):
+            query = query | Query([Filter("age", None, age)])
+        assert query.connector == "OR"
+        assert len(query.filters) == 39
+        assert {result.name for result in my_orm_collection.where(query)} == {
+            "Alice",
+            "Charlie",
+            "Dave",
+        }
+
+    def test_normalize_removes_duplicates():  # pylint: disable=unused-variable
+        age_30 = Query([Filter("age", None, 30)])
+        query = (age_30 & Query([Filter("age", None, 30)])) | (
+            age_30 | Query([Filter("name", "startswith", "D")])
+        )
+        normalized = query.normalize()
+        assert normalized.connector == "OR"
+        assert len(normalized.filters) == 2
+        assert all(isinstance(filter_, Filter) for filter_ in normalized.filters)
+
+    def test_compile_evaluates_each_filter_once():  # pylint: disable=unused-variable
+        class Counted:  # pylint: disable=too-few-public-methods
+            """Object counting the accesses to its age"""
+
+            def __init__(self):
+                self.reads = 0
+
+            @property
+            def age(self):
+                """Return the age and count the access"""
+                self.reads += 1
+                return 30
+
+        obj = Counted()
+        shared = Filter("age", "lt", 20)
+        query = Query([shared, Filter("age", "gt", 10)]) | Query(
+            [shared, Filter("age", "gt", 40)]
+        )
+        assert query.compile()(obj) is False
+        assert obj.reads == 1
+        assert query.evaluate(obj) is False
+        assert obj.reads == 3
+
 
 def describe_find_by():
     """Function to test the find_by() method of the ORMCollection class.
@@ -379,6 +616,51 @@ def describe_group_by():
         assert len(results) == len(expected_output)
         assert results == expected_output
 
+    def test_group_by_memoize(
+        my_orm_collection_group,
+    ):  # pylint: disable=unused-variable
+        calls = []
+
+        def by_name(obj):
+            calls.append(obj)
+            return obj.name
+
+        results = my_orm_collection_group.group_by(
+            by_name, memoize=True, memo_key=lambda obj: obj.name
+        )
+        assert {name: len(group) for name, group in results.items()} == {
+            "Alice": 2,
+            "Bob": 1,
+            "Charlie": 2,
+            "Dave": 2,
+        }
+        assert len(calls) == 4
+
+    def test_group_by_memoize_records():  # pylint: disable=unused-variable
+        calls = []
+
+        def by_city(obj):
+            calls.append(obj)
+            return obj.addr.city
+
+        paris, lyon = {"city": "Paris"}, {"city": "Lyon"}
+        rows = [("A", paris), ("A", paris), ("B", lyon)]
+        for collection in (
+            OrmCollection.from_records(rows, schema=["name", "addr"]),
+            OrmCollection.from_records(
+                [dict(zip(["name", "addr"], row)) for row in rows], compact=True
+            ),
+        ):
+            calls.clear()
+            results = collection.group_by(by_city, memoize=True)
+            assert {city: len(group) for city, group in results.items()} == {
+                "Paris": 2,
+                "Lyon": 1,
+            }
+            assert len(calls) == 2
+            assert collection.map(by_city, memoize=True) == ["Paris", "Paris", "Lyon"]
+            assert len(calls) == 4
+
 
 def describe_order_by():
     """Function to test the order_by(() method of the ORMCollection class.
@@ -467,6 +749,17 @@ def describe_order_by():
         ordered_lst = lst.order_by(key_func)
         assert ordered_lst == expected_output
 
+    def test_order_by_memoize():  # pylint: disable=unused-variable
+        calls = []
+
+        def key_func(value):
+            calls.append(value)
+            return -value
+
+        lst = OrmCollection([3, 1, 3, 2, 1])
+        assert lst.order_by(key_func, memoize=True) == [3, 3, 2, 1, 1]
+        assert calls == [3, 1, 2]
+
 
 def describe_all_offset_limit():
     """Function to test the all(), limit() and offset() methods of the ORMCollection class.
@@ -575,3 +868,88 @@ def describe_destinct():
         # Test with missing argument
         with pytest.raises(ValueError):
             my_orm_collection_group.distinct()
+
+
+def describe_projection():
+    """Function to test the values_list(), only() and select() methods of the ORMCollection class."""
+
+    @pytest.mark.parametrize(
+        "fields, flat, expected",
+        [
+            pytest.param(
+                ("name", "age"),
+                False,
+                [("Alice", 25), ("Bob", 40), ("Charlie", 30), ("Dave", 30)],
+                id="tuples",
+            ),
+            pytest.param(
+                ("name",),
+                False,
+                [("Alice",), ("Bob",), ("Charlie",), ("Dave",)],
+                id="one",
+            ),
+            pytest.param(("age",), True, [25, 40, 30, 30], id="flat"),
+        ],
+    )
+    def test_values_list(
+        my_orm_collection, fields, flat, expected
+    ):  # pylint: disable=unused-variable
+        values = my_orm_collection.values_list(*fields, flat=flat)
+        assert isinstance(values, ImprovedList)
+        assert values == expected
+
+    def test_values_list_path():  # pylint: disable=unused-variable
+        collection = OrmCollection([{"name": "Alice", "address": {"city": "Paris"}}])
+        assert collection.values_list("name", "address.city") == [("Alice", "Paris")]
+
+    @pytest.mark.parametrize(
+        "fields, flat, expected",
+        [
+            pytest.param((), False, pytest.raises(ValueError), id="no_field"),
+            pytest.param(("name", "age"), True, pytest.raises(ValueError), id="flat"),
+            pytest.param(
+                ("missing",), False, pytest.raises(AttributeError), id="missing"
+            ),
+        ],
+    )
+    def test_values_list_errors(
+        my_orm_collection, fields, flat, expected
+    ):  # pylint: disable=unused-variable
+        with expected:
+            my_orm_collection.values_list(*fields, flat=flat)
+
+    def test_only(my_orm_collection):  # pylint: disable=unused-variable
+        people = my_orm_collection.only("name", "age")
+        assert isinstance(people, OrmCollection)
+        assert all(isinstance(person, Record) for person in people)
+        assert people[0].to_dict() == {"name": "Alice", "age": 25}
+        assert people.where(age=30).map(".name") == ["Charlie", "Dave"]
+        with pytest.raises(ValueError):
+            my_orm_collection.only()
+
+    def test_only_path():  # pylint: disable=unused-variable
+        collection = OrmCollection([{"address": {"city": "Paris"}}])
+        assert collection.only("address.city")[0].address_city == "Paris"
+
+    def test_select(my_orm_collection):  # pylint: disable=unused-variable
+        people = my_orm_collection.select(["age", "name"])
+        assert people[1] == {"age": 40, "name": "Bob"}
+        assert list(people[1]) == ["age", "name"]
+        assert isinstance(people[1], ObjDict)
+        assert people == [
+            person.select(["age", "name"]) for person in my_orm_collection
+        ]
+
+    @pytest.mark.parametrize(
+        "wanted_keys, expected",
+        [
+            pytest.param(["missing"], pytest.raises(KeyError), id="missing"),
+            pytest.param("name", pytest.raises(TypeError), id="not_a_list"),
+            pytest.param(["name", 1], pytest.raises(TypeError), id="not_a_string"),
+        ],
+    )
+    def test_select_errors(
+        my_orm_collection, wanted_keys, expected
+    ):  # pylint: disable=unused-variable
+        with expected:
+            my_orm_collection.select(wanted_keys)
@@ -0,0 +1,155 @@
+"""
+Module test_serializer.py - Test suite for the serializer module.
+
+This module contains unit tests for the serialization of ObjDict and OrmCollection objects.
+
+Functions:
+
+  describe_to_plain(): Function to test the conversion to plain dictionaries and lists.
+  describe_to_json(): Function to test the JSON encoding.
+
+To run the tests, simply execute this module as a script, e.g.,
+with the command `python -m pytest test_serializer.py`.
+The tests will be discovered and run automatically by the Pytest testing framework.
+"""
+import io
+import json
+import pytest
+from imobject import FrozenObjDict, ImprovedList, ObjDict, OrmCollection, record_class
+from imobject.serializer import to_json, to_plain
+
+
+def describe_to_plain():
+    """Function to test the conversion to plain dictionaries and lists."""
+
+    def test_nested_values():  # pylint: disable=unused-variable
+        obj = ObjDict(
+            {
+                "people": OrmCollection([{"name": "Alice", "tags": ImprovedList([1])}]),
+                "config": {"debug": ObjDict({"level": 1})},
+                "point": (1, 2),
+            }
+        )
+        result = obj.to_dict()
+        assert result == {
+            "people": [{"name": "Alice", "tags": [1]}],
+            "config": {"debug": {"level": 1}},
+            "point": (1, 2),
+        }
+        assert type(result["people"]) is list
+        assert type(result["people"][0]) is dict
+        assert type(result["people"][0]["tags"]) is list
+        assert type(result["config"]["debug"]) is dict
+
+    def test_tuples_and_records():  # pylint: disable=unused-variable
+        point = record_class(["x", "tags"], name="Point")
+        record = point(1, ImprovedList([ObjDict({"a": 1})]))
+        result = to_plain(
+            ObjDict({"pair": (ObjDict({"b": [2]}), ((ObjDict(),),)), "point": record})
+        )
+        assert result == {
+            "pair": ({"b": [2]}, (({},),)),
+            "point": {"x": 1, "tags": [{"a": 1}]},
+        }
+        assert type(result["pair"][0]) is dict
+        assert type(result["pair"][1][0][0]) is dict
+        assert type(result["point"]) is dict
+        assert type(result["point"]["tags"]) is list
+        assert type(result["point"]["tags"][0]) is dict
+
+    def test_copy_is_deep():  # pylint: disable=unused-variable
+        obj = ObjDict({"people": [{"name": "Alice"}]})
+        copy = obj.copy()
+        copy.people[0].name = "Bob"
+        assert obj.people[0].name == "Alice"
+
+    def test_deep_tree():  # pylint: disable=unused-variable
+        obj = tree = ObjDict()
+        for _ in range(5000):
+            dict.__setitem__(tree, "child", ObjDict())
+            tree = dict.__getitem__(tree, "child")
+        result = obj.to_dict()
+        depth = 0
+        while result:
+            result = result["child"]
+            depth += 1
+        assert depth == 5000
+
+    def test_shared_references():  # pylint: disable=unused-variable
+        shared = ObjDict({"a": [1, 2]})
+        result = to_plain(ObjDict({"x": shared, "y": [shared, shared]}))
+        assert result["x"] is result["y"][0] is result["y"][1]
+
+    def test_cycle():  # pylint: disable=unused-variable
+        obj = ObjDict({"a": 1})
+        dict.__setitem__(obj, "self", obj)
+        result = obj.to_dict()
+        assert result["self"] is result
+        assert type(result) is dict
+
+    def test_scalars():  # pylint: disable=unused-variable
+        assert to_plain(1) == 1
+        assert to_plain(OrmCollection([1, "a", None])) == [1, "a", None]
+
+
+def describe_to_json():
+    """Function to test the JSON encoding."""
+
+    @pytest.fixture
+    def obj():
+        return ObjDict({"people": [{"name": "Alice", "tags": ["a"]}], "count": 1})
+
+    def test_to_json(obj):  # pylint: disable=unused-variable
+        assert json.loads(obj.to_json()) == obj.to_dict()
+        assert obj.to_json(sort_keys=True).startswith('{"count": 1')
+        assert OrmCollection([{"a": 1}]).to_json() == '[{"a": 1}]'
+
+    def test_to_json_file(obj):  # pylint: disable=unused-variable
+        stream = io.StringIO()
+        assert obj.to_json(stream) is None
+        assert stream.getvalue() == obj.to_json()
+
+    def test_to_json_reads_raw_values():  # pylint: disable=unused-variable
+        obj = ObjDict({"a": {"b": [{"c": 1}]}, "d": [1, [2]]})
+        assert json.loads(obj.to_json()) == {"a": {"b": [{"c": 1}]}, "d": [1, [2]]}
+        assert type(dict.__getitem__(obj, "a")) is dict
+        assert type(dict.__getitem__(obj, "d")) is list
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            pytest.param({"indent": 2}, id="indent"),
+            pytest.param({"indent": "\t", "sort_keys": True}, id="sort_keys"),
+            pytest.param({"separators": (",", ":")}, id="separators"),
+            pytest.param({"ensure_ascii": False}, id="ensure_ascii"),
+        ],
+    )
+    def test_to_json_options(options):  # pylint: disable=unused-variable
+        data = {"b": [1, {"c": "é"}, []], "a": {}, "1": (2.5, None, [{"d": True}])}
+        expected = json.dumps(data, **options)
+        assert ObjDict(data).to_json(**options) == expected
+        assert to_json(OrmCollection([data] * 3), **options) == json.dumps(
+            [data] * 3, **options
+        )
+
+    def test_records():  # pylint: disable=unused-variable
+        person = record_class(["name", "age"], "Person")
+        people = OrmCollection([person("Alice", 25), {"name": "Bob", "age": 40}])
+        assert json.loads(people.to_json()) == [
+            {"name": "Alice", "age": 25},
+            {"name": "Bob", "age": 40},
+        ]
+        frozen = FrozenObjDict({"a": [1]})
+        assert ObjDict({"frozen": frozen}).to_json() == '{"frozen": {"a": [1]}}'
+
+    def test_default():  # pylint: disable=unused-variable
+        obj = ObjDict({"tags": {"a"}})
+        with pytest.raises(TypeError, match="Object of type set is not"):
+            obj.to_json()
+        assert obj.to_json(default=sorted) == '{"tags": ["a"]}'
+
+    def test_cycle():  # pylint: disable=unused-variable
+        obj = ObjDict({"a": 1})
+        dict.__setitem__(obj, "self", obj)
+        with pytest.raises(ValueError):
+            obj.to_json()
@@ -0,0 +1,86 @@
+"""
+Module test_sharded_collection.py - Test suite for the ShardedOrmCollection module.
+
+This module contains unit tests for the ShardedOrmCollection implementation.
+
+Functions:
+
+  describe_sharded_collection(): Function to test the where(), count() and aggregate()
+                                 methods of ShardedOrmCollection class.
+
+To run the tests, simply execute this module as a script, e.g.,
+with the command `python -m pytest test_sharded_collection.py`.
+The tests will be discovered and run automatically by the Pytest testing framework.
+"""
+import multiprocessing
+import os
+import pytest
+from imobject import BloomFilter, Filter, Query, ShardedOrmCollection
+
+
+def sum_ages(collection):
+    """Return the sum of the ages of a collection (module level to be picklable)"""
+    return sum(collection.map(".age"))
+
+
+def describe_sharded_collection():
+    """Function to test all functions for ShardedOrmCollection class."""
+
+    @pytest.fixture
+    def sharded(my_orm_collection_group):
+        with ShardedOrmCollection(my_orm_collection_group, key="name", shards=3) as coll:
+            yield coll
+
+    def test_where(sharded):  # pylint: disable=unused-variable
+        results = sharded.where(age__gte=31)
+        assert {(result.name, result.age) for result in results} == {
+            ("Alice", 80),
+            ("Bob", 40),
+            ("Dave", 31),
+        }
+
+    def test_count(sharded):  # pylint: disable=unused-variable
+        assert len(sharded) == 7
+        assert sharded.count() == 7
+        assert sharded.count(name="Charlie") == 2
+
+    def test_aggregate(sharded):  # pylint: disable=unused-variable
+        assert sharded.aggregate(sum_ages) == 266
+        assert sharded.aggregate(sum_ages, gender="female") == 25
+        assert sharded.aggregate(len, combine=max) >= 3
+
+    def test_where_membership(sharded):  # pylint: disable=unused-variable
+        query = Query([Filter("age", "in", [31, 40, 15])])
+        assert {result.name for result in sharded.where(query)} == {"Bob", "Dave"}
+        ages = (age for age in [31, 40])
+        assert sharded.count(age__nin=ages) == 5
+        trusted = Query([Filter("age", "gte", 40, trusted=True)])
+        assert sharded.count(trusted) == 2
+
+    def test_bloom_filter_spawn(my_orm_collection_group):  # pylint: disable=unused-variable
+        # Les workers "spawn" ont leur propre graine de hachage
+        context = multiprocessing.get_context("spawn")
+        names = ["Alice", "Dave"]
+        bloom = BloomFilter(names, capacity=100, error_rate=1e-6)
+        with ShardedOrmCollection(
+            my_orm_collection_group, key="name", shards=2, context=context
+        ) as coll:
+            assert coll.count(name__in=bloom) == coll.count(name__in=set(names)) == 4
+            assert coll.count(name__nin=bloom) == 3
+
+    def test_close_in_forked_process(sharded):  # pylint: disable=unused-variable
+        if not hasattr(os, "fork"):
+            pytest.skip("fork is not available")
+        pid = os.fork()
+        if pid == 0:
+            sharded.close()
+            os._exit(0)  # pylint: disable=protected-access
+        os.waitpid(pid, 0)
+        assert sharded.count() == 7
+
+    def test_errors(sharded):  # pylint: disable=unused-variable
+        with pytest.raises(TypeError):
+            sharded.where(age__gt="25")
+        sharded.close()
+        with pytest.raises(ValueError):
+            sharded.count()